@@ -32,12 +32,20 @@ class ContractionPath:
     
     Attributes:
         R (list): The RDLT containing arcs and its attributes.
-        violations (list): List of violating arcs.
+        violations (list): Distinct violating arc strings, in the order they were reported.
         graph (dict): A dictionary representation of the graph (R1 and/or R2).
         contraction_paths (dict): Dictionary mapping violation arcs to their contraction paths.
         arc_pairs (dict): Dictionary mapping arc endpoint pairs to arc strings.
+        arc_endpoints (dict): Dictionary mapping arc strings to their (start, end) endpoint pairs.
+        indexed_R (list): The RDLT that arc_index was built from.
+        arc_index (tuple): Arc lookup tables used by can_contract and get_outgoing_arcs.
     """
     
+    __slots__ = (
+        'R', 'violations', 'graph', 'contraction_paths', 'arc_pairs', 'arc_endpoints',
+        'indexed_R', 'arc_index',
+    )
+    
     def __init__(self, R, violations):
         """
         Initializes the contraction path algorithm.
@@ -48,12 +56,16 @@ class ContractionPath:
         """
         self.R = R
         
-        # Convert violations to a list of arc strings if they are dictionaries
-        self.violations = [v['arc'] if isinstance(v, dict) else v for v in violations]
+        # Normalize violations once into their arc strings; an arc reported by several
+        # checks is only listed once, since its contraction path does not depend on them
+        self.violations = list(dict.fromkeys(v['arc'] if isinstance(v, dict) else v for v in violations))
         
         self.graph = utils.build_graph(R)
         self.contraction_paths = {}  # Store the contraction paths for each violation
         self.arc_pairs = {}
+        self.arc_endpoints = {}
+        self.indexed_R = None
+        self.arc_index = None
         
         for arc_data in R:
             arc = arc_data['arc']
@@ -63,6 +75,7 @@ class ContractionPath:
                 if pair not in self.arc_pairs:
                     self.arc_pairs[pair] = []
                 self.arc_pairs[pair].append(arc)
+                self.arc_endpoints[arc] = pair
             except ValueError:
                 print(f"Invalid arc format: {arc}")
                 
@@ -83,12 +96,50 @@ class ContractionPath:
         Returns:
             list: A list of arc dictionaries that start from the given vertex.
         """
-        outgoing_arcs = []
-        for arc_data in R:
-            start, end = arc_data['arc'].split(', ')
-            if start == vertex:
-                outgoing_arcs.append(arc_data)
-        return outgoing_arcs
+        _, _, outgoing_by_vertex, _ = self.index_arcs(R)
+        return list(outgoing_by_vertex.get(vertex, []))
+
+    def index_arcs(self, R):
+        """
+        Indexes the arcs of R by arc string, by end vertex and by start vertex.
+        
+        The index only depends on R, so it is built once and reused for every
+        contractibility check and outgoing-arc lookup made against the same RDLT.
+        
+        Parameters:
+            R (list): The RDLT containing arcs and its attributes.
+            
+        Returns:
+            tuple: A tuple (arcs_by_name, incoming_by_vertex, outgoing_by_vertex,
+                   sigma_incoming_by_vertex) where:
+                - arcs_by_name (dict): Maps each arc string to its first arc dictionary in R.
+                - incoming_by_vertex (dict): Maps each vertex to the arc dictionaries ending at it.
+                - outgoing_by_vertex (dict): Maps each vertex to the arc dictionaries starting at it.
+                - sigma_incoming_by_vertex (dict): Maps each vertex to (c-attribute, arc) tuples
+                  for the arcs ending at it whose c-attribute is not '0'.
+        """
+        if self.indexed_R is not R:
+            arcs_by_name = {}
+            incoming_by_vertex = {}
+            outgoing_by_vertex = {}
+            sigma_incoming_by_vertex = {}
+            for arc_data in R:
+                arcs_by_name.setdefault(arc_data['arc'], arc_data)
+                try:
+                    start, end = arc_data['arc'].split(', ')
+                except ValueError:
+                    continue
+                incoming_by_vertex.setdefault(end, []).append(arc_data)
+                outgoing_by_vertex.setdefault(start, []).append(arc_data)
+                c_attribute = arc_data.get('c-attribute', '0')
+                if c_attribute != '0':
+                    sigma_incoming_by_vertex.setdefault(end, []).append((c_attribute, arc_data['arc']))
+            
+            self.indexed_R = R
+            self.arc_index = (arcs_by_name, incoming_by_vertex, outgoing_by_vertex,
+                              sigma_incoming_by_vertex)
+        
+        return self.arc_index
 
     def can_contract(self, arc, superset, R):
         """
@@ -113,33 +164,40 @@ class ContractionPath:
         except ValueError:
             return False, "Invalid arc format"
 
-        arc_data = next((a for a in R if a['arc'] == arc), None)
+        arcs_by_name, incoming_by_vertex, _, sigma_incoming_by_vertex = self.index_arcs(R)
+
+        arc_data = arcs_by_name.get(arc)
         if not arc_data:
             return False, "Arc not found in RDLT"
 
         # Get all incoming arcs to the end vertex
-        incoming_arcs = [a for a in R if a['arc'].endswith(f", {end}")]
+        incoming_arcs = incoming_by_vertex.get(end, [])
 
         # If there is only one incoming arc (the current arc), it can be contracted
         if len(incoming_arcs) == 1 and incoming_arcs[0]['arc'] == arc:
             return True, None
 
-        # Collect conflicting c-attributes
+        # Collect conflicting c-attributes; epsilon ('0') arcs never conflict, so only
+        # the pre-filtered sigma arcs are checked
         conflicting_c_attributes = set()
         conflicting_arcs = []
-        for incoming_arc in incoming_arcs:
-            incoming_c_attribute = incoming_arc.get('c-attribute', '0')
-            
-            if incoming_c_attribute != '0' and incoming_c_attribute not in superset:
+        for incoming_c_attribute, incoming_arc_str in sigma_incoming_by_vertex.get(end, ()):
+            if incoming_c_attribute not in superset:
                 conflicting_c_attributes.add(incoming_c_attribute)
-                conflicting_arcs.append(incoming_arc['arc'])
+                conflicting_arcs.append(incoming_arc_str)
 
         if conflicting_c_attributes:
-            # Find the violating arcs that are causing the conflict
+            # Find the violating arcs that are causing the conflict, bucketing the
+            # conflicting arcs by c-attribute in one pass instead of rescanning them
+            # once per conflicting c-attribute
+            arcs_by_c_attribute = {}
+            for conflicting_arc in conflicting_arcs:
+                c_attribute = arcs_by_name.get(conflicting_arc, {}).get('c-attribute', '0')
+                arcs_by_c_attribute.setdefault(c_attribute, []).append(conflicting_arc)
+            
             violating_arcs = []
             for c_attribute in conflicting_c_attributes:
-                violating_arcs.extend([arc for arc in conflicting_arcs if 
-                                      next((a for a in R if a['arc'] == arc), {}).get('c-attribute', '0') == c_attribute])
+                violating_arcs.extend(arcs_by_c_attribute.get(c_attribute, []))
             
             return False, f"Conflicting with violating arc: {', '.join(violating_arcs)}"
 
@@ -149,6 +207,9 @@ class ContractionPath:
         """
         Gets the r-id for a given arc string.
         
+        The first arc of R with the given arc string is looked up in the arc index
+        instead of scanning R.
+        
         Parameters:
             arc_str (str): The arc string to find the r-id for.
             R (list): The RDLT containing arcs and its attributes.
@@ -156,10 +217,11 @@ class ContractionPath:
         Returns:
             str or None: The r-id associated with the arc if found, None otherwise.
         """
-        for arc_data in R:
-            if arc_data['arc'] == arc_str:
-                return arc_data.get('r-id')
-        return None
+        arcs_by_name = self.index_arcs(R)[0]
+        arc_data = arcs_by_name.get(arc_str)
+        if arc_data is None:
+            return None
+        return arc_data.get('r-id')
 
     def contract_paths_for_violation(self, violation_arc, R_copy):
         """
@@ -209,26 +271,35 @@ class ContractionPath:
         # Unreached arcs
         unreached_arcs = set(arc['arc'] for arc in R_copy)
         
+        # Bind the lookups used on every iteration to locals
+        get_outgoing_arcs = self.get_outgoing_arcs
+        check_contraction = self.can_contract
+        get_rid_from_arc = self.get_rid_from_arc
+        arc_pairs = self.arc_pairs
+        arc_endpoints = self.arc_endpoints
+        
+        # Per-iteration containers, cleared at the top of each iteration
+        contracted_in_iteration = set()
+        candidate_arcs = []
+        
         # Iterate until all arcs are processed or no further contractions are possible
         while reached_vertices and superset_updated:
-            contracted_in_iteration = set()
+            contracted_in_iteration.clear()
             
             # Reset the superset_updated flag at the start of each iteration
             superset_updated = False
 
             # Find all outgoing arcs of reached vertices
-            candidate_arcs = []
+            candidate_arcs.clear()
             for vertex in reached_vertices:
-                for arc_data in self.get_outgoing_arcs(vertex, R_copy):
+                for arc_data in get_outgoing_arcs(vertex, R_copy):
                     arc_str = arc_data['arc']
-                    try:
-                        start, end = arc_str.split(', ')
-                        pair = (start, end)
-                        # Only consider if not already contracted
-                        if pair not in contracted_arc_pairs and arc_str in unreached_arcs:
-                            candidate_arcs.append(arc_str)
-                    except ValueError:
-                        print(f"Invalid arc format: {arc_str}")
+                    # Outgoing arcs are indexed from well-formed arcs only, so their
+                    # endpoints were already parsed
+                    pair = arc_endpoints[arc_str]
+                    # Only consider if not already contracted
+                    if pair not in contracted_arc_pairs and arc_str in unreached_arcs:
+                        candidate_arcs.append(arc_str)
                     
             if not candidate_arcs:
                 break
@@ -237,15 +308,15 @@ class ContractionPath:
             for arc in candidate_arcs:
                 # Check if an identical arc has already been contracted
                 try:
-                    start, end = arc.split(', ')
-                    pair = (start, end)
+                    pair = arc_endpoints[arc]
+                    end = pair[1]
                     if pair in contracted_arc_pairs:
                         continue
                         
-                    can_contract, failure_reason = self.can_contract(arc, current_superset, R_copy)
+                    can_contract, failure_reason = check_contraction(arc, current_superset, R_copy)
                     if can_contract:
                         # Get r-id for the arc
-                        r_id = self.get_rid_from_arc(arc, R_copy)
+                        r_id = get_rid_from_arc(arc, R_copy)
                         
                         # Contract the arc
                         contracted_in_iteration.add(arc)
@@ -258,7 +329,7 @@ class ContractionPath:
                         })
                         
                         # Remove all instances of this arc from unreached_arcs
-                        for duplicate_arc in self.arc_pairs.get(pair, []):
+                        for duplicate_arc in arc_pairs.get(pair, []):
                             unreached_arcs.discard(duplicate_arc)
                         
                         # Update the dummy vertex
@@ -268,7 +339,7 @@ class ContractionPath:
                         reached_vertices.add(end)
 
                         # Update superset with c-attributes of outgoing arcs
-                        for outgoing_arc in self.get_outgoing_arcs(end, R_copy):
+                        for outgoing_arc in get_outgoing_arcs(end, R_copy):
                             c_attr = outgoing_arc.get('c-attribute', '0')
                             if c_attr not in current_superset:
                                 current_superset.add(c_attr)
@@ -281,7 +352,7 @@ class ContractionPath:
                         contracted_path.append(arc)
                     else:
                         # Get r-id for the arc
-                        r_id = self.get_rid_from_arc(arc, R_copy)
+                        r_id = get_rid_from_arc(arc, R_copy)
                         
                         # Store the failed contraction with r-id and failure reason
                         failed_contractions.append({
@@ -302,17 +373,17 @@ class ContractionPath:
                 retry_success = False
                 for arc in retry_candidates:
                     try:
-                        start, end = arc.split(', ')
-                        pair = (start, end)
+                        pair = arc_endpoints[arc]
+                        end = pair[1]
                         
                         # Skip if already contracted
                         if pair in contracted_arc_pairs:
                             continue
                             
-                        can_contract, failure_reason = self.can_contract(arc, current_superset, R_copy)
+                        can_contract, failure_reason = check_contraction(arc, current_superset, R_copy)
                         if can_contract:
                             # Get r-id for the arc
-                            r_id = self.get_rid_from_arc(arc, R_copy)
+                            r_id = get_rid_from_arc(arc, R_copy)
                             
                             # Contract the arc
                             contracted_in_iteration.add(arc)
@@ -325,7 +396,7 @@ class ContractionPath:
                             })
                             
                             # Remove all instances of this arc
-                            for duplicate_arc in self.arc_pairs.get(pair, []):
+                            for duplicate_arc in arc_pairs.get(pair, []):
                                 unreached_arcs.discard(duplicate_arc)
                             
                             # Update the dummy vertex
@@ -335,7 +406,7 @@ class ContractionPath:
                             reached_vertices.add(end)
 
                             # Update superset with c-attributes of outgoing arcs
-                            for outgoing_arc in self.get_outgoing_arcs(end, R_copy):
+                            for outgoing_arc in get_outgoing_arcs(end, R_copy):
                                 c_attr = outgoing_arc.get('c-attribute', '0')
                                 if c_attr not in current_superset:
                                     current_superset.add(c_attr)
@@ -349,7 +420,7 @@ class ContractionPath:
                             contracted_path.append(arc)
                         else:
                             # Get r-id for the arc
-                            r_id = self.get_rid_from_arc(arc, R_copy)
+                            r_id = get_rid_from_arc(arc, R_copy)
                             
                             # Store the failed contraction with r-id and failure reason
                             failed_contractions.append({
@@ -372,8 +443,7 @@ class ContractionPath:
         unique_contracted_path = []
         seen_arc_pairs = set()
         for arc in contracted_path:
-            start, end = arc.split(', ')
-            pair = (start, end)
+            pair = arc_endpoints[arc]
             if pair not in seen_arc_pairs:
                 unique_contracted_path.append(arc)
                 seen_arc_pairs.add(pair)
@@ -408,7 +478,8 @@ class ContractionPath:
         """
         if isinstance(arc, str):
             # Handle string format like "a, b"
-            return f"({arc.split(', ')[0]}, {arc.split(', ')[1]})"
+            parts = arc.split(', ')
+            return f"({parts[0]}, {parts[1]})"
         elif isinstance(arc, (tuple, list)) and len(arc) == 2:
             # Handle tuple or list format
             return f"({arc[0]}, {arc[1]})"
@@ -437,20 +508,23 @@ class ContractionPath:
         - Unreached arcs in the contraction
         """
         print("\n--- Contraction Paths for Violations ---")
+        
+        # The arcs of R are the same for every violation, so collect them once
+        all_arcs = {arc_data['arc'] for arc_data in self.R}
+        
         for violation_arc, path_data in self.contraction_paths.items():
             print(f"\nViolating Arc: ({violation_arc})")
             
-            # Determine unreached arcs
-            all_arcs = {arc_data['arc'] for arc_data in self.R}
+            # Determine unreached arcs; the failed arcs are collected once and reused below
             contracted_arcs = set(path_data['contracted_path'])
-            failed_arcs = {failed['arc'] for failed in path_data['failed_contractions']}
+            failed_arcs = [failed['arc'] for failed in path_data['failed_contractions']]
             
-            unreached_arcs = all_arcs - contracted_arcs - failed_arcs
+            unreached_arcs = all_arcs - contracted_arcs - set(failed_arcs)
             
             # Conditionally print sections
             if path_data['contracted_path']:
                 print("Contracted Path:")
-                contracted_tuples = [tuple(arc.split(', ')) for arc in path_data['contracted_path']]
+                contracted_tuples = [self.arc_endpoints[arc] for arc in path_data['contracted_path']]
                 print(self.convert_arc_list_format(contracted_tuples))
             
             # if path_data['successful_contractions']:
@@ -458,9 +532,8 @@ class ContractionPath:
             #     successful_arcs = [contract['arc'] for contract in path_data['successful_contractions']]
             #     print(self.convert_arc_list_format(successful_arcs))
             
-            if path_data['failed_contractions']:
+            if failed_arcs:
                 print("\nFailed Contractions:")
-                failed_arcs = [failed['arc'] for failed in path_data['failed_contractions']]
                 print(self.convert_arc_list_format(failed_arcs))
             
             if unreached_arcs:
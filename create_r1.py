@@ -128,6 +128,9 @@ def ProcessR1(arcs_list, R1, Centers_list, In_list, Out_list, R2):
     cycle_R1 = cycle_instance.evaluate_cycle()  # Call the method on the instance
 
     if cycle_R1:
+        # Index R1 once so each cycle arc is found by dict lookups rather than scans of R1
+        arc_index, rid_index = utils.build_arc_indexes(R1)
+
         # Iterate over each cycle
         for cycle_data in cycle_R1:
             cycle_arcs = cycle_data['cycle']
@@ -141,13 +144,14 @@ def ProcessR1(arcs_list, R1, Centers_list, In_list, Out_list, R2):
                 arc_name = arc_name.strip()
 
                 # Get the actual arc from R1 using r-id
-                actual_arc = utils.get_arc_from_rid(r_id, R1)
+                rid_arc = rid_index.get(r_id)
+                actual_arc = rid_arc['arc'] if rid_arc else None
 
                 if actual_arc:
                     # print(f"Processing arc: {actual_arc}")
 
                     # Check if l-attribute exists and process it
-                    matching_arc = next((r for r in R1 if r['arc'] == actual_arc), None)
+                    matching_arc = arc_index.get(actual_arc)
                     if matching_arc:
                         l_attribute = matching_arc.get('l-attribute', None)
                         if l_attribute is not None:
@@ -171,11 +175,12 @@ def ProcessR1(arcs_list, R1, Centers_list, In_list, Out_list, R2):
                     arc_name = arc_name.strip()
 
                     # Get the actual arc from R1 using r-id
-                    actual_arc = utils.get_arc_from_rid(r_id, R1)
+                    rid_arc = rid_index.get(r_id)
+                    actual_arc = rid_arc['arc'] if rid_arc else None
 
                     if actual_arc:
                         # Find the matching arc in R1
-                        matching_arc = next((r for r in R1 if r['arc'] == actual_arc), None)
+                        matching_arc = arc_index.get(actual_arc)
 
                         if matching_arc:
                             # Check if the arc is an abstract arc
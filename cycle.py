@@ -16,6 +16,7 @@ the R1 and R2 processing modules to calculate eRU values.
 
 """
 
+
 class Cycle:
     def __init__(self, R):
         """
@@ -313,9 +314,9 @@ class Cycle:
             if not cycle_in_r_format:
                 continue
             
-            # Extract vertices and build a cycle graph for connectivity analysis
+            # Extract vertices and record the predecessors of each vertex for connectivity analysis
             cycle_vertices = set()
-            cycle_graph = {}
+            reverse_cycle_graph = {}  # Predecessors of each vertex in the cycle
             vertex_to_arcs = {}  # Map vertices to their arcs in this cycle
             
             for arc in cycle_in_r_format:
@@ -327,10 +328,8 @@ class Cycle:
                     cycle_vertices.add(start)
                     cycle_vertices.add(end)
                     
-                    # Add to cycle graph
-                    if start not in cycle_graph:
-                        cycle_graph[start] = set()
-                    cycle_graph[start].add(end)
+                    # Add to the cycle's predecessor lists
+                    reverse_cycle_graph.setdefault(end, set()).add(start)
                     
                     # Map vertex to arc
                     if start not in vertex_to_arcs:
@@ -358,15 +357,13 @@ class Cycle:
                     # Only add if it forms a connected path
                     if r_arc and source in cycle_vertices:
                         # Check if there's a path from any other vertex in the cycle to this source
-                        # This ensures we're not adding disconnected arcs
-                        for start_vertex in cycle_vertices:
-                            if start_vertex != source and self.is_connected(cycle_graph, start_vertex, source):
-                                consolidated_cycle.append(r_arc.copy())
-                                # Update cycle graph with this new connection
-                                if source not in cycle_graph:
-                                    cycle_graph[source] = set()
-                                cycle_graph[source].add(join_point)
-                                break
+                        # This ensures we're not adding disconnected arcs. Such a path ends with an
+                        # arc into source from another vertex, so checking the direct predecessors
+                        # answers this without searching the whole cycle graph
+                        if any(predecessor != source for predecessor in reverse_cycle_graph.get(source, ())):
+                            consolidated_cycle.append(r_arc.copy())
+                            # Record this new connection for the checks of later sources
+                            reverse_cycle_graph.setdefault(join_point, set()).add(source)
             
             # Find the minimum l-attribute in this cycle
             l_values = []
@@ -412,42 +409,6 @@ class Cycle:
         
         return self.Cycle_List
 
-    def is_connected(self, graph, start, end):
-        """
-        Checks if there is a path from start to end in the RDLT.
-        
-        Parameters:
-            graph (dict): The graph represented as an adjacency list
-            start (str): The start vertex
-            end (str): The end vertex
-        
-        Returns:
-            bool: True if there is a path from start to end, False otherwise
-        """
-        # Simple BFS to check connectivity
-        if start == end:
-            return True
-            
-        visited = set()
-        queue = [start]
-        
-        while queue:
-            current = queue.pop(0)
-            
-            if current == end:
-                return True
-                
-            if current in visited:
-                continue
-                
-            visited.add(current)
-            
-            for neighbor in graph.get(current, set()):
-                if neighbor not in visited:
-                    queue.append(neighbor)
-                    
-        return False
-
     def evaluate_cycle(self):
         """
         Evaluates cycles in the RDLT and formats them for output.
@@ -74,6 +74,7 @@ This application automates the evaluation of an RDLT to determine its Classical
 
 4. Clear or Export Results:
    • Click "Clear Output" to clear the output text area
+   • Processing a new file clears the previous results; click "Restore Previous" to bring them back
    • Click "Export Results" to save the results to a text file
 
 File Format Requirements:
@@ -45,6 +45,9 @@ class Input_RDLT:
         Out_list (list): List of OUT components extracted from the RDLT file.
         Arcs_List (list): List of arcs (edges) extracted from the RDLT file.
         Vertices_List (list): List of unique vertices extracted from the arcs.
+        Formatted_Arcs_List (list): Arcs in the "(vertex1, vertex2)" display format.
+        Formatted_In_list (list): IN components in the "(vertex1, vertex2)" display format.
+        Formatted_Out_list (list): OUT components in the "(vertex1, vertex2)" display format.
         C_attribute_list (list): List of c-attributes associated with the arcs.
         L_attribute_list (list): List of l-attributes associated with the arcs.
         user_input_to_evsa (list): Processed RDLT data structured for EVSA.
@@ -85,6 +88,9 @@ class Input_RDLT:
         self.Out_list = [line.strip() for line in self.contents['OUT'] if line.strip()]
         self.Arcs_List = []
         self.Vertices_List = []
+        self.Formatted_Arcs_List = []
+        self.Formatted_In_list = []
+        self.Formatted_Out_list = []
         self.C_attribute_list = []
         self.L_attribute_list = []
         self.user_input_to_evsa = []
@@ -201,10 +207,17 @@ class Input_RDLT:
             """
             return [convert_arc_format(arc) for arc in arc_list]
 
+        # Format the arcs and IN/OUT components once, for this summary and for exports
+        # (IN/OUT components are only shown when there are centers)
+        self.Formatted_Arcs_List = convert_arc_list_format(self.Arcs_List)
+        if self.Centers_list:
+            self.Formatted_In_list = convert_arc_list_format(self.In_list)
+            self.Formatted_Out_list = convert_arc_list_format(self.Out_list)
+
         # Print the extracted data for debugging
         print(f"\nInput RDLT: ")
         print('-' * 20)
-        print(f"Arcs List ({len(self.Arcs_List)}): ", convert_arc_list_format(self.Arcs_List))
+        print(f"Arcs List ({len(self.Arcs_List)}): ", self.Formatted_Arcs_List)
         print(f"Vertices List ({len(self.Vertices_List)}): ", self.Vertices_List)
         print(f"C-attribute List ({len(self.C_attribute_list)}): ", self.C_attribute_list)
         print(f"L-attribute List ({len(self.L_attribute_list)}): ", self.L_attribute_list)
@@ -214,8 +227,8 @@ class Input_RDLT:
             print(f"RBS components:")
             print('-' * 20)
             print(f"Centers ({len(self.Centers_list)}): ", self.Centers_list)
-            print(f"In ({len(self.In_list)}): ", convert_arc_list_format(self.In_list))
-            print(f"Out ({len(self.Out_list)}): ", convert_arc_list_format(self.Out_list))
+            print(f"In ({len(self.In_list)}): ", self.Formatted_In_list)
+            print(f"Out ({len(self.Out_list)}): ", self.Formatted_Out_list)
         print('=' * 60)
 
         # Process the RDLT structure for R2, R3, etc., based on centers and arcs
@@ -332,6 +345,9 @@ class Input_RDLT:
         cycle_R1 = cycle_instance.evaluate_cycle()
 
         if cycle_R1:
+            # Index R1 once so each cycle arc is found by dict lookups rather than scans of R1
+            arc_index, rid_index = utils.build_arc_indexes(R1)
+
             # Iterate over each cycle
             for cycle_data in cycle_R1:
                 cycle_arcs = cycle_data['cycle']
@@ -343,11 +359,12 @@ class Input_RDLT:
                     arc_name = arc_name.strip()
 
                     # Get the actual arc from R1 using r-id
-                    actual_arc = utils.get_arc_from_rid(r_id, R1)
+                    rid_arc = rid_index.get(r_id)
+                    actual_arc = rid_arc['arc'] if rid_arc else None
 
                     if actual_arc:
                         # Find the matching arc in R1
-                        matching_arc = next((r for r in R1 if r['arc'] == actual_arc), None)
+                        matching_arc = arc_index.get(actual_arc)
                         if matching_arc:
                             l_attribute = matching_arc.get('l-attribute', None)
                             if l_attribute is not None:
@@ -369,11 +386,12 @@ class Input_RDLT:
                         arc_name = arc_name.strip()
 
                         # Get the actual arc from R1 using r-id
-                        actual_arc = utils.get_arc_from_rid(r_id, R1)
+                        rid_arc = rid_index.get(r_id)
+                        actual_arc = rid_arc['arc'] if rid_arc else None
 
                         if actual_arc:
                             # Find the matching arc in R1
-                            matching_arc = next((r for r in R1 if r['arc'] == actual_arc), None)
+                            matching_arc = arc_index.get(actual_arc)
                             if matching_arc:
                                 # Update eRU to the critical arc's 'ca' value
                                 matching_arc['eRU'] = ca
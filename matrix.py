@@ -16,6 +16,7 @@ The Matrix class serves as the central component for RDLT analysis, providing me
 and manipulate matrices that represent the structural properties.
 """
 
+from collections import Counter
 import numpy as np
 import utils
 
@@ -28,6 +29,7 @@ class Matrix:
             _R_: List of dictionaries, each containing arc data (arc, l-attribute, c-attribute, eRU).
             Cycle_List: List of cycle-related data including arcs and critical arcs.
             rdlt_structure: A matrix representation of the RDLT structure.
+            arcs_by_start_vertex: Rows of the RDLT structure grouped by their start vertex.
             matrix_operations: Placeholder for matrix operations (not used directly in the code).
             join_safe_violations: A list to store JOIN-safeness violations.
             loop_safe_violations: A list to store Loop-safeness violations.
@@ -60,6 +62,7 @@ class Matrix:
         self.In_List = In_List
         self.Out_List = Out_List
         self.rdlt_structure = None
+        self.arcs_by_start_vertex = None
         self.matrix_operations = None
         self.join_safe_violations = []
         self.loop_safe_violations = []
@@ -72,10 +75,8 @@ class Matrix:
         # Extract arcs and graph from the RDLT structure
         self.Arcs_list = [r['arc'] for r in R]
         # print(f"Arcs List: {self.Arcs_list}")  # Debug: Show the arcs
-        self.graph = utils.list_to_graph(self.Arcs_list)
-        
-        # Manually extract vertices
-        self._R_vertices = utils.extract_vertices(self.Arcs_list)
+        # Build the graph and extract the vertices from a single parse of the arcs
+        self.graph, self._R_vertices = utils.parse_arcs(self.Arcs_list)
         # print(f"Extracted Vertices: {self._R_vertices}")  # Debug: Show vertices
 
         self.source_vertices, self.target_vertices = utils.get_source_and_target_vertices(self._R_)
@@ -117,6 +118,7 @@ class Matrix:
 
         # Create the RDLT structure matrix based on the provided R data
         self.setRDLT_Structure()  # Creates the RDLT structure from the provided arcs and their attributes
+        self.arcs_by_start_vertex = self.group_arcs_by_start_vertex()
         
         # Extract dimensions for initializing matrices
         n, m = len(self._R_), len(self.rdlt_structure[0])  # Assuming RDLT structure is n x m
@@ -182,6 +184,24 @@ class Matrix:
         print('=' * 60)
         return matrix
 
+    def group_arcs_by_start_vertex(self):
+        """
+        Groups the rows of the RDLT structure by their start vertex.
+
+        The rows are shared with rdlt_structure, so the grouping stays valid as the
+        vector operations update them and only has to be built once.
+
+        Returns:
+            dict: A dictionary mapping each start vertex to its rows, in structure order.
+        """
+        start_vertex_to_arcs = {}
+        for arc_data in self.rdlt_structure:
+            start_vertex = arc_data[1]
+            if start_vertex not in start_vertex_to_arcs:
+                start_vertex_to_arcs[start_vertex] = []
+            start_vertex_to_arcs[start_vertex].append(arc_data)
+        return start_vertex_to_arcs
+
     def initialize_matrices(self, n, m):
         """
         Initializes the matrices used for storing various calculations such as cycle vector, out-cycle vector, and safeness vectors.
@@ -337,13 +357,8 @@ class Matrix:
             list: The updated arc with the new out-cycle and safeness values.
         """
         # Step 1: Out-Cycle Detection
-        # Group arcs by their start vertices (r[1])
-        start_vertex_to_arcs = {}
-        for arc_data in self.rdlt_structure:
-            start_vertex = arc_data[1]
-            if start_vertex not in start_vertex_to_arcs:
-                start_vertex_to_arcs[start_vertex] = []
-            start_vertex_to_arcs[start_vertex].append(arc_data)
+        # Arcs grouped by their start vertices (r[1]), built once with the structure
+        start_vertex_to_arcs = self.arcs_by_start_vertex
 
         # Step 2: Determine ocv for the current arc `r`
         ocv = 0  # Default value for arcs not in a cycle
@@ -637,6 +652,27 @@ class Matrix:
             
             return not violations_found
         
+        # The conditions and type of a join only depend on the c-attributes of its incoming
+        # arcs, so they are computed once per join and shared by the checks below
+        join_conditions_cache = {}
+        join_type_cache = {}
+
+        def get_join_conditions(join_vertex):
+            """Get the condition value of each incoming arc of a join vertex, keyed by arc."""
+            if join_vertex not in join_conditions_cache:
+                incoming_arcs = [f"{src}, {join_vertex}" for src in vertex_incoming.get(join_vertex, [])]
+                
+                # Get condition values for each incoming arc
+                arc_conditions = {}
+                for arc in incoming_arcs:
+                    for r in self.rdlt_structure:
+                        if r[0] == arc:  # r[0] is the arc identifier
+                            c_attribute = r[4]
+                            arc_conditions[arc] = c_attribute
+                            break
+                join_conditions_cache[join_vertex] = arc_conditions
+            return join_conditions_cache[join_vertex]
+
         def classify_join_type(join_vertex):
             """
             Classify a join vertex as AND-JOIN, MIX-JOIN, or OR-JOIN based on the c-attributes of incoming arcs.
@@ -647,17 +683,12 @@ class Matrix:
             Returns:
                 str: 'AND-JOIN', 'MIX-JOIN', or 'OR-JOIN'
             """
-            incoming_arcs = [f"{src}, {join_vertex}" for src in vertex_incoming.get(join_vertex, [])]
-            
-            # Get condition values for each incoming arc
-            arc_conditions = {}
-            for arc in incoming_arcs:
-                for r in self.rdlt_structure:
-                    if r[0] == arc:  # r[0] is the arc identifier
-                        c_attribute = r[4]
-                        arc_conditions[arc] = c_attribute
-                        break
-            
+            if join_vertex not in join_type_cache:
+                join_type_cache[join_vertex] = classify_join_conditions(get_join_conditions(join_vertex))
+            return join_type_cache[join_vertex]
+
+        def classify_join_conditions(arc_conditions):
+            """Classify a join from the condition values of its incoming arcs."""
             # Classify based on conditions
             epsilon_arcs = [arc for arc, cond in arc_conditions.items() if cond in ['ε', '0']]
             non_epsilon_arcs = [arc for arc, cond in arc_conditions.items() if cond not in ['ε', '0']]
@@ -684,16 +715,8 @@ class Matrix:
             """
             join_type = classify_join_type(join_vertex)
             
-            incoming_arcs = [f"{src}, {join_vertex}" for src in vertex_incoming.get(join_vertex, [])]
-            
             # Get condition values for each incoming arc
-            arc_conditions = {}
-            for arc in incoming_arcs:
-                for r in self.rdlt_structure:
-                    if r[0] == arc:
-                        c_attribute = r[4]
-                        arc_conditions[arc] = c_attribute
-                        break
+            arc_conditions = get_join_conditions(join_vertex)
             
             violations_found = False
             
@@ -737,7 +760,9 @@ class Matrix:
                 # All conditions should be identical
                 unique_conditions = set(arc_conditions.values())
                 if len(unique_conditions) > 1:
-                    reference_condition = max(arc_conditions.values(), key=list(arc_conditions.values()).count)
+                    # Most common condition, counted once; ties go to the first one seen
+                    condition_counts = Counter(arc_conditions.values())
+                    reference_condition = max(arc_conditions.values(), key=condition_counts.__getitem__)
                     for arc, condition in arc_conditions.items():
                         if condition != reference_condition:
                             mark_arc_unsafe(arc, "Different Conditions in OR-JOIN", {
@@ -777,7 +802,8 @@ class Matrix:
             
             # If we have more than one unique L-value, it's a violation
             if len(unique_l_values) > 1:
-                reference_l_value = max(l_values, key=l_values.count)  # Most common L-value
+                l_value_counts = Counter(l_values)
+                reference_l_value = max(l_values, key=l_value_counts.__getitem__)  # Most common L-value
                 violations_found = False
                 
                 for arc, l_value in arc_l_values.items():
@@ -945,10 +971,35 @@ class Matrix:
         Returns:
             bool: True if all elements are positive for the specified check, False otherwise.
         """
+        join_safe, loop_safe, safe_ca = self.check_safeness()
+
+        if check_type == 'join':
+            return join_safe
+        elif check_type == 'loop':
+            return loop_safe
+        elif check_type == 'safe':
+            return safe_ca
+        else:
+            return join_safe and loop_safe and safe_ca
+
+    def check_safeness(self):
+        """
+        Checks the JOIN-safe, loop-safe and safe CA columns of the RDLT structure in a single pass.
+
+        Loop-safeness and safeness violations found along the way are recorded once per arc.
+
+        Returns:
+            tuple: (join_safe, loop_safe, safe_ca) booleans, each True if no element of the
+                   corresponding column is negative.
+        """
         join_safe = True
         loop_safe = True
         safe_ca = True
         
+        # Arcs that already have a recorded violation, for O(1) duplicate checks
+        recorded_loop_safe = {v.get('arc') for v in self.loop_safe_violations}
+        recorded_safe_ca = {v.get('arc') for v in self.safeCA_violations}
+        
         for row in self.rdlt_structure:
             if isinstance(row, list) and len(row) > 12:
                 arc = row[0]
@@ -964,7 +1015,8 @@ class Matrix:
                 # Check loop-safeness violations
                 if isinstance(loopsafe, str) and loopsafe.startswith('-'):
                     # Check if this violation is already recorded
-                    if not any(v.get('arc') == arc for v in self.loop_safe_violations):
+                    if arc not in recorded_loop_safe:
+                        recorded_loop_safe.add(arc)
                         self.loop_safe_violations.append({
                             "arc": arc,
                             "r-id": r_id
@@ -974,21 +1026,15 @@ class Matrix:
                 # Check safeness violations
                 if isinstance(safeCA, str) and safeCA.startswith('-'):
                     # Check if this violation is already recorded
-                    if not any(v.get('arc') == arc for v in self.safeCA_violations):
+                    if arc not in recorded_safe_ca:
+                        recorded_safe_ca.add(arc)
                         self.safeCA_violations.append({
                             "arc": arc,
                             "r-id": r_id
                         })
                     safe_ca = False
 
-        if check_type == 'join':
-            return join_safe
-        elif check_type == 'loop':
-            return loop_safe
-        elif check_type == 'safe':
-            return safe_ca
-        else:
-            return join_safe and loop_safe and safe_ca
+        return join_safe, loop_safe, safe_ca
 
 
     def evaluate(self):
@@ -1001,13 +1047,15 @@ class Matrix:
             cv, cyc = self.cycle_vector_operation(r)
             ls = self.loop_safe(r, cv)
             safe_vector = self.out_cycle_vector_operation(r)
-            self.join_safe()
             matrix.append([cv, cyc, ls, safe_vector])
 
-        # Check each safety condition independently
-        join_safe = self.checkIfAllPositive('join')
-        loop_safe = self.checkIfAllPositive('loop')
-        safe = self.checkIfAllPositive('safe')
+        # JOIN-safeness is checked over the whole structure and starts from a clean slate,
+        # so only the check made once every row is updated affects the result
+        if self.rdlt_structure:
+            self.join_safe()
+
+        # Check each safety condition independently, scanning the structure once
+        join_safe, loop_safe, safe = self.check_safeness()
 
         # Only report Loop-Safe NCAs as not satisfied if there are actual violations
         if not loop_safe and not self.loop_safe_violations:
@@ -1098,10 +1146,12 @@ class Matrix:
         return self.violations
 
 
-    def print_matrix(self):
+    def format_matrix(self):
         """
-        Prints the matrix (RDLT structure) with updated values.
-        This method iterates through each row of the RDLT structure and prints it.
+        Formats the matrix (RDLT structure) with updated values as printed by print_matrix.
+
+        Returns:
+            str: One line per row of the RDLT structure, without a trailing newline.
         """
         #print whoie matrix
         # for row in self.rdlt_structure:
@@ -1109,11 +1159,24 @@ class Matrix:
         #print specific arcs (arc, c-attribute, l-attribute, loop-safe, safe, join-safe)
         columns_to_print = [0, 3, 5, 9, 11, 12]
         
+        lines = []
         for row in self.rdlt_structure:
             # Create a new list containing only the specified columns
             filtered_row = [row[col] for col in columns_to_print if col < len(row)]
             # print(filtered_row)
-            print([self.convert_arc_format(filtered_row[0])] + filtered_row[1:])
+            lines.append(str([self.convert_arc_format(filtered_row[0])] + filtered_row[1:]))
+        return "\n".join(lines)
+
+    def print_matrix(self, file=None):
+        """
+        Prints the matrix (RDLT structure) with updated values.
+        The rows are formatted by format_matrix and written with a single print.
+
+        Parameters:
+            - file (file-like, optional): Stream to write to. Defaults to sys.stdout.
+        """
+        if self.rdlt_structure:
+            print(self.format_matrix(), file=file)
 
     def get_matrix_data(self):
         return self.matrix_data
\ No newline at end of file
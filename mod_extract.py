@@ -15,9 +15,48 @@ Activity profiles represent the step-by-step execution of the RDLT, showing whic
 at each timestep, whether the sink is reached, and any violations that may occur during traversal.
 """
 
+import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from operator import itemgetter
 import utils
 
+# Marks a missing cache entry where None is a valid cached value
+_MISSING = object()
+
+# State shared by every job of a worker process, set once by _init_profile_worker
+_profile_worker_state = None
+
+def _init_profile_worker(extraction, arc_to_cycles, cycle_patterns):
+    """
+    Store the state shared by the profile jobs of a worker process.
+    
+    Used as the ProcessPoolExecutor initializer, so the extraction instance and the
+    precomputed cycle mappings are sent to each worker once instead of with every job.
+    
+    Parameters:
+        extraction (ModifiedActivityExtraction): The instance the profiles are extracted for.
+        arc_to_cycles (dict): Mapping of arcs to the indices of the cycles they belong to.
+        cycle_patterns (dict): Mapping of cycle indices to their traversal patterns.
+    """
+    global _profile_worker_state
+    _profile_worker_state = (extraction, arc_to_cycles, cycle_patterns)
+
+def _extract_profile_worker(job):
+    """
+    Extract the activity profile of one contraction-path arc in a worker process.
+    
+    Parameters:
+        job (tuple): (contract_arc, path_info, cycle_idx, max_l_attribute) as prepared by
+                     ModifiedActivityExtraction.extract_activity_profiles.
+        
+    Returns:
+        dict: The extracted activity profile.
+    """
+    extraction, arc_to_cycles, cycle_patterns = _profile_worker_state
+    return extraction.extract_contract_arc_profile(job, arc_to_cycles, cycle_patterns)
+
 class ModifiedActivityExtraction:
     """
     A class for analyzing and extracting activity profiles from RDLTs.
@@ -34,20 +73,57 @@ class ModifiedActivityExtraction:
         R (list): The list of arcs in the RDLT.
         contraction_path (dict): Information about contraction paths in the RDLT.
         violations (list): List of detected violations in the RDLT.
+        violation_arcs (tuple): Arc strings of the detected violations.
         cycle_list (list): List of cycles detected in the RDLT.
+        cycle_arcs (dict): Arc strings of each cycle, keyed by cycle index.
+        cycle_vertices (dict): Vertex set of each cycle, keyed by cycle index.
+        arc_to_cycles (dict): Indices of the cycles containing each arc, keyed by arc string.
         failed_contractions (set): Set of arcs that failed contraction.
+        contracted_sources (set): Source vertices of the arcs on any contracted path.
+        contracted_targets (set): Target vertices of the arcs on any contracted path.
         source (str): The source vertex of the RDLT.
         sink (str): The sink vertex of the RDLT.
         checked_arcs (set): Set of arcs that have been checked for traversability.
         traversed_arcs (set): Set of arcs that have been traversed during profile extraction.
         arc_traversal_count (defaultdict): Count of how many times each arc has been traversed.
         max_traversal_depth (int): Maximum depth for traversal to prevent infinite loops.
+        incoming (dict): Incoming arcs of each vertex as (source, arc_str, arc) tuples.
+        outgoing (dict): Outgoing arcs of each vertex as (target, arc_str, arc) tuples.
+        arc_endpoints (dict): (source, target) tuple of each arc, keyed by arc string.
+        l_attributes (dict): L-attribute of each arc, keyed by arc string.
+        c_attributes (dict): C-attribute of each arc, keyed by arc string.
         join_vertices (set): Set of vertices that are joins (have multiple incoming arcs).
         join_classifications (dict): Classification of join vertices by type.
+        and_join_vertices (set): Join vertices classified as AND-JOIN.
+        non_epsilon_incoming (dict): Incoming non-epsilon arcs per vertex, used by AND-join checks.
+        graph (dict): Adjacency tuples of (target, arc string) pairs sorted by target, used for path finding.
+        blocked_vertices (set): Vertices whose only incoming arc failed contraction.
+        reachability_cache (dict): Cached results of is_vertex_reachable_from_source per vertex.
+        path_cache (dict): Cached results of find_path on the shared graph, keyed by endpoints.
+        cycle_pattern_cache (dict): Cached traversal pattern of each cycle, keyed by cycle index.
         activity_profiles (dict): Dictionary of extracted activity profiles.
+        verbose (bool): Whether errors recovered from during extraction are printed.
     """
 
-    def __init__(self, R, violations=None, contraction_path=None, cycle_list=None):
+    __slots__ = (
+        'R', 'contraction_path', 'violations', 'violation_arcs', 'cycle_list',
+        'cycle_arcs', 'cycle_vertices', 'arc_to_cycles', 'failed_contractions', 'contracted_sources',
+        'contracted_targets', 'source', 'sink',
+        'incoming', 'outgoing', 'arc_endpoints', 'l_attributes', 'c_attributes',
+        'checked_arcs', 'traversed_arcs', 'arc_traversal_count', 'max_traversal_depth',
+        'join_vertices', 'join_classifications', 'and_join_vertices',
+        'non_epsilon_incoming', 'graph', 'blocked_vertices', 'reachability_cache',
+        'path_cache', 'cycle_pattern_cache', 'activity_profiles', 'verbose',
+    )
+
+    # Attributes that depend only on R and can be shared between instances (see from_shared)
+    STATIC_ATTRIBUTES = (
+        'R', 'source', 'sink', 'max_traversal_depth', 'incoming', 'outgoing', 'arc_endpoints',
+        'l_attributes', 'c_attributes', 'join_vertices', 'join_classifications',
+        'and_join_vertices', 'non_epsilon_incoming', 'graph',
+    )
+
+    def __init__(self, R, violations=None, contraction_path=None, cycle_list=None, verbose=True):
         """
         Initialize the ModifiedActivityExtraction with RDLT data (EVSA) and analysis results.
         
@@ -57,48 +133,272 @@ class ModifiedActivityExtraction:
             violations (list, optional): List of detected violations in the RDLT.
             contraction_path (dict, optional): Dictionary of contraction paths.
             cycle_list (list, optional): List of cycles detected in the RDLT.
+            verbose (bool, optional): Whether to print errors recovered from during
+                                      extraction. Defaults to True.
         """
         self.R = R
-        self.contraction_path = contraction_path or []
+        self.verbose = verbose
+        self.index_static()
+        self.reset_analysis(violations, contraction_path, cycle_list)
+
+    @classmethod
+    def from_shared(cls, shared, violations=None, contraction_path=None, cycle_list=None,
+                    verbose=True):
+        """
+        Create an extraction over the same RDLT as an existing instance, reusing its indexes.
+        
+        The arc, attribute and join indexes depend only on R, so analyses that sweep several
+        sets of violations or contraction paths over one RDLT can share them instead of
+        rebuilding them for every instance. Only the analysis-specific state is recomputed.
+        
+        Parameters:
+            shared (ModifiedActivityExtraction): An instance built over the RDLT to reuse.
+            violations (list, optional): List of detected violations in the RDLT.
+            contraction_path (dict, optional): Dictionary of contraction paths.
+            cycle_list (list, optional): List of cycles detected in the RDLT.
+            verbose (bool, optional): Whether to print errors recovered from during
+                                      extraction. Defaults to True.
+        
+        Returns:
+            ModifiedActivityExtraction: A new instance sharing the indexes of shared.
+        """
+        instance = cls.__new__(cls)
+        instance.verbose = verbose
+        for name in cls.STATIC_ATTRIBUTES:
+            setattr(instance, name, getattr(shared, name))
+        instance.reset_analysis(violations, contraction_path, cycle_list)
+        return instance
+
+    def report_error(self, message):
+        """
+        Print an error that extraction recovered from, if this instance is verbose.
+        
+        Parameters:
+            message (str): The error message to print.
+        """
+        if self.verbose:
+            print(message)
+
+    def index_static(self):
+        """
+        Build the indexes that depend only on R.
+        
+        These are treated as read-only once built, which lets from_shared hand them to
+        other instances over the same RDLT.
+        """
+        self.source, self.sink = utils.get_source_and_target_vertices(self.R)
+        self.max_traversal_depth = len(self.R) * 3
+
+        self.incoming, self.outgoing, self.arc_endpoints = self.index_arcs()
+        self.l_attributes, self.c_attributes = self.index_arc_attributes()
+        self.join_vertices = self.identify_join_vertices()
+        self.join_classifications = self.classify_joins()
+        self.and_join_vertices = {
+            v for v, info in self.join_classifications.items() if info['type'] == 'AND-JOIN'
+        }
+        self.non_epsilon_incoming = self.index_non_epsilon_incoming()
+        self.graph = self.build_path_graph()
+
+    def reset_analysis(self, violations=None, contraction_path=None, cycle_list=None):
+        """
+        Set up the state that depends on the violations, contraction paths and cycles.
+        
+        Parameters:
+            violations (list, optional): List of detected violations in the RDLT.
+            contraction_path (dict, optional): Dictionary of contraction paths.
+            cycle_list (list, optional): List of cycles detected in the RDLT.
+        """
+        self.contraction_path = contraction_path or {}
         self.violations = violations or []
+        self.violation_arcs = self.normalize_violations()
         self.cycle_list = cycle_list or []
+        self.cycle_arcs, self.cycle_vertices, self.arc_to_cycles = self.index_cycles()
         self.failed_contractions = set()
         for path_info in self.contraction_path.values():
             for fc in path_info.get('failed_contractions', []):
                 self.failed_contractions.add(self.get_arc(fc))
 
-        
-        self.source, self.sink = utils.get_source_and_target_vertices(self.R)
+        self.contracted_sources, self.contracted_targets = self.index_contracted_paths()
 
         self.checked_arcs = set()
         self.traversed_arcs = set()
         self.arc_traversal_count = defaultdict(int)
-        self.max_traversal_depth = len(self.R) * 3
 
-        self.join_vertices = self.identify_join_vertices()
-        self.join_classifications = self.classify_joins()
+        self.blocked_vertices = self.identify_blocked_vertices()
+        self.reachability_cache = {}
+        self.path_cache = {}
+        self.cycle_pattern_cache = {}
 
         self.activity_profiles = {}
 
-    def identify_join_vertices(self):
+    def normalize_violations(self):
         """
-        Identify vertices with multiple incoming arcs.
+        Normalize the detected violations into their arc strings.
         
-        This method scans through all arcs in the RDLT to find vertices that have
-        more than one incoming arc. These vertices are potential join points in the RDLT.
+        Violations are dictionaries produced by the matrix evaluation; only entries that
+        carry an 'arc' key identify a violating arc. Normalizing them once avoids repeating
+        the type checks every time the violations are consulted.
         
         Returns:
-            set: A set of vertices that have multiple incoming arcs.
+            tuple: The violating arc strings in the order they were reported.
+        """
+        return tuple(
+            self.get_arc(violation['arc'])
+            for violation in self.violations
+            if isinstance(violation, dict) and 'arc' in violation
+        )
+
+    def index_cycles(self):
+        """
+        Index the arcs and vertices of every detected cycle.
+        
+        Cycles may be given either as a list of arcs or as a dict holding the arcs under
+        the 'cycle' key. They are normalized once here so that traversal code can look up
+        the arcs and vertices of a cycle by index instead of re-parsing the cycle list, and
+        the cycles containing an arc by arc string.
+        
+        Returns:
+            tuple: (cycle_arcs, cycle_vertices, arc_to_cycles) where cycle_arcs maps a cycle
+                   index to its list of arc strings, cycle_vertices maps it to the set of its
+                   vertices and arc_to_cycles maps an arc string to the indices of the cycles
+                   containing it, in ascending order.
+        """
+        cycle_arcs = {}
+        cycle_vertices = {}
+        arc_to_cycles = {}
+        
+        for i, cycle_info in enumerate(self.cycle_list):
+            cycle = None
+            if isinstance(cycle_info, dict) and 'cycle' in cycle_info:
+                cycle = cycle_info['cycle']
+            elif isinstance(cycle_info, list):
+                cycle = cycle_info
+            
+            if cycle:
+                cycle_arcs[i] = []
+                cycle_vertices[i] = set()
+                for arc in cycle:
+                    arc_str = self.get_arc(arc)
+                    cycle_arcs[i].append(arc_str)
+                    arc_to_cycles.setdefault(arc_str, []).append(i)
+                    try:
+                        src, tgt = arc_str.split(', ')
+                        cycle_vertices[i].add(src)
+                        cycle_vertices[i].add(tgt)
+                    except Exception:
+                        continue
+        
+        return cycle_arcs, cycle_vertices, arc_to_cycles
+
+    def index_contracted_paths(self):
         """
-        incoming_count = defaultdict(int)
+        Collect the vertices touched by the contracted paths.
+        
+        Reachability checks only need to know whether a vertex is the source or target
+        of some contracted arc, so both sides are gathered into sets once.
+        
+        Returns:
+            tuple: (contracted_sources, contracted_targets) sets of vertices.
+        """
+        contracted_sources = set()
+        contracted_targets = set()
+        for path_info in self.contraction_path.values():
+            for arc in path_info.get('contracted_path', []):
+                try:
+                    source, target = self.get_arc(arc).split(', ')
+                except Exception:
+                    continue
+                contracted_sources.add(source)
+                contracted_targets.add(target)
+        
+        return contracted_sources, contracted_targets
+
+    def index_arcs(self):
+        """
+        Index the arcs of the RDLT by their target and source vertices.
+        
+        Most traversal checks ask for the arcs entering or leaving a single vertex. Building
+        both indexes once avoids scanning and re-splitting every arc in R for each query.
+        The split endpoints of every arc are kept as well, so traversal code can look them
+        up instead of splitting the same arc strings again.
+        Vertex names and arc strings are interned so every entry referring to the same
+        vertex or arc shares one string object. Entries keep the order of R.
+        
+        Returns:
+            tuple: (incoming, outgoing, arc_endpoints) dictionaries. incoming maps a vertex
+                   to a list of (source, arc_str, arc) tuples and outgoing maps a vertex to a
+                   list of (target, arc_str, arc) tuples, where arc is the entry from R.
+                   arc_endpoints maps each arc string to its (source, target) tuple.
+        """
+        incoming = defaultdict(list)
+        outgoing = defaultdict(list)
+        arc_endpoints = {}
         for arc in self.R:
+            arc_str = sys.intern(self.get_arc(arc))
             try:
-                _, target = self.get_arc(arc).split(', ')
-                incoming_count[target] += 1
+                source, target = map(sys.intern, arc_str.split(', '))
             except Exception:
                 continue
+            incoming[target].append((source, arc_str, arc))
+            outgoing[source].append((target, arc_str, arc))
+            arc_endpoints[arc_str] = (source, target)
+        
+        return dict(incoming), dict(outgoing), arc_endpoints
+
+    def build_path_graph(self):
+        """
+        Build the adjacency list used for path finding.
         
-        return {v for v, count in incoming_count.items() if count > 1}
+        The graph depends only on R, so it is built once instead of on every profile
+        extraction. Each adjacency list is sorted by target vertex, the order find_path
+        explores neighbors in, and stored as a tuple since it is never modified. Arcs are
+        stored as their arc strings so path finding does not have to normalize them.
+        
+        Returns:
+            dict: A dictionary mapping each vertex to a tuple of (target, arc_str) tuples.
+        """
+        return {
+            source: tuple(sorted(((target, arc_str) for target, arc_str, _ in entries), key=itemgetter(0)))
+            for source, entries in self.outgoing.items()
+        }
+
+    def index_arc_attributes(self):
+        """
+        Index the L-attributes and C-attributes of the arcs in R by arc string.
+        
+        If an arc string appears more than once in R, the first occurrence wins, matching
+        the behaviour of a linear search over R.
+        
+        Returns:
+            tuple: (l_attributes, c_attributes) dictionaries mapping arc strings to their
+                   L-attribute (int) and C-attribute (str) respectively.
+        """
+        l_attributes = {}
+        c_attributes = {}
+        for arc in self.R:
+            arc_str = self.get_arc(arc)
+            if arc_str in l_attributes:
+                continue
+            if isinstance(arc, dict):
+                l_attributes[arc_str] = int(arc.get('l-attribute', 1))
+                c_attributes[arc_str] = arc.get('c-attribute', '0')
+            else:
+                l_attributes[arc_str] = 1
+                c_attributes[arc_str] = '0'
+        
+        return l_attributes, c_attributes
+
+    def identify_join_vertices(self):
+        """
+        Identify vertices with multiple incoming arcs.
+        
+        This method uses the incoming-arc index to find vertices that have more than
+        one incoming arc. These vertices are potential join points in the RDLT.
+        
+        Returns:
+            set: A set of vertices that have multiple incoming arcs.
+        """
+        return {v for v, arcs in self.incoming.items() if len(arcs) > 1}
 
     def classify_joins(self):
         """
@@ -116,9 +416,7 @@ class ModifiedActivityExtraction:
         join_classifications = {}
         
         for vertex in sorted(self.join_vertices):  # Sort vertices for deterministic processing
-            incoming_arcs = [
-                arc for arc in self.R if self.get_arc(arc).endswith(f", {vertex}")
-            ]
+            incoming_arcs = [arc for _, _, arc in self.incoming[vertex]]
             
             # Sort for deterministic processing
             incoming_arcs.sort(key=lambda arc: self.get_arc(arc))
@@ -141,6 +439,48 @@ class ModifiedActivityExtraction:
         
         return join_classifications
 
+    def index_non_epsilon_incoming(self):
+        """
+        Index the incoming arcs with non-epsilon C-attributes for every vertex.
+        
+        AND-join checks need the non-epsilon incoming arcs of a vertex every time the
+        join is reached. Building this index once avoids rescanning all of R on each
+        check. Entries keep the order of R.
+        
+        Returns:
+            dict: A dictionary mapping each vertex to a list of (source, arc_str, arc)
+                  tuples for its incoming arcs whose C-attribute is not '0'.
+        """
+        non_epsilon_incoming = {}
+        for target, entries in self.incoming.items():
+            non_epsilon = [entry for entry in entries if self.c_attributes[entry[1]] != '0']
+            if non_epsilon:
+                non_epsilon_incoming[target] = non_epsilon
+        
+        return non_epsilon_incoming
+
+    def identify_blocked_vertices(self):
+        """
+        Identify vertices that cannot be reached because their only incoming arc failed contraction.
+        
+        This depends only on the failed contractions and the structure of the RDLT, so it is
+        computed once instead of being re-derived on every reachability check.
+        
+        Returns:
+            set: A set of vertices whose single incoming arc is a failed contraction.
+        """
+        blocked_vertices = set()
+        for fc in self.failed_contractions:
+            try:
+                _, tgt = fc.split(', ')
+            except Exception:
+                continue
+            all_incoming = self.incoming.get(tgt, [])
+            if len(all_incoming) == 1 and all_incoming[0][1] == fc:
+                blocked_vertices.add(tgt)
+        
+        return blocked_vertices
+
     def is_vertex_reachable(self, vertex, depth=0):
         """
         Check if a vertex is reachable by traversing the RDLT.
@@ -161,24 +501,19 @@ class ModifiedActivityExtraction:
         if vertex == self.source:
             return True
         
-        for path in self.contraction_path.values():
-            if vertex in [v.split(', ')[0] for v in path.get('contracted_path', [])]:
-                return True
+        if vertex in self.contracted_sources:
+            return True
         
         checked_sources = set()
         
-        for arc in self.R:
-            arc_str = self.get_arc(arc)
-            source, target = arc_str.split(', ')
+        for source, arc_str, _ in self.incoming.get(vertex, []):
+            if arc_str in self.traversed_arcs:
+                return True
             
-            if target == vertex:
-                if arc_str in self.traversed_arcs:
+            if source not in checked_sources:
+                checked_sources.add(source)
+                if self.is_vertex_reachable(source, depth + 1):
                     return True
-                
-                if source not in checked_sources:
-                    checked_sources.add(source)
-                    if self.is_vertex_reachable(source, depth + 1):
-                        return True
         
         return False
 
@@ -193,11 +528,18 @@ class ModifiedActivityExtraction:
             vertex (str): The vertex to check for reachability from source.
             visited (set, optional): Set of already visited vertices to prevent cycles. Defaults to None.
         
+        Top-level queries (without a visited set) only depend on the static RDLT and the
+        contraction results, so their answers are cached per vertex.
+        
         Returns:
             bool: True if the vertex is reachable from source, False otherwise.
         """
         if visited is None:
-            visited = set()
+            reachable = self.reachability_cache.get(vertex)
+            if reachable is None:
+                reachable = self.is_vertex_reachable_from_source(vertex, set())
+                self.reachability_cache[vertex] = reachable
+            return reachable
         
         # Base cases
         if vertex == self.source:
@@ -208,83 +550,61 @@ class ModifiedActivityExtraction:
         
         visited.add(vertex)
         
-        # Check if this vertex is in failed contractions as a target
-        for fc in self.failed_contractions:
-            try:
-                _, tgt = fc.split(', ')
-                if tgt == vertex:
-                    # Check if this is the only path to this vertex
-                    # If so, the vertex is not reachable
-                    all_incoming = self.get_all_incoming_arcs(vertex)
-                    if len(all_incoming) == 1 and all_incoming[0] == fc:
-                        return False
-            except Exception:
-                continue
+        # Branches share visited; this vertex is removed again on every return path so
+        # that sibling branches only see the vertices on the current search path
+        try:
+            # A vertex whose only incoming arc failed contraction is not reachable
+            if vertex in self.blocked_vertices:
+                return False
         
-        # Check if vertex is reachable through a contracted path
-        for path_info in self.contraction_path.values():
-            contracted_path = path_info.get('contracted_path', [])
-            for arc in contracted_path:
-                try:
-                    _, target = self.get_arc(arc).split(', ')
-                    if target == vertex:
-                        return True
-                except Exception:
-                    continue
-        
-        # Check all arcs leading to this vertex
-        incoming_arcs = []
-        for arc in self.R:
-            arc_str = self.get_arc(arc)
-            try:
-                source, target = arc_str.split(', ')
-                if target == vertex:
-                    incoming_arcs.append((source, arc_str))
-            except Exception:
-                continue
+            # Check if vertex is reachable through a contracted path
+            if vertex in self.contracted_targets:
+                return True
         
-        # If vertex is an AND-join, all incoming arcs with non-epsilon c-attributes 
-        # must be reachable
-        if vertex in self.join_vertices and self.join_classifications[vertex]['type'] == 'AND-JOIN':
-            # Get all non-epsilon incoming arcs
-            non_epsilon_arcs = []
-            for source, arc_str in incoming_arcs:
-                for arc in self.R:
-                    if self.get_arc(arc) == arc_str and self.get_c_attribute(arc) != '0':
-                        non_epsilon_arcs.append((source, arc_str))
-                        break
+            # Bind the lookups used in the loops below to locals
+            failed_contractions = self.failed_contractions
+            is_reachable = self.is_vertex_reachable_from_source
             
-            # Check if any of these arcs are in failed contractions
-            for _, arc_str in non_epsilon_arcs:
-                if arc_str in self.failed_contractions:
-                    return False  # AND-join can't be traversed if any required arc failed
+            # If vertex is an AND-join, all incoming arcs with non-epsilon c-attributes 
+            # must be reachable
+            if vertex in self.and_join_vertices:
+                # Get all non-epsilon incoming arcs
+                non_epsilon_arcs = [(source, arc_str) for source, arc_str, _ in self.non_epsilon_incoming.get(vertex, [])]
             
-            # All source vertices must be reachable
-            for source, _ in non_epsilon_arcs:
-                if not self.is_vertex_reachable_from_source(source, visited.copy()):
-                    return False
+                # Check if any of these arcs are in failed contractions
+                for _, arc_str in non_epsilon_arcs:
+                    if arc_str in failed_contractions:
+                        return False  # AND-join can't be traversed if any required arc failed
             
-            # If all sources are reachable, then the AND-join is reachable
-            if non_epsilon_arcs:
-                return True
-        else:
-            # For regular vertices or OR/MIX-joins, any incoming arc is sufficient
-            for source, arc_str in incoming_arcs:
-                # Skip failed contractions
-                if arc_str in self.failed_contractions:
-                    continue
-                
-                if self.is_vertex_reachable_from_source(source, visited.copy()):
+                # All source vertices must be reachable
+                for source, _ in non_epsilon_arcs:
+                    if not is_reachable(source, visited):
+                        return False
+            
+                # If all sources are reachable, then the AND-join is reachable
+                if non_epsilon_arcs:
                     return True
+            else:
+                # For regular vertices or OR/MIX-joins, any incoming arc is sufficient
+                for source, arc_str, _ in self.incoming.get(vertex, []):
+                    # Skip failed contractions
+                    if arc_str in failed_contractions:
+                        continue
+                
+                    if is_reachable(source, visited):
+                        return True
         
-        # If we're here, we couldn't find a path to this vertex
-        return False
+            # If we're here, we couldn't find a path to this vertex
+            return False
+        finally:
+            visited.discard(vertex)
 
     def get_all_incoming_arcs(self, vertex):
         """
         Get all arcs that lead to the given vertex.
         
-        This method scans the RDLT to find all arcs that have the specified vertex as their target.
+        This method looks up the arcs that have the specified vertex as their target in the
+        incoming-arc index.
         
         Parameters:
             vertex (str): The vertex to find incoming arcs for.
@@ -292,18 +612,9 @@ class ModifiedActivityExtraction:
         Returns:
             list: A list of arc strings representing all arcs leading to the specified vertex.
         """
-        incoming = []
-        for arc in self.R:
-            arc_str = self.get_arc(arc)
-            try:
-                _, target = arc_str.split(', ')
-                if target == vertex:
-                    incoming.append(arc_str)
-            except Exception:
-                continue
-        return incoming
+        return [arc_str for _, arc_str, _ in self.incoming.get(vertex, [])]
 
-    def extract_activity_profiles(self):
+    def extract_activity_profiles(self, max_workers=None, max_profiles=None):
         """
         Extract activity profiles for the RDLT.
         
@@ -320,6 +631,14 @@ class ModifiedActivityExtraction:
         - Handling unreached violations and terminal nodes
         - Creating activity profiles for each relevant arc
         
+        Parameters:
+            max_workers (int, optional): Number of worker processes used to extract the
+                                         profiles of the contraction-path arcs. Defaults to
+                                         None, which extracts them sequentially.
+            max_profiles (int, optional): Maximum number of activity profiles to extract.
+                                          Extraction stops once this many profiles exist.
+                                          Defaults to None, which extracts all of them.
+        
         Returns:
             dict: A dictionary mapping arcs to their activity profiles, where each profile contains:
                 - 'S': Timestep-to-arcs mapping showing arcs traversed at each step
@@ -332,37 +651,14 @@ class ModifiedActivityExtraction:
         """
         self.activity_profiles = {}
         
-        # First, build a mapping of which arcs belong to which cycles
-        arc_to_cycles = {}
-        cycle_to_arcs = {}  # Track which arcs belong to each cycle
-        
-        for i, cycle_info in enumerate(self.cycle_list):
-            # Extract the cycle
-            cycle = None
-            if isinstance(cycle_info, dict) and 'cycle' in cycle_info:
-                cycle = cycle_info['cycle']
-            elif isinstance(cycle_info, list):
-                cycle = cycle_info
-            
-            if cycle:
-                cycle_to_arcs[i] = []
-                for arc in cycle:
-                    arc_str = self.get_arc(arc)
-                    cycle_to_arcs[i].append(arc_str)
-                    if arc_str not in arc_to_cycles:
-                        arc_to_cycles[arc_str] = []
-                    arc_to_cycles[arc_str].append(i)  # Store cycle index
-        
-        # Keep track of processed cycles
-        processed_cycles = {}
+        # Mapping of which arcs belong to which cycles, built once in reset_analysis
+        arc_to_cycles = self.arc_to_cycles
         
         # Group arcs by the cycles they belong to for consistent processing
-        grouped_arcs = {}
-        
-        # Initialize cycle_vertices dictionary for tracking vertices in each cycle
-        cycle_vertices = {}
+        grouped_arcs = defaultdict(list)
         
         # Collect all arcs from the contraction path (both successful and failed)
+        # and group them in the same pass
         contraction_path_arcs = set()
         for contract_arc, path_info in sorted(self.contraction_path.items(), key=lambda x: str(x[0])):
             contract_arc_str = self.get_arc(contract_arc)
@@ -375,21 +671,6 @@ class ModifiedActivityExtraction:
             # Add contracted path arcs to the set
             for cp in path_info.get('contracted_path', []):
                 contraction_path_arcs.add(self.get_arc(cp))
-        
-        # Combine with failed contractions to get the full set of considered arcs
-        considered_arcs = contraction_path_arcs.union(self.failed_contractions)
-        
-        # Check if there are any violating arcs that aren't in the contraction path or failed contractions
-        # These would be arcs in violations that were never considered in any contraction
-        unreached_violations = []
-        for violation in self.violations:
-            if isinstance(violation, dict) and 'arc' in violation:
-                violation_arc = self.get_arc(violation['arc'])
-                if violation_arc not in considered_arcs:
-                    unreached_violations.append(violation_arc)
-        
-        for contract_arc, path_info in sorted(self.contraction_path.items(), key=lambda x: str(x[0])):
-            contract_arc_str = self.get_arc(contract_arc)
             
             # Check if this arc is part of a cycle
             if contract_arc_str in arc_to_cycles:
@@ -399,157 +680,67 @@ class ModifiedActivityExtraction:
                 # Create group key based on cycle
                 group_key = f"cycle_{cycle_idx}"
                 
-                if group_key not in grouped_arcs:
-                    grouped_arcs[group_key] = []
-                
                 # Add to group
                 grouped_arcs[group_key].append((contract_arc, path_info))
             else:
                 # Non-cycle arc gets its own group
                 grouped_arcs[contract_arc_str] = [(contract_arc, path_info)]
         
-        # Build a unified graph representation for path finding
-        graph = defaultdict(list)
-        for arc in self.R:
-            arc_str = self.get_arc(arc)
-            try:
-                src, tgt = arc_str.split(', ')
-                graph[src].append((tgt, arc))
-            except Exception:
-                continue
+        # Combine with failed contractions to get the full set of considered arcs
+        considered_arcs = contraction_path_arcs.union(self.failed_contractions)
+        
+        # Check if there are any violating arcs that aren't in the contraction path or failed contractions
+        # These would be arcs in violations that were never considered in any contraction
+        unreached_violations = [arc for arc in self.violation_arcs if arc not in considered_arcs]
+        unreached_violation_set = set(unreached_violations)
+        
+        # Unified graph representation for path finding, built once in index_static
+        graph = self.graph
         
         # Preprocess all cycles to build consistent traversal patterns
         cycle_patterns = {}
-        cycle_vertices = {}
         
         for group_key in list(grouped_arcs.keys()):
             # Check if this is a cycle group
             if group_key.startswith("cycle_"):
                 cycle_idx = int(group_key.split("_")[1])
-                
-                # Get all arcs in this cycle
-                cycle_arcs = cycle_to_arcs.get(cycle_idx, [])
-                if not cycle_arcs:
-                    continue
-                
-                # Find all vertices in the cycle
-                vtx_set = set()
-                for arc_str in cycle_arcs:
-                    try:
-                        src, tgt = arc_str.split(', ')
-                        vtx_set.add(src)
-                        vtx_set.add(tgt)
-                    except Exception:
-                        continue
-                
-                # Skip if no vertices
-                if not vtx_set:
-                    continue
-                
-                cycle_vertices[cycle_idx] = vtx_set
-                
-                # The key is to create a fully ordered, deterministic cycle pattern
-                # that includes all necessary arcs in the right sequence
-                standard_cycle = []
-                
-                # Extract vertices from cycle arcs and build adjacency
-                cycle_adjacency = defaultdict(list)
-                for arc_str in cycle_arcs:
-                    try:
-                        src, tgt = arc_str.split(', ')
-                        if src in vtx_set and tgt in vtx_set:
-                            cycle_adjacency[src].append((tgt, arc_str))
-                    except Exception:
-                        continue
-                
-                # Ensure deterministic ordering of adjacency lists
-                for src in cycle_adjacency:
-                    cycle_adjacency[src].sort(key=lambda x: x[0])  # Sort by target vertex
-                
-                # Choose a deterministic starting vertex
-                start_vertices = sorted(vtx_set)
-                start_vtx = start_vertices[0]
-                
-                # Build a path through the cycle
-                visited = {start_vtx}
-                current = start_vtx
-                
-                # First, build canonical ordering of vertices
-                ordered_vertices = sorted(vtx_set)
-                canonical_order = {}
-                for i, vtx in enumerate(ordered_vertices):
-                    canonical_order[vtx] = i
-                
-                # Create a fully deterministic cycle by connecting vertices in canonical order
-                for i in range(len(ordered_vertices)):
-                    current_vtx = ordered_vertices[i]
-                    next_vtx = ordered_vertices[(i + 1) % len(ordered_vertices)]
-                    
-                    # Find a path from current_vtx to next_vtx
-                    path = self.find_path_in_adjacency(current_vtx, next_vtx, cycle_adjacency, set())
-                    if path:
-                        for arc in path:
-                            if arc not in standard_cycle:
-                                standard_cycle.append(arc)
-                    else:
-                        # If no direct path, add an arc if there's one in the cycle arcs
-                        for arc_str in sorted(cycle_arcs):
-                            try:
-                                src, tgt = arc_str.split(', ')
-                                if src == current_vtx and tgt == next_vtx and arc_str not in standard_cycle:
-                                    standard_cycle.append(arc_str)
-                                    break
-                            except Exception:
-                                continue
-                
-                # Ensure all cycle arcs are included
-                for arc_str in sorted(cycle_arcs):
-                    if arc_str not in standard_cycle:
-                        standard_cycle.append(arc_str)
-                
-                # Store this cycle pattern
-                cycle_patterns[cycle_idx] = standard_cycle
-                # print(f"Standard cycle {cycle_idx} pattern: {standard_cycle}")
+                standard_cycle = self.get_cycle_pattern(cycle_idx)
+                if standard_cycle is not None:
+                    cycle_patterns[cycle_idx] = standard_cycle
         
-        # Process each group of arcs
+        # Process each group of arcs; truncated records whether max_profiles left arcs unprofiled
+        pending_jobs = []
+        truncated = False
         for group_key, arc_group in grouped_arcs.items():
+            if self.has_reached_profile_limit(max_profiles):
+                truncated = True
+                break
+            
             cycle_idx = None
             
             # Check if this is a cycle group
             if group_key.startswith("cycle_"):
                 cycle_idx = int(group_key.split("_")[1])
                 
-            # Get the canonical example arc for this group
-            canonical_arc, canonical_path_info = arc_group[0]
-            
             # Precompute l-attributes for all arcs to ensure consistent traversal
             max_l_attribute = 0
             for contract_arc, _ in arc_group:
                 arc_str = self.get_arc(contract_arc)
-                l_attr = 0
-                for arc in self.R:
-                    if self.get_arc(arc) == arc_str:
-                        l_attr = self.get_l_attribute(arc)
-                        break
+                l_attr = self.l_attributes.get(arc_str, 0)
                 max_l_attribute = max(max_l_attribute, l_attr)
             
             # For each arc in the group, create an activity profile based on the same traversal pattern
             for contract_arc, path_info in arc_group:
-                # Initialize the profile with a default empty value
-                profile = {
-                    'S': {},
-                    'deadlock': False,
-                    'successful': False,
-                    'sink_timestep': None,
-                    'traversed_arcs': {},
-                    'visited_vertices': set(),
-                }
+                if self.has_reached_profile_limit(max_profiles):
+                    truncated = True
+                    break
                 
                 # Check if the contract arc is in unreached violations
                 contract_arc_str = self.get_arc(contract_arc)
-                if contract_arc_str in unreached_violations:
+                if contract_arc_str in unreached_violation_set:
                     # Create a profile that just follows the contracted path from the contraction path
                     # to show a successful path to the sink
+                    profile = self.new_profile()
                     
                     # Use the contracted path from this path_info
                     contracted_path = path_info.get('contracted_path', [])
@@ -579,7 +770,7 @@ class ModifiedActivityExtraction:
                                     profile['successful'] = True
                                     profile['sink_timestep'] = timestep
                             except Exception as e:
-                                print(f"Error processing contracted path arc {path_arc_str}: {str(e)}")
+                                self.report_error(f"Error processing contracted path arc {path_arc_str}: {str(e)}")
                             
                             timestep += 1
                         
@@ -609,103 +800,56 @@ class ModifiedActivityExtraction:
                                             
                                             timestep += 1
                             except Exception as e:
-                                print(f"Error finding path to sink: {str(e)}")
+                                self.report_error(f"Error finding path to sink: {str(e)}")
                     else:
                         # If no contracted path found, use a basic source arc
                         profile['S'][1] = {self.get_source_arc()}
                     
                     # Add the note that the violating arc is unreachable - this is the only part we should display
-                    try:
-                        src, _ = contract_arc_str.split(', ')
-                        profile['violation_cause'] = f"Violating arc {contract_arc_str} is unreachable"
-                    except Exception:
-                        profile['violation_cause'] = f"Violating arc {contract_arc_str} is unreachable"
+                    profile['violation_cause'] = f"Violating arc {contract_arc_str} is unreachable"
                     
                     # If the contracted path reached the sink, mark it as successful
                     if self.sink in profile['visited_vertices']:
                         profile['successful'] = True
                         
-                    # Store the profile and continue to next arc
-                    self.activity_profiles[contract_arc] = profile
-                    continue
-                
-                try:
-                    # Reset traversal tracking for each profile
-                    self.traversed_arcs = set()
-                    self.arc_traversal_count = defaultdict(int)
-                    
-                    # Get successful contractions for this path
-                    successful_contractions = path_info.get('successful_contractions', [])
-                    
-                    # Find the original arc that matches the contract_arc
-                    profile_arc = next(
-                        (c for c in successful_contractions 
-                         if self.get_arc(c) == self.get_arc(contract_arc)),
-                        None
-                    )
-                    
-                    if not profile_arc:
-                        contracted_path = path_info.get('contracted_path', [])
-                        if contracted_path:
-                            profile_arc = contracted_path[0]
-                        else:
-                            profile_arc = None
-                    
-                    contract_arc_str = self.get_arc(contract_arc)
-                    
-                    # Determine if this arc is part of a cycle
-                    in_cycle = contract_arc_str in arc_to_cycles
-                    cycle_indices = arc_to_cycles.get(contract_arc_str, [])
-                    
-                    # For cycle arcs, we want to ensure the same traversal pattern
-                    if in_cycle and cycle_idx is not None:
-                        # Get the pre-built cycle pattern
-                        standard_cycle = cycle_patterns.get(cycle_idx, [])
-                        
-                        # Generate profile using the standard cycle pattern and group's max l-attribute
-                        profile = self.extract_profile_with_joins(
-                            profile_arc, 
-                            force_include=contract_arc,
-                            in_cycle=in_cycle,
-                            cycle_indices=cycle_indices,
-                            arc_to_cycles=arc_to_cycles,
-                            standard_cycle=standard_cycle,
-                            max_group_l_attribute=max_l_attribute
-                        )
-                    else:
-                        # Normal processing for non-cycle arcs
-                        profile = self.extract_profile_with_joins(
-                            profile_arc, 
-                            force_include=contract_arc,
-                            in_cycle=in_cycle,
-                            cycle_indices=cycle_indices,
-                            arc_to_cycles=arc_to_cycles
-                        )
-                except Exception as e:
-                    print(f"Error processing contract arc {contract_arc}: {str(e)}")
-                    # Keep the default profile initialized above
+                    # Store the profile and continue to next arc
+                    self.activity_profiles[contract_arc] = profile
+                    continue
                 
-                # Now profile is definitely defined
-                self.activity_profiles[contract_arc] = profile
+                job = (contract_arc, path_info, cycle_idx, max_l_attribute)
+                if max_workers is None or max_workers <= 1:
+                    self.activity_profiles[contract_arc] = self.extract_contract_arc_profile(
+                        job, arc_to_cycles, cycle_patterns)
+                else:
+                    # Reserve the slot so the original ordering is preserved
+                    self.activity_profiles[contract_arc] = None
+                    pending_jobs.append(job)
+        
+        # Extract the deferred profiles in worker processes. This instance and the cycle
+        # mappings are sent to each worker once, so a job only carries its own arc
+        if pending_jobs:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_profile_worker,
+                                     initargs=(self, arc_to_cycles, cycle_patterns)) as executor:
+                results = executor.map(_extract_profile_worker, pending_jobs)
+                for job, profile in zip(pending_jobs, results):
+                    self.activity_profiles[job[0]] = profile
         
         # Special handling for unreached violations that weren't part of any group
+        profiled_arcs = {self.get_arc(arc) for arc in self.activity_profiles}
         for violation_arc in unreached_violations:
             # Check if we already processed this violation arc
-            if any(self.get_arc(arc) == violation_arc for arc in self.activity_profiles):
+            if violation_arc in profiled_arcs:
                 continue
+            
+            if self.has_reached_profile_limit(max_profiles):
+                truncated = True
+                break
                 
             # Create a dummy contract arc for this violation
             dummy_contract_arc = {'arc': violation_arc}
             
             # Create a profile that follows a successful path from source to sink
-            profile = {
-                'S': {},
-                'deadlock': False,
-                'successful': False,
-                'sink_timestep': None,
-                'traversed_arcs': {},
-                'visited_vertices': set(),
-            }
+            profile = self.new_profile()
             
             # Look for any successful path from any contraction path
             found_successful_path = False
@@ -803,9 +947,202 @@ class ModifiedActivityExtraction:
             
             # Store the profile
             self.activity_profiles[dummy_contract_arc] = profile
+            profiled_arcs.add(violation_arc)
+        
+        if truncated:
+            self.report_error(f"Activity profile extraction stopped at {max_profiles} profiles")
         
         return self.activity_profiles
 
+    def has_reached_profile_limit(self, max_profiles):
+        """
+        Check whether extraction has produced the maximum number of activity profiles.
+        
+        Parameters:
+            max_profiles (int/None): The profile ceiling, or None for no ceiling.
+            
+        Returns:
+            bool: True if max_profiles is set and that many profiles exist, False otherwise.
+        """
+        return max_profiles is not None and len(self.activity_profiles) >= max_profiles
+
+    def get_cycle_pattern(self, cycle_idx):
+        """
+        Get the deterministic traversal pattern of a cycle.
+        
+        The pattern only depends on the arcs and vertices of the cycle, so it is built once
+        per cycle and served from cycle_pattern_cache afterwards.
+        
+        Parameters:
+            cycle_idx (int): Index of the cycle in cycle_list.
+            
+        Returns:
+            list/None: The arc strings of the cycle in traversal order, or None if the cycle
+                       has no arcs or vertices.
+        """
+        pattern = self.cycle_pattern_cache.get(cycle_idx, _MISSING)
+        if pattern is _MISSING:
+            pattern = self.build_cycle_pattern(cycle_idx)
+            self.cycle_pattern_cache[cycle_idx] = pattern
+        return pattern
+
+    def build_cycle_pattern(self, cycle_idx):
+        """
+        Build a fully ordered, deterministic traversal pattern for a cycle.
+        
+        The cycle vertices are visited in sorted order, joining consecutive vertices by a
+        path through the cycle arcs. Cycle arcs not covered by those paths are appended in
+        sorted order.
+        
+        Parameters:
+            cycle_idx (int): Index of the cycle in cycle_list.
+            
+        Returns:
+            list/None: The arc strings of the cycle in traversal order, or None if the cycle
+                       has no arcs or vertices.
+        """
+        # Get all arcs in this cycle
+        cycle_arcs = self.cycle_arcs.get(cycle_idx, [])
+        if not cycle_arcs:
+            return None
+        
+        # Find all vertices in the cycle
+        vtx_set = self.cycle_vertices[cycle_idx]
+        
+        # No pattern if no vertices
+        if not vtx_set:
+            return None
+        
+        # The key is to create a fully ordered, deterministic cycle pattern
+        # that includes all necessary arcs in the right sequence
+        standard_cycle = []
+        standard_cycle_arcs = set()  # Membership view of standard_cycle
+        sorted_cycle_arcs = sorted(cycle_arcs)
+        
+        # Extract vertices from cycle arcs and build adjacency
+        cycle_adjacency = defaultdict(list)
+        for arc_str in cycle_arcs:
+            try:
+                src, tgt = arc_str.split(', ')
+                if src in vtx_set and tgt in vtx_set:
+                    cycle_adjacency[src].append((tgt, arc_str))
+            except Exception:
+                continue
+        
+        # Ensure deterministic ordering of adjacency lists
+        for src in cycle_adjacency:
+            cycle_adjacency[src].sort(key=itemgetter(0))  # Sort by target vertex
+        
+        # First, build canonical ordering of vertices
+        ordered_vertices = sorted(vtx_set)
+        
+        # Create a fully deterministic cycle by connecting vertices in canonical order
+        for i in range(len(ordered_vertices)):
+            current_vtx = ordered_vertices[i]
+            next_vtx = ordered_vertices[(i + 1) % len(ordered_vertices)]
+            
+            # Find a path from current_vtx to next_vtx
+            path = self.find_path_in_adjacency(current_vtx, next_vtx, cycle_adjacency, set())
+            if path:
+                for arc in path:
+                    if arc not in standard_cycle_arcs:
+                        standard_cycle.append(arc)
+                        standard_cycle_arcs.add(arc)
+            else:
+                # If no direct path, add an arc if there's one in the cycle arcs
+                for arc_str in sorted_cycle_arcs:
+                    try:
+                        src, tgt = arc_str.split(', ')
+                        if src == current_vtx and tgt == next_vtx and arc_str not in standard_cycle_arcs:
+                            standard_cycle.append(arc_str)
+                            standard_cycle_arcs.add(arc_str)
+                            break
+                    except Exception:
+                        continue
+        
+        # Ensure all cycle arcs are included
+        for arc_str in sorted_cycle_arcs:
+            if arc_str not in standard_cycle_arcs:
+                standard_cycle.append(arc_str)
+                standard_cycle_arcs.add(arc_str)
+        
+        return standard_cycle
+
+    def extract_contract_arc_profile(self, job, arc_to_cycles, cycle_patterns):
+        """
+        Extract the activity profile of a single contraction-path arc.
+        
+        This is the unit of work used by extract_activity_profiles. It depends only on its
+        arguments and the state precomputed in __init__, so it can run in a worker process.
+        
+        Parameters:
+            job (tuple): (contract_arc, path_info, cycle_idx, max_l_attribute) as prepared
+                         by extract_activity_profiles.
+            arc_to_cycles (dict): Mapping of arcs to the indices of the cycles they belong to.
+            cycle_patterns (dict): Mapping of cycle indices to their traversal patterns.
+            
+        Returns:
+            dict: The extracted activity profile, or an empty profile if extraction failed.
+        """
+        contract_arc, path_info, cycle_idx, max_l_attribute = job
+        
+        try:
+            # Reset traversal tracking for each profile
+            self.traversed_arcs = set()
+            
+            # Get successful contractions for this path
+            successful_contractions = path_info.get('successful_contractions', [])
+            contract_arc_str = self.get_arc(contract_arc)
+            
+            # Find the original arc that matches the contract_arc
+            profile_arc = next(
+                (c for c in successful_contractions 
+                 if self.get_arc(c) == contract_arc_str),
+                None
+            )
+            
+            if not profile_arc:
+                contracted_path = path_info.get('contracted_path', [])
+                if contracted_path:
+                    profile_arc = contracted_path[0]
+                else:
+                    profile_arc = None
+            
+            # Determine if this arc is part of a cycle
+            in_cycle = contract_arc_str in arc_to_cycles
+            cycle_indices = arc_to_cycles.get(contract_arc_str, [])
+            
+            # For cycle arcs, we want to ensure the same traversal pattern
+            if in_cycle and cycle_idx is not None:
+                # Get the pre-built cycle pattern
+                standard_cycle = cycle_patterns.get(cycle_idx, [])
+                
+                # Generate profile using the standard cycle pattern and group's max l-attribute
+                profile = self.extract_profile_with_joins(
+                    profile_arc, 
+                    force_include=contract_arc,
+                    in_cycle=in_cycle,
+                    cycle_indices=cycle_indices,
+                    arc_to_cycles=arc_to_cycles,
+                    standard_cycle=standard_cycle,
+                    max_group_l_attribute=max_l_attribute
+                )
+            else:
+                # Normal processing for non-cycle arcs
+                profile = self.extract_profile_with_joins(
+                    profile_arc, 
+                    force_include=contract_arc,
+                    in_cycle=in_cycle,
+                    cycle_indices=cycle_indices,
+                    arc_to_cycles=arc_to_cycles
+                )
+        except Exception as e:
+            self.report_error(f"Error processing contract arc {contract_arc}: {str(e)}")
+            # Fall back to the default empty profile
+            profile = self.new_profile()
+        
+        return profile
+
     def extract_profile_with_joins(self, contract_arc=None, force_include=None, in_cycle=False, 
                                    cycle_indices=None, arc_to_cycles=None, standard_cycle=None,
                                    max_group_l_attribute=None):
@@ -856,24 +1193,13 @@ class ModifiedActivityExtraction:
         if force_include:
             contract_arc_str = self.get_arc(force_include)
             # Get l-attribute for the contract arc
-            for arc in self.R:
-                if self.get_arc(arc) == contract_arc_str:
-                    target_l_attribute = self.get_l_attribute(arc)
-                    break
+            target_l_attribute = self.l_attributes.get(contract_arc_str, 0)
 
-        # Build a graph representation for path finding
-        graph = defaultdict(list)
-        for arc in self.R:
-            arc_str = self.get_arc(arc)
-            try:
-                src, tgt = arc_str.split(', ')
-                graph[src].append((tgt, arc))
-            except Exception:
-                continue
+        # Pre-split endpoints of the arcs in R, used instead of re-splitting path arcs
+        arc_endpoints = self.arc_endpoints
         
-        # Ensure deterministic ordering of the graph adjacency lists
-        for src in graph:
-            graph[src].sort(key=lambda x: x[0])  # Sort by target vertex
+        # Graph representation for path finding, built once with sorted adjacency lists
+        graph = self.graph
         
         # Check for self-loop
         is_self_loop = False
@@ -934,19 +1260,10 @@ class ModifiedActivityExtraction:
                     activity_profile['S'][1] = {source_arc}
                 
                 # Clean up profile and return
-                activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-                return activity_profile
+                return self.compact_profile(activity_profile)
             
             # Check if the contract arc directly goes to a terminal node (not the sink)
-            outgoing_arcs = []
-            for arc in self.R:
-                arc_str = self.get_arc(arc)
-                try:
-                    src, _ = arc_str.split(', ')
-                    if src == contract_tgt:
-                        outgoing_arcs.append(arc_str)
-                except Exception:
-                    continue
+            outgoing_arcs = [arc_str for _, arc_str, _ in self.outgoing.get(contract_tgt, [])]
             
             # If target has no outgoing arcs and is not the sink, it's a terminal node
             is_terminal = len(outgoing_arcs) == 0 and contract_tgt != self.sink
@@ -960,14 +1277,10 @@ class ModifiedActivityExtraction:
                     for path_arc in path_to_contract:
                         # Define direct arc addition function for inline use
                         try:
-                            p_src, p_tgt = path_arc.split(', ')
+                            p_src, p_tgt = arc_endpoints.get(path_arc) or path_arc.split(', ')
                             
                             # Check L-attribute limit
-                            arc_l_attribute = 0
-                            for arc in self.R:
-                                if self.get_arc(arc) == path_arc:
-                                    arc_l_attribute = self.get_l_attribute(arc)
-                                    break
+                            arc_l_attribute = self.l_attributes.get(path_arc, 0)
                             
                             current_traversal_count = activity_profile['traversed_arcs'].get(path_arc, 0)
                             if current_traversal_count >= arc_l_attribute:
@@ -977,21 +1290,15 @@ class ModifiedActivityExtraction:
                                 break
                             
                             # Handle AND-joins
-                            if p_tgt in self.join_vertices and self.join_classifications[p_tgt]['type'] == 'AND-JOIN':
+                            if p_tgt in self.and_join_vertices:
                                 # Check if all sources are reachable
                                 unreachable_sources = []
                                 non_epsilon_sources = []
                                 
-                                for a in self.R:
-                                    a_str = self.get_arc(a)
-                                    try:
-                                        a_src, a_tgt = a_str.split(', ')
-                                        if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                            non_epsilon_sources.append(a_src)
-                                            if a_src not in activity_profile['visited_vertices'] and a_src != current_vertex and not self.is_vertex_reachable_from_source(a_src):
-                                                unreachable_sources.append(a_src)
-                                    except Exception:
-                                        continue
+                                for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                    non_epsilon_sources.append(a_src)
+                                    if a_src not in activity_profile['visited_vertices'] and a_src != current_vertex and not self.is_vertex_reachable_from_source(a_src):
+                                        unreachable_sources.append(a_src)
                                 
                                 if unreachable_sources:
                                     # Can't proceed due to unreachable sources
@@ -1002,19 +1309,13 @@ class ModifiedActivityExtraction:
                                 # Check if all required sources are available
                                 if all(s in activity_profile['visited_vertices'] or s == current_vertex for s in non_epsilon_sources):
                                     # Add all join arcs
-                                    for a in self.R:
-                                        a_str = self.get_arc(a)
-                                        try:
-                                            a_src, a_tgt = a_str.split(', ')
-                                            if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                                # Check L-attribute limit for join arc
-                                                a_l_attribute = self.get_l_attribute(a)
-                                                a_count = activity_profile['traversed_arcs'].get(a_str, 0)
-                                                if a_count < a_l_attribute:
-                                                    activity_profile['S'][timestep].add(a_str)
-                                                    activity_profile['traversed_arcs'][a_str] += 1
-                                        except Exception:
-                                            continue
+                                    for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                        # Check L-attribute limit for join arc
+                                        a_l_attribute = self.get_l_attribute(a)
+                                        a_count = activity_profile['traversed_arcs'].get(a_str, 0)
+                                        if a_count < a_l_attribute:
+                                            activity_profile['S'][timestep].add(a_str)
+                                            activity_profile['traversed_arcs'][a_str] += 1
                                     
                                     activity_profile['visited_vertices'].add(p_tgt)
                                     current_vertex = p_tgt
@@ -1028,7 +1329,7 @@ class ModifiedActivityExtraction:
                                 activity_profile['visited_vertices'].add(p_tgt)
                                 current_vertex = p_tgt
                         except Exception as e:
-                            print(f"Error processing arc {path_arc}: {str(e)}")
+                            self.report_error(f"Error processing arc {path_arc}: {str(e)}")
                             break
                         
                         timestep += 1
@@ -1045,22 +1346,16 @@ class ModifiedActivityExtraction:
                     activity_profile['violation_cause'] = f"Contract arc {contract_arc_str} is in failed contractions"
                     
                     # Clean up profile and return
-                    activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-                    return activity_profile
+                    return self.compact_profile(activity_profile)
                 
                 # Check if the contract target is an AND-join with unreachable sources
-                if contract_tgt in self.join_vertices and self.join_classifications[contract_tgt]['type'] == 'AND-JOIN':
+                if contract_tgt in self.and_join_vertices:
                     unreachable_sources = []
                     
-                    for a in self.R:
-                        a_str = self.get_arc(a)
-                        try:
-                            a_src, a_tgt = a_str.split(', ')
-                            if a_tgt == contract_tgt and self.get_c_attribute(a) != '0' and a_src != contract_src:
-                                if not self.is_vertex_reachable_from_source(a_src):
-                                    unreachable_sources.append(a_src)
-                        except Exception:
-                            continue
+                    for a_src, a_str, a in self.non_epsilon_incoming.get(contract_tgt, []):
+                        if a_src != contract_src:
+                            if not self.is_vertex_reachable_from_source(a_src):
+                                unreachable_sources.append(a_src)
                     
                     if unreachable_sources:
                         # Show the first step but then deadlock
@@ -1073,8 +1368,7 @@ class ModifiedActivityExtraction:
                         activity_profile['violation_cause'] = f"Deadlock at AND-join {contract_tgt}: unreachable sources {unreachable_sources}"
                         
                         # Clean up profile and return
-                        activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-                        return activity_profile
+                        return self.compact_profile(activity_profile)
                 
                 # Add the contract arc to the profile
                 activity_profile['S'][timestep].add(contract_arc_str)
@@ -1127,12 +1421,10 @@ class ModifiedActivityExtraction:
                             alt_timestep += 1
                         
                         # Clean up profile and return
-                        activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-                        return activity_profile
+                        return self.compact_profile(activity_profile)
                     
                     # If no alternative path found, just show the terminal arc
-                    activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-                    return activity_profile
+                    return self.compact_profile(activity_profile)
             
             # Find path from contract target to sink
             path_to_sink = self.find_path(current_vertex, self.sink, graph, set())
@@ -1141,14 +1433,10 @@ class ModifiedActivityExtraction:
                 for path_arc in path_to_sink:
                     # Direct arc addition - inline implementation
                     try:
-                        p_src, p_tgt = path_arc.split(', ')
+                        p_src, p_tgt = arc_endpoints.get(path_arc) or path_arc.split(', ')
                         
                         # Check L-attribute limit
-                        arc_l_attribute = 0
-                        for arc in self.R:
-                            if self.get_arc(arc) == path_arc:
-                                arc_l_attribute = self.get_l_attribute(arc)
-                                break
+                        arc_l_attribute = self.l_attributes.get(path_arc, 0)
                         
                         current_traversal_count = activity_profile['traversed_arcs'].get(path_arc, 0)
                         if current_traversal_count >= arc_l_attribute:
@@ -1158,21 +1446,15 @@ class ModifiedActivityExtraction:
                             break
                         
                         # Handle AND-joins
-                        if p_tgt in self.join_vertices and self.join_classifications[p_tgt]['type'] == 'AND-JOIN':
+                        if p_tgt in self.and_join_vertices:
                             # Check if all sources are reachable
                             unreachable_sources = []
                             non_epsilon_sources = []
                             
-                            for a in self.R:
-                                a_str = self.get_arc(a)
-                                try:
-                                    a_src, a_tgt = a_str.split(', ')
-                                    if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                        non_epsilon_sources.append(a_src)
-                                        if a_src not in activity_profile['visited_vertices'] and a_src != current_vertex and not self.is_vertex_reachable_from_source(a_src):
-                                            unreachable_sources.append(a_src)
-                                except Exception:
-                                    continue
+                            for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                non_epsilon_sources.append(a_src)
+                                if a_src not in activity_profile['visited_vertices'] and a_src != current_vertex and not self.is_vertex_reachable_from_source(a_src):
+                                    unreachable_sources.append(a_src)
                             
                             if unreachable_sources:
                                 # Can't proceed due to unreachable sources
@@ -1183,19 +1465,13 @@ class ModifiedActivityExtraction:
                             # Check if all required sources are available
                             if all(s in activity_profile['visited_vertices'] or s == current_vertex for s in non_epsilon_sources):
                                 # Add all join arcs
-                                for a in self.R:
-                                    a_str = self.get_arc(a)
-                                    try:
-                                        a_src, a_tgt = a_str.split(', ')
-                                        if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                            # Check L-attribute limit for join arc
-                                            a_l_attribute = self.get_l_attribute(a)
-                                            a_count = activity_profile['traversed_arcs'].get(a_str, 0)
-                                            if a_count < a_l_attribute:
-                                                activity_profile['S'][timestep].add(a_str)
-                                                activity_profile['traversed_arcs'][a_str] += 1
-                                    except Exception:
-                                        continue
+                                for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                    # Check L-attribute limit for join arc
+                                    a_l_attribute = self.get_l_attribute(a)
+                                    a_count = activity_profile['traversed_arcs'].get(a_str, 0)
+                                    if a_count < a_l_attribute:
+                                        activity_profile['S'][timestep].add(a_str)
+                                        activity_profile['traversed_arcs'][a_str] += 1
                                 
                                 activity_profile['visited_vertices'].add(p_tgt)
                                 current_vertex = p_tgt
@@ -1209,7 +1485,7 @@ class ModifiedActivityExtraction:
                             activity_profile['visited_vertices'].add(p_tgt)
                             current_vertex = p_tgt
                     except Exception as e:
-                        print(f"Error processing arc {path_arc}: {str(e)}")
+                        self.report_error(f"Error processing arc {path_arc}: {str(e)}")
                         break
                     
                     timestep += 1
@@ -1220,8 +1496,7 @@ class ModifiedActivityExtraction:
                 activity_profile['sink_timestep'] = timestep - 1
             
             # Clean up profile and return
-            activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-            return activity_profile
+            return self.compact_profile(activity_profile)
         
         # Handle self-loops specially
         if is_self_loop:
@@ -1235,14 +1510,10 @@ class ModifiedActivityExtraction:
                     for path_arc in path_to_loop:
                         # Direct arc addition - inline implementation
                         try:
-                            p_src, p_tgt = path_arc.split(', ')
+                            p_src, p_tgt = arc_endpoints.get(path_arc) or path_arc.split(', ')
                             
                             # Check L-attribute limit
-                            arc_l_attribute = 0
-                            for arc in self.R:
-                                if self.get_arc(arc) == path_arc:
-                                    arc_l_attribute = self.get_l_attribute(arc)
-                                    break
+                            arc_l_attribute = self.l_attributes.get(path_arc, 0)
                             
                             current_traversal_count = activity_profile['traversed_arcs'].get(path_arc, 0)
                             if current_traversal_count >= arc_l_attribute:
@@ -1252,21 +1523,15 @@ class ModifiedActivityExtraction:
                                 break
                             
                             # Handle AND-joins
-                            if p_tgt in self.join_vertices and self.join_classifications[p_tgt]['type'] == 'AND-JOIN':
+                            if p_tgt in self.and_join_vertices:
                                 # Check if all sources are reachable
                                 unreachable_sources = []
                                 non_epsilon_sources = []
                                 
-                                for a in self.R:
-                                    a_str = self.get_arc(a)
-                                    try:
-                                        a_src, a_tgt = a_str.split(', ')
-                                        if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                            non_epsilon_sources.append(a_src)
-                                            if a_src not in activity_profile['visited_vertices'] and a_src != current_vertex and not self.is_vertex_reachable_from_source(a_src):
-                                                unreachable_sources.append(a_src)
-                                    except Exception:
-                                        continue
+                                for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                    non_epsilon_sources.append(a_src)
+                                    if a_src not in activity_profile['visited_vertices'] and a_src != current_vertex and not self.is_vertex_reachable_from_source(a_src):
+                                        unreachable_sources.append(a_src)
                                 
                                 if unreachable_sources:
                                     # Can't proceed due to unreachable sources
@@ -1277,19 +1542,13 @@ class ModifiedActivityExtraction:
                                 # Check if all required sources are available
                                 if all(s in activity_profile['visited_vertices'] or s == current_vertex for s in non_epsilon_sources):
                                     # Add all join arcs
-                                    for a in self.R:
-                                        a_str = self.get_arc(a)
-                                        try:
-                                            a_src, a_tgt = a_str.split(', ')
-                                            if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                                # Check L-attribute limit for join arc
-                                                a_l_attribute = self.get_l_attribute(a)
-                                                a_count = activity_profile['traversed_arcs'].get(a_str, 0)
-                                                if a_count < a_l_attribute:
-                                                    activity_profile['S'][timestep].add(a_str)
-                                                    activity_profile['traversed_arcs'][a_str] += 1
-                                        except Exception:
-                                            continue
+                                    for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                        # Check L-attribute limit for join arc
+                                        a_l_attribute = self.get_l_attribute(a)
+                                        a_count = activity_profile['traversed_arcs'].get(a_str, 0)
+                                        if a_count < a_l_attribute:
+                                            activity_profile['S'][timestep].add(a_str)
+                                            activity_profile['traversed_arcs'][a_str] += 1
                                     
                                     activity_profile['visited_vertices'].add(p_tgt)
                                     current_vertex = p_tgt
@@ -1300,7 +1559,7 @@ class ModifiedActivityExtraction:
                                 activity_profile['visited_vertices'].add(p_tgt)
                                 current_vertex = p_tgt
                         except Exception as e:
-                            print(f"Error processing arc {path_arc}: {str(e)}")
+                            self.report_error(f"Error processing arc {path_arc}: {str(e)}")
                             break
                         
                         timestep += 1
@@ -1315,8 +1574,7 @@ class ModifiedActivityExtraction:
                 activity_profile['violation_cause'] = f"Self-loop arc {contract_arc_str} is in failed contractions"
                 
                 # Clean up profile and return
-                activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-                return activity_profile
+                return self.compact_profile(activity_profile)
                 
             # Even if the self-loop arc is in failed contractions, we should try to traverse it
             # for the purpose of the activity profile
@@ -1339,14 +1597,10 @@ class ModifiedActivityExtraction:
                 for path_arc in path_to_sink:
                     # Inline the add_arc_to_profile functionality
                     try:
-                        src, tgt = path_arc.split(', ')
+                        src, tgt = arc_endpoints.get(path_arc) or path_arc.split(', ')
                         
                         # Check if we've already reached the L-attribute limit for this arc
-                        arc_l_attribute = 0
-                        for arc in self.R:
-                            if self.get_arc(arc) == path_arc:
-                                arc_l_attribute = self.get_l_attribute(arc)
-                                break
+                        arc_l_attribute = self.l_attributes.get(path_arc, 0)
                         
                         current_traversal_count = activity_profile['traversed_arcs'].get(path_arc, 0)
                         if current_traversal_count >= arc_l_attribute:
@@ -1356,23 +1610,17 @@ class ModifiedActivityExtraction:
                             continue
                         
                         # Check for joins
-                        if tgt in self.join_vertices and self.join_classifications[tgt]['type'] == 'AND-JOIN':
+                        if tgt in self.and_join_vertices:
                             # For AND-JOIN, check if all incoming sources are reachable
                             unreachable_sources = []
                             
                             # Find all incoming arcs with non-epsilon c-attributes
                             non_epsilon_sources = []
-                            for a in self.R:
-                                a_str = self.get_arc(a)
-                                try:
-                                    a_src, a_tgt = a_str.split(', ')
-                                    if a_tgt == tgt and self.get_c_attribute(a) != '0':
-                                        non_epsilon_sources.append(a_src)
-                                        # Check if this source is reachable from the starting point
-                                        if a_src not in activity_profile['visited_vertices'] and not self.is_vertex_reachable_from_source(a_src):
-                                            unreachable_sources.append(a_src)
-                                except Exception:
-                                    continue
+                            for a_src, a_str, a in self.non_epsilon_incoming.get(tgt, []):
+                                non_epsilon_sources.append(a_src)
+                                # Check if this source is reachable from the starting point
+                                if a_src not in activity_profile['visited_vertices'] and not self.is_vertex_reachable_from_source(a_src):
+                                    unreachable_sources.append(a_src)
                             
                             # If any source is unreachable, mark as deadlock
                             if unreachable_sources:
@@ -1383,19 +1631,13 @@ class ModifiedActivityExtraction:
                             # If all sources are either visited or reachable, proceed with the join
                             if all(s in activity_profile['visited_vertices'] or s == current_vertex for s in non_epsilon_sources):
                                 # Add all join arcs to the same timestep
-                                for a in self.R:
-                                    a_str = self.get_arc(a)
-                                    try:
-                                        a_src, a_tgt = a_str.split(', ')
-                                        if a_tgt == tgt and self.get_c_attribute(a) != '0':
-                                            # Check L-attribute limit for each join arc
-                                            a_l_attribute = self.get_l_attribute(a)
-                                            a_traversal_count = activity_profile['traversed_arcs'].get(a_str, 0)
-                                            if a_traversal_count < a_l_attribute:
-                                                activity_profile['S'][timestep].add(a_str)
-                                                activity_profile['traversed_arcs'][a_str] += 1
-                                    except Exception:
-                                        continue
+                                for a_src, a_str, a in self.non_epsilon_incoming.get(tgt, []):
+                                    # Check L-attribute limit for each join arc
+                                    a_l_attribute = self.get_l_attribute(a)
+                                    a_traversal_count = activity_profile['traversed_arcs'].get(a_str, 0)
+                                    if a_traversal_count < a_l_attribute:
+                                        activity_profile['S'][timestep].add(a_str)
+                                        activity_profile['traversed_arcs'][a_str] += 1
                                 
                                 activity_profile['visited_vertices'].add(tgt)
                                 current_vertex = tgt
@@ -1409,7 +1651,7 @@ class ModifiedActivityExtraction:
                             activity_profile['visited_vertices'].add(tgt)
                             current_vertex = tgt
                     except Exception as e:
-                        print(f"Error processing arc {path_arc}: {str(e)}")
+                        self.report_error(f"Error processing arc {path_arc}: {str(e)}")
                         continue
                     
                     timestep += 1
@@ -1420,8 +1662,7 @@ class ModifiedActivityExtraction:
                 activity_profile['sink_timestep'] = timestep - 1
             
             # Clean up profile and return
-            activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-            return activity_profile
+            return self.compact_profile(activity_profile)
         
         # For regular cycles, use the provided standard cycle if available
         if in_cycle and not is_self_loop:
@@ -1443,23 +1684,9 @@ class ModifiedActivityExtraction:
                 
                 if cycle_indices:
                     for cycle_idx in cycle_indices:
-                        cycle_info = self.cycle_list[cycle_idx]
-                        cycle = None
-                        if isinstance(cycle_info, dict) and 'cycle' in cycle_info:
-                            cycle = cycle_info['cycle']
-                        elif isinstance(cycle_info, list):
-                            cycle = cycle_info
-                        
-                        if cycle:
-                            for arc in cycle:
-                                arc_str = self.get_arc(arc)
-                                try:
-                                    src, tgt = arc_str.split(', ')
-                                    cycle_vertices.add(src)
-                                    cycle_vertices.add(tgt)
-                                    cycle_arcs.append(arc_str)
-                                except Exception:
-                                    continue
+                        if cycle_idx in self.cycle_arcs:
+                            cycle_vertices.update(self.cycle_vertices[cycle_idx])
+                            cycle_arcs.extend(self.cycle_arcs[cycle_idx])
                 
                 # No standard cycle, build one now
                 if not standard_cycle:
@@ -1497,8 +1724,7 @@ class ModifiedActivityExtraction:
                     activity_profile['S'][1].add(self.get_source_arc())  # Always show we started from source
                     
                     # Clean up profile and return
-                    activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-                    return activity_profile
+                    return self.compact_profile(activity_profile)
                 
                 # Find first vertex in the standard cycle
                 try:
@@ -1524,14 +1750,10 @@ class ModifiedActivityExtraction:
                         for path_arc in path_to_cycle:
                             # Direct arc addition - inline implementation
                             try:
-                                p_src, p_tgt = path_arc.split(', ')
+                                p_src, p_tgt = arc_endpoints.get(path_arc) or path_arc.split(', ')
                                 
                                 # Check L-attribute limit
-                                arc_l_attribute = 0
-                                for arc in self.R:
-                                    if self.get_arc(arc) == path_arc:
-                                        arc_l_attribute = self.get_l_attribute(arc)
-                                        break
+                                arc_l_attribute = self.l_attributes.get(path_arc, 0)
                                 
                                 current_traversal_count = activity_profile['traversed_arcs'].get(path_arc, 0)
                                 if current_traversal_count >= arc_l_attribute:
@@ -1541,21 +1763,15 @@ class ModifiedActivityExtraction:
                                     break
                                 
                                 # Handle AND-joins
-                                if p_tgt in self.join_vertices and self.join_classifications[p_tgt]['type'] == 'AND-JOIN':
+                                if p_tgt in self.and_join_vertices:
                                     # Check if all sources are reachable
                                     unreachable_sources = []
                                     non_epsilon_sources = []
                                     
-                                    for a in self.R:
-                                        a_str = self.get_arc(a)
-                                        try:
-                                            a_src, a_tgt = a_str.split(', ')
-                                            if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                                non_epsilon_sources.append(a_src)
-                                                if a_src not in activity_profile['visited_vertices'] and a_src != current_vertex and not self.is_vertex_reachable_from_source(a_src):
-                                                    unreachable_sources.append(a_src)
-                                        except Exception:
-                                            continue
+                                    for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                        non_epsilon_sources.append(a_src)
+                                        if a_src not in activity_profile['visited_vertices'] and a_src != current_vertex and not self.is_vertex_reachable_from_source(a_src):
+                                            unreachable_sources.append(a_src)
                                     
                                     if unreachable_sources:
                                         # Can't proceed due to unreachable sources
@@ -1566,19 +1782,13 @@ class ModifiedActivityExtraction:
                                     # Check if all required sources are available
                                     if all(s in activity_profile['visited_vertices'] or s == current_vertex for s in non_epsilon_sources):
                                         # Add all join arcs
-                                        for a in self.R:
-                                            a_str = self.get_arc(a)
-                                            try:
-                                                a_src, a_tgt = a_str.split(', ')
-                                                if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                                    # Check L-attribute limit for join arc
-                                                    a_l_attribute = self.get_l_attribute(a)
-                                                    a_count = activity_profile['traversed_arcs'].get(a_str, 0)
-                                                    if a_count < a_l_attribute:
-                                                        activity_profile['S'][timestep].add(a_str)
-                                                        activity_profile['traversed_arcs'][a_str] += 1
-                                            except Exception:
-                                                continue
+                                        for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                            # Check L-attribute limit for join arc
+                                            a_l_attribute = self.get_l_attribute(a)
+                                            a_count = activity_profile['traversed_arcs'].get(a_str, 0)
+                                            if a_count < a_l_attribute:
+                                                activity_profile['S'][timestep].add(a_str)
+                                                activity_profile['traversed_arcs'][a_str] += 1
                                         
                                         activity_profile['visited_vertices'].add(p_tgt)
                                         current_cycle_vertex = p_tgt
@@ -1592,7 +1802,7 @@ class ModifiedActivityExtraction:
                                     activity_profile['visited_vertices'].add(p_tgt)
                                     current_cycle_vertex = p_tgt
                             except Exception as e:
-                                print(f"Error processing arc {path_arc}: {str(e)}")
+                                self.report_error(f"Error processing arc {path_arc}: {str(e)}")
                                 break
                             
                             timestep += 1
@@ -1604,14 +1814,10 @@ class ModifiedActivityExtraction:
                             for path_arc in path:
                                 # Direct arc addition - inline implementation
                                 try:
-                                    p_src, p_tgt = path_arc.split(', ')
+                                    p_src, p_tgt = arc_endpoints.get(path_arc) or path_arc.split(', ')
                                     
                                     # Check L-attribute limit
-                                    arc_l_attribute = 0
-                                    for arc in self.R:
-                                        if self.get_arc(arc) == path_arc:
-                                            arc_l_attribute = self.get_l_attribute(arc)
-                                            break
+                                    arc_l_attribute = self.l_attributes.get(path_arc, 0)
                                     
                                     current_traversal_count = activity_profile['traversed_arcs'].get(path_arc, 0)
                                     if current_traversal_count >= arc_l_attribute:
@@ -1621,21 +1827,15 @@ class ModifiedActivityExtraction:
                                         break
                                     
                                     # Handle AND-joins
-                                    if p_tgt in self.join_vertices and self.join_classifications[p_tgt]['type'] == 'AND-JOIN':
+                                    if p_tgt in self.and_join_vertices:
                                         # Check if all sources are reachable
                                         unreachable_sources = []
                                         non_epsilon_sources = []
                                         
-                                        for a in self.R:
-                                            a_str = self.get_arc(a)
-                                            try:
-                                                a_src, a_tgt = a_str.split(', ')
-                                                if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                                    non_epsilon_sources.append(a_src)
-                                                    if a_src not in activity_profile['visited_vertices'] and a_src != current_vertex and not self.is_vertex_reachable_from_source(a_src):
-                                                        unreachable_sources.append(a_src)
-                                            except Exception:
-                                                continue
+                                        for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                            non_epsilon_sources.append(a_src)
+                                            if a_src not in activity_profile['visited_vertices'] and a_src != current_vertex and not self.is_vertex_reachable_from_source(a_src):
+                                                unreachable_sources.append(a_src)
                                         
                                         if unreachable_sources:
                                             # Can't proceed due to unreachable sources
@@ -1646,19 +1846,13 @@ class ModifiedActivityExtraction:
                                         # Check if all required sources are available
                                         if all(s in activity_profile['visited_vertices'] or s == current_vertex for s in non_epsilon_sources):
                                             # Add all join arcs
-                                            for a in self.R:
-                                                a_str = self.get_arc(a)
-                                                try:
-                                                    a_src, a_tgt = a_str.split(', ')
-                                                    if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                                        # Check L-attribute limit for join arc
-                                                        a_l_attribute = self.get_l_attribute(a)
-                                                        a_count = activity_profile['traversed_arcs'].get(a_str, 0)
-                                                        if a_count < a_l_attribute:
-                                                            activity_profile['S'][timestep].add(a_str)
-                                                            activity_profile['traversed_arcs'][a_str] += 1
-                                                except Exception:
-                                                    continue
+                                            for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                                # Check L-attribute limit for join arc
+                                                a_l_attribute = self.get_l_attribute(a)
+                                                a_count = activity_profile['traversed_arcs'].get(a_str, 0)
+                                                if a_count < a_l_attribute:
+                                                    activity_profile['S'][timestep].add(a_str)
+                                                    activity_profile['traversed_arcs'][a_str] += 1
                                             
                                             activity_profile['visited_vertices'].add(p_tgt)
                                             current_cycle_vertex = p_tgt
@@ -1672,7 +1866,7 @@ class ModifiedActivityExtraction:
                                         activity_profile['visited_vertices'].add(p_tgt)
                                         current_cycle_vertex = p_tgt
                                 except Exception as e:
-                                    print(f"Error processing arc {path_arc}: {str(e)}")
+                                    self.report_error(f"Error processing arc {path_arc}: {str(e)}")
                                     break
                                 
                                 timestep += 1
@@ -1686,15 +1880,7 @@ class ModifiedActivityExtraction:
                     _, contract_tgt = contract_arc_str.split(', ')
                     
                     # Find outgoing arcs from this target
-                    outgoing_arcs = []
-                    for arc in self.R:
-                        arc_str = self.get_arc(arc)
-                        try:
-                            src, _ = arc_str.split(', ')
-                            if src == contract_tgt:
-                                outgoing_arcs.append(arc_str)
-                        except Exception:
-                            continue
+                    outgoing_arcs = [arc_str for _, arc_str, _ in self.outgoing.get(contract_tgt, [])]
                     
                     # If there are outgoing arcs, prioritize natural flow over cycle traversal
                     # but ONLY if we've exhausted the contract arc's l-attribute or if
@@ -1723,11 +1909,7 @@ class ModifiedActivityExtraction:
                                         continue
                                     
                                     # Skip arcs that have reached L-attribute limit
-                                    arc_l_attribute = 0
-                                    for arc in self.R:
-                                        if self.get_arc(arc) == out_arc:
-                                            arc_l_attribute = self.get_l_attribute(arc)
-                                            break
+                                    arc_l_attribute = self.l_attributes.get(out_arc, 0)
                                     
                                     current_traversal_count = activity_profile['traversed_arcs'].get(out_arc, 0)
                                     if current_traversal_count >= arc_l_attribute:
@@ -1760,12 +1942,11 @@ class ModifiedActivityExtraction:
                                             activity_profile['sink_timestep'] = timestep - 1
                                             
                                             # Clean up and return
-                                            activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-                                            return activity_profile
+                                            return self.compact_profile(activity_profile)
                                 except Exception as e:
-                                    print(f"Error processing outgoing arc {out_arc}: {str(e)}")
+                                    self.report_error(f"Error processing outgoing arc {out_arc}: {str(e)}")
                 except Exception as e:
-                    print(f"Error prioritizing outgoing arcs: {str(e)}")
+                    self.report_error(f"Error prioritizing outgoing arcs: {str(e)}")
 
             # Use group's max l-attribute if provided for consistent traversal patterns
             l_attribute_to_use = max_group_l_attribute if max_group_l_attribute is not None else target_l_attribute
@@ -1773,14 +1954,13 @@ class ModifiedActivityExtraction:
             # Create a canonical complete cycle pattern
             # This ensures all arcs are included in the same consistent order
             canonical_cycle = []
+            canonical_cycle_arcs = set()  # Membership view of canonical_cycle
             
             # Get all vertices and source->target mappings
-            cycle_vertices_dict = {}
+            cycle_vertices_dict = defaultdict(set)
             for arc_str in standard_cycle:
                 try:
                     src, tgt = arc_str.split(', ')
-                    if src not in cycle_vertices_dict:
-                        cycle_vertices_dict[src] = set()
                     cycle_vertices_dict[src].add(tgt)
                 except Exception:
                     continue
@@ -1802,15 +1982,17 @@ class ModifiedActivityExtraction:
                     vtx_path = self.find_path(prev_vtx, vtx, graph, set())
                     if vtx_path:
                         for arc in vtx_path:
-                            if arc not in canonical_cycle:
+                            if arc not in canonical_cycle_arcs:
                                 canonical_cycle.append(arc)
+                                canonical_cycle_arcs.add(arc)
                 
                 # Add all outgoing arcs from this vertex to the canonical cycle
                 if vtx in cycle_vertices_dict:
                     for tgt in sorted(cycle_vertices_dict[vtx]):
                         arc_to_add = f"{vtx}, {tgt}"
-                        if arc_to_add not in canonical_cycle:
+                        if arc_to_add not in canonical_cycle_arcs:
                             canonical_cycle.append(arc_to_add)
+                            canonical_cycle_arcs.add(arc_to_add)
                 
                 prev_vtx = vtx
             
@@ -1820,20 +2002,19 @@ class ModifiedActivityExtraction:
                 close_path = self.find_path(prev_vtx, first_vtx, graph, set())
                 if close_path:
                     for arc in close_path:
-                        if arc not in canonical_cycle:
+                        if arc not in canonical_cycle_arcs:
                             canonical_cycle.append(arc)
+                            canonical_cycle_arcs.add(arc)
             
             # Ensure all standard cycle arcs are included
             for arc in sorted(standard_cycle):
-                if arc not in canonical_cycle:
+                if arc not in canonical_cycle_arcs:
                     canonical_cycle.append(arc)
+                    canonical_cycle_arcs.add(arc)
             
             # Calculate number of cycle iterations to traverse
             # Count how many times the contract arc appears in one iteration of the cycle
-            contract_arc_count_per_cycle = 0
-            for arc in canonical_cycle:
-                if arc == contract_arc_str:
-                    contract_arc_count_per_cycle += 1
+            contract_arc_count_per_cycle = canonical_cycle.count(contract_arc_str)
             
             # Calculate cycles needed based on l-attribute
             if contract_arc_count_per_cycle > 0:
@@ -1845,20 +2026,19 @@ class ModifiedActivityExtraction:
                 canonical_cycle.append(contract_arc_str)
                 contract_arc_count_per_cycle = 1
             
-            # Build the complete expanded cycle including all iterations
-            # Make sure to include enough iterations to exhaust the contract arc's l-attribute
-            expanded_cycle = []
-            for _ in range(cycles_needed + 1):  # Add an extra iteration to be safe
-                expanded_cycle.extend(canonical_cycle)
+            # Walk the complete expanded cycle including all iterations
+            # Make sure to include enough iterations to exhaust the contract arc's l-attribute.
+            # The iterations are chained lazily rather than copied into one long list.
+            expanded_cycle = chain.from_iterable(repeat(canonical_cycle, cycles_needed + 1))  # Add an extra iteration to be safe
             
             # Traverse the cycle
             contract_arc_traversed = 0
             current_cycle_vertex = None
             path_to_sink_found = False
             
-            for arc_idx, arc_str in enumerate(expanded_cycle):
+            for arc_str in expanded_cycle:
                 try:
-                    src, tgt = arc_str.split(', ')
+                    src, tgt = arc_endpoints.get(arc_str) or arc_str.split(', ')
                     
                     # Initialize current vertex if not set
                     if current_cycle_vertex is None:
@@ -1869,18 +2049,13 @@ class ModifiedActivityExtraction:
                         continue
                     
                     # Check if the target vertex is reachable via AND-join conditions
-                    if tgt in self.join_vertices and self.join_classifications[tgt]['type'] == 'AND-JOIN':
+                    if tgt in self.and_join_vertices:
                         # Check if all sources for this AND-join are reachable
                         unreachable_sources = []
-                        for a in self.R:
-                            a_str = self.get_arc(a)
-                            try:
-                                a_src, a_tgt = a_str.split(', ')
-                                if a_tgt == tgt and self.get_c_attribute(a) != '0' and a_src != src:
-                                    if not self.is_vertex_reachable_from_source(a_src) and a_src not in activity_profile['visited_vertices']:
-                                        unreachable_sources.append(a_src)
-                            except Exception:
-                                continue
+                        for a_src, a_str, a in self.non_epsilon_incoming.get(tgt, []):
+                            if a_src != src:
+                                if not self.is_vertex_reachable_from_source(a_src) and a_src not in activity_profile['visited_vertices']:
+                                    unreachable_sources.append(a_src)
                         
                         if unreachable_sources:
                             # Can't proceed past this AND-join
@@ -1888,22 +2063,17 @@ class ModifiedActivityExtraction:
                             activity_profile['violation_cause'] = f"Deadlock at AND-join {tgt}: unreachable sources {unreachable_sources}"
                             
                             # Clean up profile and return
-                            activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-                            return activity_profile
+                            return self.compact_profile(activity_profile)
                     
                     # Check if this is the contract arc
                     if arc_str == contract_arc_str:
                         # Skip if this arc is a failed contraction
                         if contract_arc_str in self.failed_contractions:
-                            # Check if we already have a starting point
-                            if len(activity_profile['S']) == 0:
-                                source_arc = self.get_source_arc()
                             activity_profile['deadlock'] = True
                             activity_profile['violation_cause'] = f"Contract arc {contract_arc_str} is in failed contractions"
                             
                             # Clean up profile and return
-                            activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-                            return activity_profile
+                            return self.compact_profile(activity_profile)
                         
                         # Check if we've reached the L-attribute limit
                         if contract_arc_traversed >= target_l_attribute:
@@ -1913,11 +2083,7 @@ class ModifiedActivityExtraction:
                         contract_arc_traversed += 1
                     
                     # Check if we've reached the L-attribute limit for this arc
-                    arc_l_attribute = 0
-                    for arc in self.R:
-                        if self.get_arc(arc) == arc_str:
-                            arc_l_attribute = self.get_l_attribute(arc)
-                            break
+                    arc_l_attribute = self.l_attributes.get(arc_str, 0)
                     
                     current_traversal_count = activity_profile['traversed_arcs'].get(arc_str, 0)
                     if current_traversal_count >= arc_l_attribute:
@@ -1925,21 +2091,15 @@ class ModifiedActivityExtraction:
                         continue
                     
                     # Process AND-JOINs specially
-                    if tgt in self.join_vertices and self.join_classifications[tgt]['type'] == 'AND-JOIN':
+                    if tgt in self.and_join_vertices:
                         # Find all incoming arcs to this join
                         join_arcs = []
-                        for join_arc in self.R:
-                            join_arc_str = self.get_arc(join_arc)
-                            try:
-                                join_src, join_tgt = join_arc_str.split(', ')
-                                if join_tgt == tgt and self.get_c_attribute(join_arc) != '0':
-                                    join_arcs.append(join_arc_str)
-                                    
-                                    # Count if this is the contract arc
-                                    if join_arc_str == contract_arc_str:
-                                        contract_arc_traversed += 1
-                            except Exception:
-                                continue
+                        for _, join_arc_str, _ in self.non_epsilon_incoming.get(tgt, []):
+                            join_arcs.append(join_arc_str)
+                            
+                            # Count if this is the contract arc
+                            if join_arc_str == contract_arc_str:
+                                contract_arc_traversed += 1
                         
                         # Add all join arcs to the same timestep
                         for join_arc in join_arcs:
@@ -1965,14 +2125,10 @@ class ModifiedActivityExtraction:
                                 for path_arc in path_to_sink:
                                     # Inline arc addition logic
                                     try:
-                                        p_src, p_tgt = path_arc.split(', ')
+                                        p_src, p_tgt = arc_endpoints.get(path_arc) or path_arc.split(', ')
                                         
                                         # Check L-attribute limit
-                                        arc_l_attribute = 0
-                                        for arc in self.R:
-                                            if self.get_arc(arc) == path_arc:
-                                                arc_l_attribute = self.get_l_attribute(arc)
-                                                break
+                                        arc_l_attribute = self.l_attributes.get(path_arc, 0)
                                         
                                         current_traversal_count = activity_profile['traversed_arcs'].get(path_arc, 0)
                                         if current_traversal_count >= arc_l_attribute:
@@ -1982,23 +2138,17 @@ class ModifiedActivityExtraction:
                                             break
                                         
                                         # Handle AND-joins
-                                        if p_tgt in self.join_vertices and self.join_classifications[p_tgt]['type'] == 'AND-JOIN':
+                                        if p_tgt in self.and_join_vertices:
                                             # For AND-JOIN, check if all incoming sources are reachable
                                             unreachable_sources = []
                                             
                                             # Find all incoming arcs with non-epsilon c-attributes
                                             non_epsilon_sources = []
-                                            for a in self.R:
-                                                a_str = self.get_arc(a)
-                                                try:
-                                                    a_src, a_tgt = a_str.split(', ')
-                                                    if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                                        non_epsilon_sources.append(a_src)
-                                                        # Check if this source is reachable from the starting point
-                                                        if a_src not in activity_profile['visited_vertices'] and not self.is_vertex_reachable_from_source(a_src):
-                                                            unreachable_sources.append(a_src)
-                                                except Exception:
-                                                    continue
+                                            for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                                non_epsilon_sources.append(a_src)
+                                                # Check if this source is reachable from the starting point
+                                                if a_src not in activity_profile['visited_vertices'] and not self.is_vertex_reachable_from_source(a_src):
+                                                    unreachable_sources.append(a_src)
                                             
                                             # If any source is unreachable, mark as deadlock
                                             if unreachable_sources:
@@ -2009,19 +2159,13 @@ class ModifiedActivityExtraction:
                                             # If all sources are either visited or reachable, proceed with the join
                                             if all(s in activity_profile['visited_vertices'] or s == current_cycle_vertex for s in non_epsilon_sources):
                                                 # Add all join arcs to the same timestep
-                                                for a in self.R:
-                                                    a_str = self.get_arc(a)
-                                                    try:
-                                                        a_src, a_tgt = a_str.split(', ')
-                                                        if a_tgt == p_tgt and self.get_c_attribute(a) != '0':
-                                                            # Check L-attribute limit for each join arc
-                                                            a_l_attribute = self.get_l_attribute(a)
-                                                            a_traversal_count = activity_profile['traversed_arcs'].get(a_str, 0)
-                                                            if a_traversal_count < a_l_attribute:
-                                                                activity_profile['S'][timestep].add(a_str)
-                                                                activity_profile['traversed_arcs'][a_str] += 1
-                                                    except Exception:
-                                                        continue
+                                                for a_src, a_str, a in self.non_epsilon_incoming.get(p_tgt, []):
+                                                    # Check L-attribute limit for each join arc
+                                                    a_l_attribute = self.get_l_attribute(a)
+                                                    a_traversal_count = activity_profile['traversed_arcs'].get(a_str, 0)
+                                                    if a_traversal_count < a_l_attribute:
+                                                        activity_profile['S'][timestep].add(a_str)
+                                                        activity_profile['traversed_arcs'][a_str] += 1
                                                     
                                                 activity_profile['visited_vertices'].add(p_tgt)
                                                 current_cycle_vertex = p_tgt
@@ -2035,13 +2179,13 @@ class ModifiedActivityExtraction:
                                             activity_profile['visited_vertices'].add(p_tgt)
                                             current_cycle_vertex = p_tgt
                                     except Exception as e:
-                                        print(f"Error processing arc {path_arc}: {str(e)}")
+                                        self.report_error(f"Error processing arc {path_arc}: {str(e)}")
                                         break
                                     
                                     timestep += 1
                 
                 except Exception as e:
-                    print(f"Error processing arc {arc_str}: {str(e)}")
+                    self.report_error(f"Error processing arc {arc_str}: {str(e)}")
                     continue
             
             # If we haven't found a path to the sink yet, try now
@@ -2051,14 +2195,10 @@ class ModifiedActivityExtraction:
                     for path_arc in path_to_sink:
                         # Inline the add_arc_to_profile functionality
                         try:
-                            src, tgt = path_arc.split(', ')
+                            src, tgt = arc_endpoints.get(path_arc) or path_arc.split(', ')
                             
                             # Check if we've already reached the L-attribute limit for this arc
-                            arc_l_attribute = 0
-                            for arc in self.R:
-                                if self.get_arc(arc) == path_arc:
-                                    arc_l_attribute = self.get_l_attribute(arc)
-                                    break
+                            arc_l_attribute = self.l_attributes.get(path_arc, 0)
                             
                             current_traversal_count = activity_profile['traversed_arcs'].get(path_arc, 0)
                             if current_traversal_count >= arc_l_attribute:
@@ -2068,23 +2208,17 @@ class ModifiedActivityExtraction:
                                 continue
                             
                             # Check for joins
-                            if tgt in self.join_vertices and self.join_classifications[tgt]['type'] == 'AND-JOIN':
+                            if tgt in self.and_join_vertices:
                                 # For AND-JOIN, check if all incoming sources are reachable
                                 unreachable_sources = []
                                 
                                 # Find all incoming arcs with non-epsilon c-attributes
                                 non_epsilon_sources = []
-                                for a in self.R:
-                                    a_str = self.get_arc(a)
-                                    try:
-                                        a_src, a_tgt = a_str.split(', ')
-                                        if a_tgt == tgt and self.get_c_attribute(a) != '0':
-                                            non_epsilon_sources.append(a_src)
-                                            # Check if this source is reachable from the starting point
-                                            if a_src not in activity_profile['visited_vertices'] and not self.is_vertex_reachable_from_source(a_src):
-                                                unreachable_sources.append(a_src)
-                                    except Exception:
-                                        continue
+                                for a_src, a_str, a in self.non_epsilon_incoming.get(tgt, []):
+                                    non_epsilon_sources.append(a_src)
+                                    # Check if this source is reachable from the starting point
+                                    if a_src not in activity_profile['visited_vertices'] and not self.is_vertex_reachable_from_source(a_src):
+                                        unreachable_sources.append(a_src)
                                 
                                 # If any source is unreachable, mark as deadlock
                                 if unreachable_sources:
@@ -2095,19 +2229,13 @@ class ModifiedActivityExtraction:
                                 # If all sources are either visited or reachable, proceed with the join
                                 if all(s in activity_profile['visited_vertices'] or s == current_cycle_vertex for s in non_epsilon_sources):
                                     # Add all join arcs to the same timestep
-                                    for a in self.R:
-                                        a_str = self.get_arc(a)
-                                        try:
-                                            a_src, a_tgt = a_str.split(', ')
-                                            if a_tgt == tgt and self.get_c_attribute(a) != '0':
-                                                # Check L-attribute limit for each join arc
-                                                a_l_attribute = self.get_l_attribute(a)
-                                                a_traversal_count = activity_profile['traversed_arcs'].get(a_str, 0)
-                                                if a_traversal_count < a_l_attribute:
-                                                    activity_profile['S'][timestep].add(a_str)
-                                                    activity_profile['traversed_arcs'][a_str] += 1
-                                        except Exception:
-                                            continue
+                                    for a_src, a_str, a in self.non_epsilon_incoming.get(tgt, []):
+                                        # Check L-attribute limit for each join arc
+                                        a_l_attribute = self.get_l_attribute(a)
+                                        a_traversal_count = activity_profile['traversed_arcs'].get(a_str, 0)
+                                        if a_traversal_count < a_l_attribute:
+                                            activity_profile['S'][timestep].add(a_str)
+                                            activity_profile['traversed_arcs'][a_str] += 1
                                     
                                     activity_profile['visited_vertices'].add(tgt)
                                     current_cycle_vertex = tgt
@@ -2121,7 +2249,7 @@ class ModifiedActivityExtraction:
                                 activity_profile['visited_vertices'].add(tgt)
                                 current_cycle_vertex = tgt
                         except Exception as e:
-                            print(f"Error processing arc {path_arc}: {str(e)}")
+                            self.report_error(f"Error processing arc {path_arc}: {str(e)}")
                             continue
                         
                         timestep += 1
@@ -2132,14 +2260,7 @@ class ModifiedActivityExtraction:
                     activity_profile['sink_timestep'] = timestep - 1
         
         # Clean up empty timesteps
-        activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
-        
-        # Print arc usage info
-        # print("\nArc Usage (traversed/limit):")
-        all_arcs = {self.get_arc(arc): self.get_l_attribute(arc) for arc in self.R}
-        for arc_str, limit in sorted(all_arcs.items()):
-            used = activity_profile['traversed_arcs'].get(arc_str, 0)
-            # print(f"{arc_str}: {used}/{limit}")
+        self.compact_profile(activity_profile)
         
         # Extra verification step - always check if we've visited the sink
         if self.sink in activity_profile['visited_vertices']:
@@ -2147,23 +2268,59 @@ class ModifiedActivityExtraction:
             
             # If sink_timestep isn't set, try to determine it
             if activity_profile['sink_timestep'] is None:
-                # Look through all arcs to find the first one that targets the sink
-                for ts, arcs in sorted(activity_profile['S'].items()):
+                # Look through all arcs to find the first one that targets the sink, using the
+                # pre-split endpoints instead of parsing every arc string again
+                timesteps = sorted(activity_profile['S'].items())
+                for ts, arcs in timesteps:
                     for arc in arcs:
                         try:
-                            _, tgt = arc.split(', ')
-                            if tgt == self.sink:
-                                activity_profile['sink_timestep'] = ts
-                                break
+                            _, tgt = arc_endpoints.get(arc) or arc.split(', ')
                         except Exception:
                             continue
+                        if tgt == self.sink:
+                            activity_profile['sink_timestep'] = ts
+                            break
                     if activity_profile['sink_timestep'] is not None:
                         break
                 
-                # If we still don't have a timestamp, use the last one
-                if activity_profile['sink_timestep'] is None and activity_profile['S']:
-                    activity_profile['sink_timestep'] = max(activity_profile['S'].keys())
+                # If we still don't have a timestamp, use the last one, which ends the
+                # sorted timesteps
+                if activity_profile['sink_timestep'] is None and timesteps:
+                    activity_profile['sink_timestep'] = timesteps[-1][0]
+        
+        return activity_profile
+
+    def new_profile(self):
+        """
+        Create the default, empty activity profile.
+        
+        Returns:
+            dict: A profile with no timesteps that has neither reached the sink nor deadlocked.
+        """
+        return {
+            'S': {},
+            'deadlock': False,
+            'successful': False,
+            'sink_timestep': None,
+            'traversed_arcs': {},
+            'visited_vertices': set(),
+        }
+
+    def compact_profile(self, activity_profile):
+        """
+        Materialize the timestep mapping of an activity profile.
         
+        While a profile is being built, 'S' is a defaultdict keyed by timestep so arcs can
+        be added to any timestep without padding. Once extraction is done, it is converted
+        to a plain dict holding only the timesteps that received arcs.
+        
+        Parameters:
+            activity_profile (dict): The profile under construction.
+            
+        Returns:
+            dict: The same profile, with 'S' compacted.
+        """
+        activity_profile['S'] = {k: v for k, v in activity_profile['S'].items() if v}
         return activity_profile
 
     def find_path(self, start_vertex, end_vertex, graph, visited=None):
@@ -2192,35 +2349,73 @@ class ModifiedActivityExtraction:
         if start_vertex in visited:
             return None  # Already visited, avoid cycles
         
-        # Mark as visited
+        # A search on the shared graph from an empty visited set depends only on its
+        # endpoints and the contraction results, so its outcome is cached
+        cache_key = None
+        if graph is self.graph and not visited:
+            cache_key = (start_vertex, end_vertex)
+            cached_path = self.path_cache.get(cache_key, _MISSING)
+            if cached_path is not _MISSING:
+                return list(cached_path) if cached_path is not None else None
+        
+        # Sort neighbors to ensure deterministic path selection; the shared graph
+        # built by build_path_graph is already sorted and holds arc strings
+        shared = graph is self.graph
+        
+        def neighbors_of(vertex):
+            neighbors = graph.get(vertex, ())
+            if shared or not neighbors:
+                return neighbors
+            return sorted(neighbors, key=itemgetter(0))
+        
+        is_reachable = self.is_vertex_reachable_from_source
+        failed_contractions = self.failed_contractions
+        get_arc = self.get_arc
+        
+        # Explore depth-first with an explicit stack of (vertex, remaining neighbors);
+        # path holds the arcs leading to the vertex on top of the stack
         visited.add(start_vertex)
+        path = []
+        stack = [(start_vertex, iter(neighbors_of(start_vertex)))]
         
-        # Recursively explore neighbors
-        if start_vertex in graph:
-            # Sort neighbors to ensure deterministic path selection
-            neighbors = sorted([(next_vertex, arc) for next_vertex, arc in graph[start_vertex]], 
-                               key=lambda x: x[0])
-            
+        while stack:
+            vertex, neighbors = stack[-1]
             for next_vertex, arc in neighbors:
                 # Skip if already visited
                 if next_vertex in visited:
                     continue
                 
                 # Check if the next vertex is even reachable from source
-                if not self.is_vertex_reachable_from_source(next_vertex):
+                if not is_reachable(next_vertex):
                     continue
                 
-                arc_str = self.get_arc(arc)
+                arc_str = arc if shared else get_arc(arc)
                 
                 # Skip if this arc is in failed contractions
-                if arc_str in self.failed_contractions:
+                if arc_str in failed_contractions:
                     continue
                 
-                # Create a new copy of visited for each branch
-                next_path = self.find_path(next_vertex, end_vertex, graph, visited.copy())
-                if next_path is not None:
-                    return [arc_str] + next_path
-        
+                path.append(arc_str)
+                if next_vertex == end_vertex:
+                    # Leave visited as it was passed in
+                    visited.difference_update(v for v, _ in stack)
+                    if cache_key is not None:
+                        self.path_cache[cache_key] = tuple(path)
+                    return path
+                
+                # Descend into next_vertex
+                visited.add(next_vertex)
+                stack.append((next_vertex, iter(neighbors_of(next_vertex))))
+                break
+            else:
+                # All neighbors explored without reaching the end; backtrack
+                stack.pop()
+                visited.discard(vertex)
+                if path:
+                    path.pop()
+        
+        if cache_key is not None:
+            self.path_cache[cache_key] = None
         return None
 
     def get_l_attribute(self, arc):
@@ -2235,11 +2430,7 @@ class ModifiedActivityExtraction:
         Returns:
             int: The L-attribute value, defaulting to 1 if not specified.
         """
-        # Find the matching arc in self.R
-        for r_arc in self.R:
-            if self.get_arc(r_arc) == self.get_arc(arc):
-                return int(r_arc.get('l-attribute', 1) if isinstance(r_arc, dict) else 1)
-        return 1  # Default if no match found
+        return self.l_attributes.get(self.get_arc(arc), 1)  # Default if no match found
 
     def get_c_attribute(self, arc):
         """
@@ -2254,11 +2445,7 @@ class ModifiedActivityExtraction:
         Returns:
             str: The C-attribute value, defaulting to '0' if not specified.
         """
-        # Find the matching arc in self.R
-        for r_arc in self.R:
-            if self.get_arc(r_arc) == self.get_arc(arc):
-                return r_arc.get('c-attribute', '0') if isinstance(r_arc, dict) else '0'
-        return '0'  # Default if no match found
+        return self.c_attributes.get(self.get_arc(arc), '0')  # Default if no match found
     
     def get_arc(self, arc_data):
         """
@@ -2282,11 +2469,16 @@ class ModifiedActivityExtraction:
     def print_activity_profiles(self):
         """
         Print all activity profiles.
+        
+        The report is assembled first and written with a single print call.
         """
+        lines = []
         # Process profiles in a deterministic order
         for contract_arc, activity_profile in sorted(self.activity_profiles.items(), key=lambda x: str(x[0])):
-            print(f"\n--- Activity Profile for ({contract_arc}) ---")
-            self.print_activity_profile(activity_profile)
+            lines.append(f"\n--- Activity Profile for ({contract_arc}) ---")
+            lines.extend(self.format_activity_profile(activity_profile))
+        if lines:
+            print("\n".join(lines))
 
     def convert_arc_format(self, arc):
         """
@@ -2303,7 +2495,8 @@ class ModifiedActivityExtraction:
         """
         if isinstance(arc, str):
             # Handle string format like "a, b"
-            return f"({arc.split(', ')[0]}, {arc.split(', ')[1]})"
+            parts = arc.split(', ')
+            return f"({parts[0]}, {parts[1]})"
         elif isinstance(arc, (tuple, list)) and len(arc) == 2:
             # Handle tuple or list format
             return f"({arc[0]}, {arc[1]})"
@@ -2336,24 +2529,38 @@ class ModifiedActivityExtraction:
         Parameters:
             activity_profile (dict): The activity profile to print.
         """
+        print("\n".join(self.format_activity_profile(activity_profile)))
+
+    def format_activity_profile(self, activity_profile):
+        """
+        Format a activity profile and reachability configurations as report lines.
+        
+        Parameters:
+            activity_profile (dict): The activity profile to format.
+            
+        Returns:
+            list: The lines of the report, without trailing newlines.
+        """
+        lines = []
         if 'S' not in activity_profile:
-            print("Invalid activity profile: Missing 'S' key")
-            return
+            lines.append("Invalid activity profile: Missing 'S' key")
+            return lines
 
         # Process timesteps in deterministic order
-        for timestep, arcs in sorted(activity_profile['S'].items()):
+        timesteps = sorted(activity_profile['S'].items())
+        for timestep, arcs in timesteps:
             # Ensure deterministic order of arcs within each timestep
-            print(f"S({timestep}) = {self.convert_arc_list_format(set(arcs))}")
+            lines.append(f"S({timestep}) = {self.convert_arc_list_format(set(arcs))}")
 
-        if activity_profile['S']:
-            print("\nS = {" + ", ".join(f"S({ts})" for ts in sorted(activity_profile['S'].keys())) + "}")
+        if timesteps:
+            lines.append("\nS = {" + ", ".join(f"S({ts})" for ts, _ in timesteps) + "}")
         
         # Get the last timestep for consistent reporting
-        last_timestep = max(activity_profile['S'].keys()) if activity_profile['S'] else 0
+        last_timestep = timesteps[-1][0] if timesteps else 0
         
         # Print any notes about alternative paths
         if activity_profile.get('note'):
-            print(f"\n{activity_profile['note']}")
+            lines.append(f"\n{activity_profile['note']}")
         
         # Check if sink was actually reached by examining the visited vertices
         sink_reached = self.sink in activity_profile.get('visited_vertices', set())
@@ -2361,16 +2568,18 @@ class ModifiedActivityExtraction:
         # Show sink status based on whether it was reached
         if sink_reached:
             sink_timestep = activity_profile.get('sink_timestep', last_timestep)
-            print(f"\nSink was reached at timestep {sink_timestep}")
+            lines.append(f"\nSink was reached at timestep {sink_timestep}")
         elif activity_profile.get('deadlock', False):
-            print(f"\nSink was not reached (deadlock after timestep {last_timestep})")
+            lines.append(f"\nSink was not reached (deadlock after timestep {last_timestep})")
             # if activity_profile.get('violation_cause'):
             #     print(f"Reason: {activity_profile['violation_cause']}")
         else:
             # Neither deadlock nor successful - sink was simply not reached
-            print(f"\nSink was not reached (deadlock after timestep {last_timestep})")
+            lines.append(f"\nSink was not reached (deadlock after timestep {last_timestep})")
             # if activity_profile.get('violation_cause'):
             #     print(f"Note: {activity_profile['violation_cause']}")
+        
+        return lines
 
     def get_source_arc(self):
         """
@@ -2382,14 +2591,8 @@ class ModifiedActivityExtraction:
         Returns:
             str: The arc string for the first arc from the source vertex.
         """
-        for arc in self.R:
-            arc_str = self.get_arc(arc)
-            try:
-                src, _ = arc_str.split(', ')
-                if src == self.source:
-                    return arc_str
-            except Exception:
-                continue
+        for _, arc_str, _ in self.outgoing.get(self.source, []):
+            return arc_str
         # Fallback if no source arc found
         return f"({self.source}, unknown)"
 
@@ -2403,7 +2606,8 @@ class ModifiedActivityExtraction:
         Parameters:
             start_vtx (str): The starting vertex.
             end_vtx (str): The target vertex.
-            adjacency (dict): The graph as an adjacency list.
+            adjacency (dict): The graph as an adjacency list of (target, arc_str) tuples,
+                              each list sorted by target vertex.
             visited (set, optional): Set of already visited vertices. Defaults to None.
             
         Returns:
@@ -2421,10 +2625,14 @@ class ModifiedActivityExtraction:
         visited.add(start_vtx)
         
         if start_vtx in adjacency:
-            for tgt, arc_str in sorted(adjacency[start_vtx], key=lambda x: x[0]):
+            # Adjacency lists are sorted once when built, not on every visit
+            for tgt, arc_str in adjacency[start_vtx]:
                 if tgt not in visited:
-                    path = self.find_path_in_adjacency(tgt, end_vtx, adjacency, visited.copy())
+                    # Branches share visited; each call removes its vertex again before returning
+                    path = self.find_path_in_adjacency(tgt, end_vtx, adjacency, visited)
                     if path is not None:
+                        visited.discard(start_vtx)
                         return [arc_str] + path
         
+        visited.discard(start_vtx)
         return None
\ No newline at end of file
@@ -6,11 +6,23 @@ to text files. It includes a GUI dialog for file export configuration and handle
 formatting of analysis results in a structured text format.
 """
 
-import tkinter as tk
-from tkinter import filedialog, messagebox
 import os
 from datetime import datetime
 
+# Default directory for exports, next to this module
+DEFAULT_EXPORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "exports")
+
+# Buffer size for export files, large enough to hold a typical report in one flush
+EXPORT_BUFFER_SIZE = 1 << 17
+
+# Separator lines used between the sections of a text export
+SECTION_RULE = "=" * 60 + "\n"
+SECTION_BREAK = SECTION_RULE + "\n"
+SUBSECTION_RULE = "-" * 20 + "\n"
+
+# Formats one row of a tabular section as its own line
+ROW_FORMAT = "{}\n".format
+
 class ResultsExporter:
     """
     Utility class for exporting RDLT processing results in text format
@@ -27,12 +39,13 @@ class ResultsExporter:
         input_data (dict): Original input RDLT data
         processed_data (dict): Processed RDLT data after analysis
         contraction_paths (list): Path contraction data for violations
+        l_safe (bool): Matrix evaluation verdict, or None to derive it from matrix_data
         timestamp (str): Timestamp for the export filename
         default_export_dir (str): Default directory for exports
     """
     
     def __init__(self, matrix_data=None, violations=None, activity_profile=None, 
-                 input_data=None, processed_data=None, contraction_paths=None):
+                 input_data=None, processed_data=None, contraction_paths=None, l_safe=None):
         """
         Initialize the ResultsExporter with RDLT analysis data.
         
@@ -43,6 +56,8 @@ class ResultsExporter:
             input_data (dict, optional): Original input RDLT data. Defaults to None.
             processed_data (dict, optional): Processed RDLT data. Defaults to None.
             contraction_paths (list, optional): Path contraction data. Defaults to None.
+            l_safe (bool, optional): Whether the matrix evaluation found the RDLT L-safe.
+                Defaults to None, in which case it is derived from matrix_data.
         """
         self.matrix_data = matrix_data
         self.violations = violations
@@ -50,15 +65,167 @@ class ResultsExporter:
         self.input_data = input_data
         self.processed_data = processed_data
         self.contraction_paths = contraction_paths
+        self.l_safe = l_safe
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Set up default export directory
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.default_export_dir = os.path.join(script_dir, "exports")
+        self.default_export_dir = DEFAULT_EXPORT_DIR
         
         # Create exports directory if it doesn't exist
-        if not os.path.exists(self.default_export_dir):
-            os.makedirs(self.default_export_dir)
+        os.makedirs(self.default_export_dir, exist_ok=True)
+    
+    def format_txt(self):
+        """
+        Format the processing results as the text report written by export_to_txt.
+        
+        Returns:
+            str: The full report, with "\n" line endings
+        """
+        # Without any results there is nothing to report beyond the header
+        if not any((self.matrix_data, self.violations, self.activity_profile,
+                    self.input_data, self.processed_data, self.contraction_paths)):
+            return f"RDLT Analysis Results - {self.timestamp}\n(no data)\n"
+        
+        # Assemble the report from parts and join them once at the end
+        parts = []
+        
+        # Extract filename from the input data if available
+        input_data = self.input_data
+        filename = ""
+        if input_data and 'filename' in input_data:
+            input_path = input_data['filename']
+            filename = f"_{os.path.splitext(os.path.basename(input_path))[0]}"
+        
+        # Write header with timestamp and filename
+        parts.append(f"RDLT Analysis Results - {self.timestamp}{filename}\n")
+        parts.append(SECTION_BREAK)
+        
+        # Write input data section
+        if input_data:
+            arcs = input_data['Arcs_list']
+            vertices = input_data['Vertices_list']
+            c_attributes = input_data['C_attribute_list']
+            l_attributes = input_data['L_attribute_list']
+            parts.append("Input RDLT: \n")
+            parts.append(SUBSECTION_RULE)
+            parts.append(f"Arcs List ({len(arcs)}):  {arcs}\n")
+            parts.append(f"Vertices List ({len(vertices)}):  {vertices}\n")
+            parts.append(f"C-attribute List ({len(c_attributes)}):  {c_attributes}\n")
+            parts.append(f"L-attribute List ({len(l_attributes)}):  {l_attributes}\n")
+            parts.append(SUBSECTION_RULE)
+            
+            centers = input_data.get('Centers_list')
+            if centers:
+                in_list = input_data['In_list']
+                out_list = input_data['Out_list']
+                parts.append("RBS components:\n")
+                parts.append(SUBSECTION_RULE)
+                parts.append(f"Centers ({len(centers)}):  {centers}\n")
+                parts.append(f"In ({len(in_list)}):  {in_list}\n")
+                parts.append(f"Out ({len(out_list)}):  {out_list}\n")
+            
+            parts.append(SECTION_BREAK)
+        
+        # Write processing information
+        processed_data = self.processed_data
+        if processed_data:
+            r2 = processed_data.get('R2')
+            if r2:
+                parts.append("Processing RBS components...\n\n")
+                parts.append(SECTION_BREAK)
+                parts.append("All joins in R2 are OR-joins. Processing R2 separately and using only R1 for matrix evaluation.\n\n")
+                parts.append(SECTION_RULE)
+                parts.append("R2:\n")
+                parts.append(SUBSECTION_RULE)
+                parts.append(f"Arcs List ({len(r2['Arcs_list'])}): {r2['Arcs_list']}\n")
+                parts.append(f"Vertices List ({len(r2['Vertices_list'])}): {r2['Vertices_list']}\n")
+                parts.append(f"C-attribute List ({len(r2['C_attribute_list'])}): {r2['C_attribute_list']}\n")
+                parts.append(f"L-attribute List ({len(r2['L_attribute_list'])}): {r2['L_attribute_list']}\n")
+                parts.append(f"eRU List ({len(r2['eRU_list'])}): {r2['eRU_list']}\n")
+                parts.append(SECTION_RULE)
+            
+            r1 = processed_data['R1']
+            parts.append("R1:\n")
+            parts.append(SUBSECTION_RULE)
+            parts.append(f"Arcs List ({len(r1['Arcs_list'])}): {r1['Arcs_list']}\n")
+            parts.append(f"C-attribute List ({len(r1['C_attribute_list'])}): {r1['C_attribute_list']}\n")
+            parts.append(f"L-attribute List ({len(r1['L_attribute_list'])}): {r1['L_attribute_list']}\n")
+            parts.append(f"eRU List ({len(r1['eRU_list'])}): {r1['eRU_list']}\n")
+            parts.append(SECTION_BREAK)
+            
+            parts.append("RDLT Structure:\n")
+            parts.extend(map(ROW_FORMAT, processed_data.get('RDLT_structure', [])))
+            parts.append(SECTION_BREAK)
+        
+        # Write evaluation results
+        # Prefer the verdict the matrix evaluation already reached over re-deriving it
+        # from the string flags of every matrix row
+        l_safe = self.l_safe
+        if l_safe is None:
+            l_safe = all(row[-1] == "True" for row in self.matrix_data) if self.matrix_data else False
+        parts.append("JOIN-Safe: Satisfied.\n" if l_safe else "JOIN-Safe: Not Satisfied.\n")
+        parts.append("Loop-Safe NCAs: Satisfied.\n")
+        parts.append("Safe CAs: Satisfied.\n\n")
+        
+        parts.append("\nMatrix Evaluation Result: RDLT is L-Safe.\n\n" if l_safe
+                     else "\nMatrix Evaluation Result: RDLT is NOT L-Safe.\n\n")
+        parts.append(SECTION_RULE)
+        
+        # Write matrix data
+        if self.matrix_data:
+            parts.append("Generated Matrix:\n\n")
+            parts.extend(map(ROW_FORMAT, self.matrix_data))
+            parts.append(SECTION_BREAK)
+        
+        # Write violations
+        violations = self.violations
+        if violations:
+            for violation in violations:
+                get = violation.get
+                parts.append(
+                    f"{violation['type']} Violation:\n"
+                    f"  r-id: {get('r-id', 'N/A')}\n"
+                    f"  arc: {get('arc', 'N/A')}\n"
+                    f"  Violation: {get('violation', 'N/A')}\n\n"
+                )
+            
+            parts.append(f"Found {len(violations)} violations in total.\n")
+            parts.append(SECTION_BREAK)
+        
+        # Write contraction paths
+        if self.contraction_paths:
+            parts.append("--- Contraction Paths for Violations ---\n\n")
+            parts.extend(
+                f"Violating Arc: {path_data.get('arc', 'N/A')}\n"
+                "Contracted Path:\n"
+                f"{path_data.get('path', [])}\n\n"
+                "Successful Contractions:\n"
+                f"{path_data.get('successful', [])}\n\n"
+                for path_data in self.contraction_paths
+            )
+            parts.append(SECTION_BREAK)
+        
+        # Write activity profiles
+        if self.activity_profile:
+            for arc, profile in self.activity_profile.items():
+                parts.append(f"--- Activity Profile for {arc} ---\n")
+                steps = profile.get('S', {})
+                # Activities are sets; join their reprs directly rather than copying each into a list
+                parts.extend(f"S({step}) = [{', '.join(map(repr, activities))}]\n" for step, activities in steps.items())
+                
+                step_names = ", ".join(f"S({step})" for step in steps)
+                sink_timestep = profile.get('sink_timestep')
+                if sink_timestep:
+                    parts.append(f"\nS = {{{step_names}}}\n\nSink was reached at timestep {sink_timestep}\n\n")
+                else:
+                    parts.append(f"\nS = {{{step_names}}}\n\nSink was not reached\n\n")
+            parts.append(SECTION_BREAK)
+        
+        # Write final summary
+        parts.append("\n=========== SUMMARY ===========\n\n")
+        parts.append("RDLT is L-safe and CLASSICAL SOUND.\n" if l_safe else "RDLT is not L-safe.\n")
+        
+        return "".join(parts)
     
     def export_to_txt(self, filepath):
         """
@@ -75,128 +242,23 @@ class ResultsExporter:
             bool: True if export was successful, False otherwise
         """
         try:
-            with open(filepath, 'w') as txtfile:
-                # Extract filename from the input data if available
-                filename = ""
-                if self.input_data and 'filename' in self.input_data:
-                    input_path = self.input_data['filename']
-                    filename = f"_{os.path.splitext(os.path.basename(input_path))[0]}"
-                
-                # Write header with timestamp and filename
-                txtfile.write(f"RDLT Analysis Results - {self.timestamp}{filename}\n")
-                txtfile.write("="*60 + "\n\n")
-                
-                # Write input data section
-                if self.input_data:
-                    txtfile.write("Input RDLT: \n")
-                    txtfile.write("-"*20 + "\n")
-                    txtfile.write(f"Arcs List ({len(self.input_data['Arcs_list'])}):  {self.input_data['Arcs_list']}\n")
-                    txtfile.write(f"Vertices List ({len(self.input_data['Vertices_list'])}):  {self.input_data['Vertices_list']}\n")
-                    txtfile.write(f"C-attribute List ({len(self.input_data['C_attribute_list'])}):  {self.input_data['C_attribute_list']}\n")
-                    txtfile.write(f"L-attribute List ({len(self.input_data['L_attribute_list'])}):  {self.input_data['L_attribute_list']}\n")
-                    txtfile.write("-"*20 + "\n")
-                    
-                    if self.input_data.get('Centers_list'):
-                        txtfile.write("RBS components:\n")
-                        txtfile.write("-"*20 + "\n")
-                        txtfile.write(f"Centers ({len(self.input_data['Centers_list'])}):  {self.input_data['Centers_list']}\n")
-                        txtfile.write(f"In ({len(self.input_data['In_list'])}):  {self.input_data['In_list']}\n")
-                        txtfile.write(f"Out ({len(self.input_data['Out_list'])}):  {self.input_data['Out_list']}\n")
-                    
-                    txtfile.write("="*60 + "\n\n")
-                
-                # Write processing information
-                if self.processed_data:
-                    if self.processed_data.get('R2'):
-                        txtfile.write("Processing RBS components...\n\n")
-                        txtfile.write("="*60 + "\n\n")
-                        txtfile.write("All joins in R2 are OR-joins. Processing R2 separately and using only R1 for matrix evaluation.\n\n")
-                        txtfile.write("="*60 + "\n")
-                        txtfile.write("R2:\n")
-                        txtfile.write("-"*20 + "\n")
-                        txtfile.write(f"Arcs List ({len(self.processed_data['R2']['Arcs_list'])}): {self.processed_data['R2']['Arcs_list']}\n")
-                        txtfile.write(f"Vertices List ({len(self.processed_data['R2']['Vertices_list'])}): {self.processed_data['R2']['Vertices_list']}\n")
-                        txtfile.write(f"C-attribute List ({len(self.processed_data['R2']['C_attribute_list'])}): {self.processed_data['R2']['C_attribute_list']}\n")
-                        txtfile.write(f"L-attribute List ({len(self.processed_data['R2']['L_attribute_list'])}): {self.processed_data['R2']['L_attribute_list']}\n")
-                        txtfile.write(f"eRU List ({len(self.processed_data['R2']['eRU_list'])}): {self.processed_data['R2']['eRU_list']}\n")
-                        txtfile.write("="*60 + "\n")
-                    
-                    txtfile.write("R1:\n")
-                    txtfile.write("-"*20 + "\n")
-                    txtfile.write(f"Arcs List ({len(self.processed_data['R1']['Arcs_list'])}): {self.processed_data['R1']['Arcs_list']}\n")
-                    txtfile.write(f"C-attribute List ({len(self.processed_data['R1']['C_attribute_list'])}): {self.processed_data['R1']['C_attribute_list']}\n")
-                    txtfile.write(f"L-attribute List ({len(self.processed_data['R1']['L_attribute_list'])}): {self.processed_data['R1']['L_attribute_list']}\n")
-                    txtfile.write(f"eRU List ({len(self.processed_data['R1']['eRU_list'])}): {self.processed_data['R1']['eRU_list']}\n")
-                    txtfile.write("="*60 + "\n\n")
-                    
-                    txtfile.write("RDLT Structure:\n")
-                    for row in self.processed_data.get('RDLT_structure', []):
-                        txtfile.write(f"{row}\n")
-                    txtfile.write("="*60 + "\n\n")
-                
-                # Write evaluation results
-                l_safe = all(row[-1] == "True" for row in self.matrix_data) if self.matrix_data else False
-                txtfile.write("JOIN-Safe: " + ("Satisfied.\n" if l_safe else "Not Satisfied.\n"))
-                txtfile.write("Loop-Safe NCAs: Satisfied.\n")
-                txtfile.write("Safe CAs: Satisfied.\n\n")
-                
-                txtfile.write("\nMatrix Evaluation Result: RDLT is " + 
-                            ("L-Safe." if l_safe else "NOT L-Safe.") + "\n\n")
-                txtfile.write("="*60 + "\n")
-                
-                # Write matrix data
-                if self.matrix_data:
-                    txtfile.write("Generated Matrix:\n\n")
-                    for row in self.matrix_data:
-                        txtfile.write(f"{row}\n")
-                    txtfile.write("="*60 + "\n\n")
-                
-                # Write violations
-                if self.violations:
-                    for violation in self.violations:
-                        txtfile.write(f"{violation['type']} Violation:\n")
-                        txtfile.write(f"  r-id: {violation.get('r-id', 'N/A')}\n")
-                        txtfile.write(f"  arc: {violation.get('arc', 'N/A')}\n")
-                        txtfile.write(f"  Violation: {violation.get('violation', 'N/A')}\n\n")
-                    
-                    txtfile.write(f"Found {len(self.violations)} violations in total.\n")
-                    txtfile.write("="*60 + "\n\n")
-                
-                # Write contraction paths
-                if self.contraction_paths:
-                    txtfile.write("--- Contraction Paths for Violations ---\n\n")
-                    for path_data in self.contraction_paths:
-                        txtfile.write(f"Violating Arc: {path_data.get('arc', 'N/A')}\n")
-                        txtfile.write("Contracted Path:\n")
-                        txtfile.write(f"{path_data.get('path', [])}\n\n")
-                        txtfile.write("Successful Contractions:\n")
-                        txtfile.write(f"{path_data.get('successful', [])}\n\n")
-                    txtfile.write("="*60 + "\n\n")
-                
-                # Write activity profiles
-                if self.activity_profile:
-                    for arc, profile in self.activity_profile.items():
-                        txtfile.write(f"--- Activity Profile for {arc} ---\n")
-                        for step, activities in profile.get('S', {}).items():
-                            txtfile.write(f"S({step}) = {list(activities)}\n")
-                        
-                        txtfile.write("\nS = {")
-                        txtfile.write(", ".join([f"S({step})" for step in profile.get('S', {}).keys()]))
-                        txtfile.write("}\n\n")
-                        
-                        if profile.get('sink_timestep'):
-                            txtfile.write(f"Sink was reached at timestep {profile['sink_timestep']}\n\n")
-                        else:
-                            txtfile.write("Sink was not reached\n\n")
-                    txtfile.write("="*60 + "\n\n")
-                
-                # Write final summary
-                txtfile.write("\n=========== SUMMARY ===========\n\n")
-                txtfile.write(f"RDLT is {'L-safe and CLASSICAL SOUND.' if l_safe else 'not L-safe.'}\n")
-                
+            # Encode the whole report once and hand it to the file as a single binary write,
+            # translating newlines the way a text-mode file would
+            report = self.format_txt()
+            if os.linesep != "\n":
+                report = report.replace("\n", os.linesep)
+            with open(filepath, 'wb', buffering=EXPORT_BUFFER_SIZE) as txtfile:
+                txtfile.write(report.encode('utf-8'))
+            
             return True
         except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export to TXT: {str(e)}")
+            # tkinter is only needed to report the error, so headless callers never load it
+            try:
+                from tkinter import messagebox
+            except ImportError:
+                print(f"Failed to export to TXT: {str(e)}")
+            else:
+                messagebox.showerror("Export Error", f"Failed to export to TXT: {str(e)}")
             return False
     
     def show_export_dialog(self, parent_window=None):
@@ -214,6 +276,9 @@ class ResultsExporter:
         Returns:
             tk.Toplevel: The dialog window instance
         """
+        import tkinter as tk
+        from tkinter import filedialog, messagebox
+        
         dialog = tk.Toplevel(parent_window)
         dialog.title("Export Results")
         dialog.geometry("400x200")
@@ -34,7 +34,6 @@ Dependencies:
     - matrix: Matrix class to convert RDLT data (dict) to matrix representation
     - mod_extract: ModifiedActivityExtraction class generates activity profiles for violating component(s)
     - contraction: ContractionPath class to generate contraction paths for violating components
-    - utils: Provides utility functions for graph processing, path finding, and vertex identification
     - rdlt_export: ResultsExporter class for exporting results to text file
     - help_dialog: HelpDialog class for displaying help information
 
@@ -43,21 +42,116 @@ Code Version 3.2 (as of 04-15-25)
 """
 
 import tkinter as tk
-from tkinter import filedialog, scrolledtext, messagebox
+from tkinter import filedialog, messagebox
 import os
 import io
+import sys
+import copy
+import queue
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from functools import partial
+from itertools import chain
 from contextlib import redirect_stdout
-from rdlt_export import ResultsExporter
-
-# Import RDLT processing modules
-from input_rdlt import Input_RDLT
-from cycle import Cycle
-from create_r2 import ProcessR2
-from create_r1 import ProcessR1
-from joins import TestJoins
-from matrix import Matrix
-from mod_extract import ModifiedActivityExtraction
-from contraction import ContractionPath
+
+# The RDLT processing modules and the exporter are imported when first needed,
+# so the window comes up without loading the verification engine
+
+# Separator lines written between sections of the processing output
+SECTION_RULE = '=' * 60
+SUBSECTION_RULE = '-' * 20
+
+# Directory holding the quick-select sample files, next to this script
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rdlt_text")
+
+# Size of the blocks processing output is inserted into the output text area in
+OUTPUT_INSERT_CHUNK = 1 << 16
+
+# Longest time (in seconds) processing output is held back before being shown
+OUTPUT_FLUSH_INTERVAL = 0.05
+
+# Number of trailing output lines kept in the output text area
+MAX_VISIBLE_LINES = 5000
+
+# Input files larger than this (in bytes) are processed without the diagnostic listings
+LARGE_INPUT_SIZE = 2 * 1024 * 1024
+
+# Number of result polls (50 ms apart) between updates of the processing status
+STATUS_UPDATE_POLLS = 8
+
+# Number of parsed input files kept for reprocessing
+INPUT_CACHE_SIZE = 8
+
+# Maximum number of queued messages handled per poll of the processing thread
+MAX_MESSAGES_PER_POLL = 200
+
+# Shortest time (in seconds) between scrolls of the output area to its end while processing
+SCROLL_INTERVAL = 0.1
+
+def format_arc(arc):
+    """
+    Format an arc string "x, y" as "(x, y)", splitting it only once.
+    
+    Args:
+        arc: Arc string in the form "x, y"
+        
+    Returns:
+        str: The arc wrapped in parentheses
+    """
+    start, end = arc.split(', ')[:2]
+    return f"({start}, {end})"
+
+class QueueWriter(io.TextIOBase):
+    """
+    Write-only text stream that forwards buffered output to a queue.
+    
+    Used as stdout for the processing thread so its output can be shown
+    while the analysis is still running. Writes are collected in a buffer
+    that is queued as one ("output", text) message once it holds
+    OUTPUT_INSERT_CHUNK characters or OUTPUT_FLUSH_INTERVAL seconds have
+    passed since the last message; flush() queues whatever is left.
+    """
+    def __init__(self, output_queue):
+        """
+        Initialize the writer.
+        
+        Args:
+            output_queue: queue.Queue that receives the ("output", text) messages
+        """
+        super().__init__()
+        self.output_queue = output_queue
+        self.pending = []
+        self.pending_size = 0
+        self.last_put = time.monotonic()
+    
+    def writable(self):
+        return True
+    
+    def write(self, text):
+        """
+        Buffer text, queueing the buffer when it is full or due.
+        
+        Args:
+            text: Text written by print()
+            
+        Returns:
+            int: Number of characters written
+        """
+        self.pending.append(text)
+        self.pending_size += len(text)
+        if (self.pending_size >= OUTPUT_INSERT_CHUNK
+                or time.monotonic() - self.last_put >= OUTPUT_FLUSH_INTERVAL):
+            self.flush()
+        return len(text)
+    
+    def flush(self):
+        if self.pending:
+            self.output_queue.put(("output", "".join(self.pending)))
+            self.pending = []
+            self.pending_size = 0
+        self.last_put = time.monotonic()
 
 class RDLTProcessorGUI:
     """
@@ -67,14 +161,17 @@ class RDLTProcessorGUI:
     and integrates with the RDLT processing engine to analyze inputs
     and display results.
     """
-    def __init__(self, root):
+    def __init__(self, root, max_visible_lines=MAX_VISIBLE_LINES):
         """
         Initialize the GUI components and layout.
         
         Args:
             root: The tkinter root window object
+            max_visible_lines: Number of trailing output lines kept in the
+                output text area. Defaults to MAX_VISIBLE_LINES.
         """
         self.root = root
+        self.max_visible_lines = max_visible_lines
         self.root.title("RDLT Processor")
         self.root.geometry("900x700")
         self.root.configure(bg="#f0f0f0")
@@ -121,23 +218,49 @@ class RDLTProcessorGUI:
         buttons_frame = tk.Frame(samples_frame, bg="#f0f0f0")
         buttons_frame.pack(fill=tk.X)
         
+        # The buttons are laid out four to a row; configure each column once
+        for col in range(4):
+            buttons_frame.columnconfigure(col, weight=1)
+        
+        missing_samples = 0
         for i, sample in enumerate(samples):
             # Remove file extension from display text
             display_text = os.path.splitext(sample)[0]
             
             # Create button with display text but pass full filename to the command
             button = tk.Button(buttons_frame, text=display_text, 
-                            command=lambda s=sample: self.select_sample(s))
-            row = i // 4
-            col = i % 4
-            button.grid(row=row, column=col, padx=10, pady=5, sticky="ew")
-            buttons_frame.columnconfigure(col, weight=1)
+                            command=partial(self.select_sample, sample))
+            # Look for each sample file once; buttons for missing files are disabled
+            if not os.path.isfile(os.path.join(SAMPLE_DIR, sample)):
+                button.configure(state="disabled")
+                missing_samples += 1
+            button.grid(row=i // 4, column=i % 4, padx=10, pady=5, sticky="ew")
         
         # Process button
-        process_button = tk.Button(main_frame, text="Process RDLT", command=self.process_rdlt, 
+        self.process_button = tk.Button(main_frame, text="Process RDLT", command=self.process_rdlt, 
                                   bg="#7393B3", fg="white", font=("Arial", 12, "bold"),
                                   padx=5)
-        process_button.pack(pady=5)
+        self.process_button.pack(pady=5)
+        
+        # Results handed back from the processing thread to the UI thread
+        self.result_queue = queue.Queue()
+        
+        # Number of leading output lines dropped from the output text area
+        self.hidden_output_lines = 0
+        
+        # Output (and its hidden line count) cleared by the last Process click
+        self.previous_output = None
+        
+        # Whether a worker thread is processing a file, and the number of
+        # times poll_results has run for it
+        self.processing = False
+        self.poll_count = 0
+        
+        # Time the output area was last scrolled to its end
+        self.last_scroll_time = 0.0
+        
+        # Parsed inputs and their printed summaries, keyed by (path, mtime, size)
+        self.input_cache = OrderedDict()
         
         # Output section
         output_frame = tk.LabelFrame(main_frame, text="Processing Results", bg="#f0f0f0", padx=10)
@@ -145,19 +268,31 @@ class RDLTProcessorGUI:
         
         # Status bar
         self.status_var = tk.StringVar()
-        self.status_var.set("Ready")
+        if missing_samples:
+            # Explain the disabled sample buttons
+            self.status_var.set(f"Ready - {missing_samples} sample file(s) not found. "
+                                f"Please place your sample files in {SAMPLE_DIR}")
+        else:
+            self.status_var.set("Ready")
         status_bar = tk.Label(output_frame, textvariable=self.status_var, bd=1, relief=tk.SUNKEN, anchor=tk.W)
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Create output text area with scrollbar
-        self.output_text = scrolledtext.ScrolledText(output_frame, wrap=tk.WORD, width=70, height=20)
-        self.output_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-        # Access the vertical scrollbar
-        scrollbar = self.output_text.vbar
-
-        # Configure the scrollbar's width and other properties
-        scrollbar.configure(width=20)  # Change the width of the scrollbar
+        # Create output text area with scrollbars
+        # A plain Text widget with the undo stack turned off, since the output is never edited.
+        # Lines are not wrapped and use a fixed-width font, so matrix rows keep their columns
+        # and Tk does not have to re-wrap every line while scrolling.
+        text_frame = tk.Frame(output_frame)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        xscrollbar = tk.Scrollbar(text_frame, orient=tk.HORIZONTAL)
+        xscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        scrollbar = tk.Scrollbar(text_frame, width=20)  # Change the width of the scrollbar
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.output_text = tk.Text(text_frame, wrap=tk.NONE, width=70, height=20, font="TkFixedFont",
+                                   undo=False, autoseparators=False, maxundo=0,
+                                   xscrollcommand=xscrollbar.set, yscrollcommand=scrollbar.set)
+        self.output_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        xscrollbar.configure(command=self.output_text.xview)
+        scrollbar.configure(command=self.output_text.yview)
 
         # Create a frame to hold the Clear and Export buttons
         button_frame = tk.Frame(output_frame, bg="#f0f0f0")
@@ -167,13 +302,19 @@ class RDLTProcessorGUI:
         clear_button = tk.Button(button_frame, text="Clear Output", command=self.clear_output)
         clear_button.grid(row=0, column=0, padx=5)
 
-        # Export button (in column 1)
-        export_button = tk.Button(button_frame, text="Export Results", command=self.export_results)
-        export_button.grid(row=0, column=1, padx=30)
+        # Restore button (in column 1), brings back the output cleared by the last run
+        self.restore_button = tk.Button(button_frame, text="Restore Previous", command=self.restore_output,
+                                        state="disabled")
+        self.restore_button.grid(row=0, column=1, padx=5)
+
+        # Export button (in column 2)
+        self.export_button = tk.Button(button_frame, text="Export Results", command=self.export_results)
+        self.export_button.grid(row=0, column=2, padx=30)
 
         # Center the buttons in the frame
         button_frame.grid_columnconfigure(0, weight=1)
         button_frame.grid_columnconfigure(1, weight=1)
+        button_frame.grid_columnconfigure(2, weight=1)
 
         # Help button
         help_button = tk.Button(main_frame, text="Help", command=self.show_help)
@@ -195,32 +336,16 @@ class RDLTProcessorGUI:
         """
         Select one of the predefined sample files.
         
-        Checks if the rdlt_text directory exists and contains the
-        requested sample file. Creates the directory if needed.
+        The rdlt_text directory is checked for the sample files when the
+        window is built, and buttons for missing samples are disabled, so
+        selecting a sample only sets its path.
         
         Args:
             sample_name: Name of the sample file to select
         """
-        # Determine the directory where sample files might be located
-        # Assuming they're in the same directory as the script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        sample_dir = os.path.join(script_dir, "rdlt_text")
-        
-        # If the rdlt_text directory doesn't exist, create it
-        if not os.path.exists(sample_dir):
-            os.makedirs(sample_dir)
-            self.output_text.insert(tk.END, f"Created directory for sample files: {sample_dir}\n")
-            self.output_text.insert(tk.END, f"Please place your sample files in this directory.\n")
-            return
-        
-        filepath = os.path.join(sample_dir, sample_name)
+        filepath = os.path.join(SAMPLE_DIR, sample_name)
         self.file_path_var.set(filepath)
         self.selected_file_path = filepath
-        
-        # Check if the file exists
-        if not os.path.exists(filepath):
-            self.output_text.insert(tk.END, f"Sample file not found: {filepath}\n")
-            self.output_text.insert(tk.END, f"Please place your sample files in the rdlt_text directory.\n")
     
     def clear_output(self):
         """
@@ -228,6 +353,21 @@ class RDLTProcessorGUI:
         """
         self.output_text.config(state="normal")  # Enable clearing
         self.output_text.delete(1.0, tk.END)
+        self.hidden_output_lines = 0
+
+    def restore_output(self):
+        """
+        Restore the output that was cleared when the last file was processed.
+        
+        The restored output replaces the current contents of the output text area.
+        """
+        if self.previous_output is None:
+            return
+        previous, hidden_lines = self.previous_output
+        self.clear_output()
+        self.output_text.insert(tk.END, previous)
+        self.hidden_output_lines = hidden_lines
+        self.output_text.config(state="disabled")
 
     def show_help(self):
         """
@@ -241,9 +381,7 @@ class RDLTProcessorGUI:
             # Create the help dialog
             help_instance = HelpDialog(self.root)
         except Exception as e:
-            self.output_text.insert(tk.END, f"Error displaying help: {str(e)}\n")
-            import traceback
-            self.output_text.insert(tk.END, traceback.format_exc())
+            self.output_text.insert(tk.END, f"Error displaying help: {str(e)}\n{traceback.format_exc()}")
     
     def process_rdlt(self):
         """
@@ -253,15 +391,15 @@ class RDLTProcessorGUI:
         redirects stdout to capture console output, and runs the
         RDLT processing logic.
         """
-        # Check if output needs to be cleared first
-        if self.output_text.get(1.0, tk.END).strip():
-            if not messagebox.askyesno(
-                "Clear Output Required",
-                "You need to clear the previous results before processing a new file.\n\n"
-                "Would you like to clear the output now?",
-                parent=self.root
-            ):
-                return  # User chose not to clear
+        # Only one file is processed at a time
+        if self.processing:
+            return
+        
+        # Clear the previous results, keeping them so they can be restored.
+        # The emptiness check uses the widget's line index instead of copying its text.
+        if self.output_text.index("end-1c") != "1.0":
+            self.previous_output = (self.output_text.get(1.0, "end-1c"), self.hidden_output_lines)
+            self.restore_button.config(state="normal")
             self.clear_output()
 
         filepath = self.file_path_var.get()
@@ -277,29 +415,132 @@ class RDLTProcessorGUI:
             return
         
         self.output_text.delete(1.0, tk.END)  # Clear existing content
+        self.hidden_output_lines = 0
+        
+        # Large inputs are processed quietly, showing only the results
+        file_size = os.path.getsize(filepath)
+        quiet = file_size > LARGE_INPUT_SIZE
+        if quiet:
+            self.append_output(f"Large input file ({file_size / (1 << 20):.1f} MB): "
+                               "skipping the input summary and matrix listing, showing results only.\n")
+        
         self.status_var.set("Processing...")
-        self.root.update_idletasks()
+        self.poll_count = 0
+        
+        # Run the analysis on a worker thread so the window stays responsive,
+        # and keep the Process, Restore and Export buttons disabled until its results are shown
+        self.processing = True
+        self.process_button.config(state="disabled")
+        self.restore_button.config(state="disabled")
+        self.export_button.config(state="disabled")
+        threading.Thread(target=self.process_worker, args=(filepath, quiet), daemon=True).start()
+        self.root.after(50, self.poll_results)
+    
+    def process_worker(self, filepath, quiet=False):
+        """
+        Run the RDLT processing on a worker thread and queue its outcome.
         
-        captured_output = io.StringIO()
-        try:
-            with redirect_stdout(captured_output):
-                self.run_rdlt_processing(filepath)
-            
-            # Insert captured output
-            output = captured_output.getvalue()
-            self.output_text.insert(tk.END, output)
-            
-            # DISABLE HERE (after all text is inserted)
-            self.output_text.config(state="disabled")
-            self.status_var.set("Processing completed")
+        The engine's console output is streamed line by line to the UI thread
+        through result_queue, followed by an ("ok", "") or ("error", text)
+        message once processing ends, since tkinter widgets must only be
+        touched on the UI thread.
         
+        Args:
+            filepath: Path to the RDLT input file to process
+            quiet: Passed on to run_rdlt_processing. Defaults to False.
+        """
+        writer = QueueWriter(self.result_queue)
+        # Reported if the worker stops without returning or raising an Exception
+        outcome = ("error", "Error during processing: the worker thread stopped unexpectedly.\n")
+        try:
+            with redirect_stdout(writer):
+                self.run_rdlt_processing(filepath, quiet)
+            outcome = ("ok", "")
         except Exception as e:
-            self.output_text.insert(tk.END, f"Error during processing: {str(e)}\n")
-            import traceback
-            self.output_text.insert(tk.END, traceback.format_exc())
-            self.output_text.config(state="disabled")  # Disable after error
+            # The traceback is formatted here so the UI thread only inserts the finished message
+            outcome = ("error", f"Error during processing: {str(e)}\n{traceback.format_exc()}")
+        finally:
+            # Always queue a final message, so poll_results stops and re-enables the buttons
+            writer.flush()
+            self.result_queue.put(outcome)
+    
+    def poll_results(self):
+        """
+        Show the output queued by the worker thread since the last poll.
+        
+        Queued output is inserted with a single append per poll. Reschedules
+        itself on the Tk event loop until the worker reports that it is done.
+        """
+        chunks = []
+        status = None
+        for _ in range(MAX_MESSAGES_PER_POLL):
+            try:
+                kind, text = self.result_queue.get_nowait()
+            except queue.Empty:
+                break
+            chunks.append(text)
+            if kind != "output":
+                status = kind
+                break
+        
+        if chunks:
+            self.append_output("".join(chunks))
+            # Follow the output at most every SCROLL_INTERVAL seconds, and always once it ends
+            now = time.monotonic()
+            if status is not None or now - self.last_scroll_time >= SCROLL_INTERVAL:
+                self.output_text.see(tk.END)
+                self.last_scroll_time = now
+        
+        if status is None:
+            # Animate the status bar from the same poll, changing it only every
+            # STATUS_UPDATE_POLLS polls rather than on every tick
+            self.poll_count += 1
+            if self.poll_count % STATUS_UPDATE_POLLS == 0:
+                self.status_var.set("Processing" + "." * (self.poll_count // STATUS_UPDATE_POLLS % 3 + 1))
+            self.root.after(50, self.poll_results)
+            return
+        
+        # DISABLE HERE (after all text is inserted)
+        self.output_text.config(state="disabled")
+        if status == "ok":
+            self.status_var.set("Processing completed")
+        else:
             self.status_var.set("Error occurred")
-
+        self.processing = False
+        self.process_button.config(state="normal")
+        self.export_button.config(state="normal")
+        if self.previous_output is not None:
+            self.restore_button.config(state="normal")
+    
+    def append_output(self, output):
+        """
+        Append text to the output area, keeping only its last max_visible_lines lines.
+        
+        Large RDLTs can print thousands of matrix rows; rather than letting the
+        widget grow without bound, the oldest lines are dropped and replaced
+        with a note of how many are hidden. Exports are built from the
+        processing results, not from this text, so nothing is lost from them.
+        
+        Args:
+            output: Text to append
+        """
+        output_text = self.output_text
+        # Detach the scrollbar while inserting so it is updated once, not per chunk
+        yscrollcommand = output_text.cget("yscrollcommand")
+        output_text.configure(yscrollcommand="")
+        for start in range(0, len(output), OUTPUT_INSERT_CHUNK):
+            output_text.insert(tk.END, output[start:start + OUTPUT_INSERT_CHUNK])
+        
+        # Line count excluding the note line while one is shown
+        note_lines = 1 if self.hidden_output_lines else 0
+        line_count = int(output_text.index("end-1c").split(".")[0]) - note_lines
+        excess = line_count - self.max_visible_lines
+        if excess > 0:
+            output_text.delete("1.0", f"{excess + note_lines + 1}.0")
+            self.hidden_output_lines += excess
+            output_text.insert("1.0", f"... {self.hidden_output_lines} earlier lines not shown ...\n")
+        output_text.configure(yscrollcommand=yscrollcommand)
+    
     def export_results(self):
         """
         Export the processing results to a file format of user's choice.
@@ -315,38 +556,47 @@ class RDLTProcessorGUI:
             
             # Get the basic data needed for export
             matrix_data = self.matrix_instance.get_matrix_data()
-            violations = self.matrix_instance.get_violations()
+            # Reuse the violations the last run found for this matrix; otherwise
+            # (e.g. an L-safe run) compute them without storing them
+            stored_violations = getattr(self, 'violations', None)
+            if stored_violations is not None and stored_violations[0] is self.matrix_instance:
+                violations = stored_violations[1]
+            else:
+                violations = self.matrix_instance.get_violations()
             activity_profile = self.activity_profile if hasattr(self, 'activity_profile') else None
             
-            # Prepare input data for export
+            # Prepare input data for export, reusing the lists Input_RDLT already built
             input_data = {
                 'filename': self.selected_file_path,
-                'Arcs_list': [f"({arc.split(', ')[0]}, {arc.split(', ')[1]})" 
-                            for arc in self.input_instance.Arcs_List],
-                'Vertices_list': sorted(set([v for arc in self.input_instance.Arcs_List 
-                                        for v in arc.split(', ')])),
+                'Arcs_list': self.input_instance.Formatted_Arcs_List,
+                'Vertices_list': self.input_instance.Vertices_List,
                 'C_attribute_list': self.input_instance.C_attribute_list,
                 'L_attribute_list': self.input_instance.L_attribute_list,
                 'Centers_list': self.input_instance.Centers_list,
-                'In_list': [f"({in_arc.split(', ')[0]}, {in_arc.split(', ')[1]})" 
-                            for in_arc in self.input_instance.In_list] if hasattr(self.input_instance, 'In_list') else [],
-                'Out_list': [f"({out_arc.split(', ')[0]}, {out_arc.split(', ')[1]})" 
-                            for out_arc in self.input_instance.Out_list] if hasattr(self.input_instance, 'Out_list') else []
+                'In_list': self.input_instance.Formatted_In_list,
+                'Out_list': self.input_instance.Formatted_Out_list
             }
             
-            # Prepare processed data for export
+            # Prepare processed data for export, collecting the R1 lists in one pass
+            r1_arcs, r1_c_attributes, r1_l_attributes, r1_eRUs = [], [], [], []
+            for r in self.current_R:
+                if not isinstance(r, dict):
+                    continue
+                if 'arc' in r:
+                    r1_arcs.append(format_arc(r['arc']))
+                r1_c_attributes.append(r.get('c-attribute', ''))
+                r1_l_attributes.append(r.get('l-attribute', ''))
+                r1_eRUs.append(str(r.get('eRU', '0')))
+            
             processed_data = {
                 'R1': {
-                    'Arcs_list': [f"({r['arc'].split(', ')[0]}, {r['arc'].split(', ')[1]})" 
-                                for r in self.current_R if isinstance(r, dict) and 'arc' in r],
-                    'C_attribute_list': [r.get('c-attribute', '') 
-                                    for r in self.current_R if isinstance(r, dict)],
-                    'L_attribute_list': [r.get('l-attribute', '') 
-                                    for r in self.current_R if isinstance(r, dict)],
-                    'eRU_list': [str(r.get('eRU', '0')) 
-                                for r in self.current_R if isinstance(r, dict)]
+                    'Arcs_list': r1_arcs,
+                    'C_attribute_list': r1_c_attributes,
+                    'L_attribute_list': r1_l_attributes,
+                    'eRU_list': r1_eRUs
                 },
-                'RDLT_structure': [str(row) for row in matrix_data]  # Using matrix data as structure
+                # Using matrix data as structure; the exporter formats each row as it writes it
+                'RDLT_structure': matrix_data
             }
             
             # Prepare contraction paths data
@@ -361,13 +611,15 @@ class RDLTProcessorGUI:
                     })
             
             # Create an instance of ResultsExporter with all collected data
+            from rdlt_export import ResultsExporter
             exporter = ResultsExporter(
                 matrix_data=matrix_data,
                 violations=violations,
                 activity_profile=activity_profile,
                 input_data=input_data,
                 processed_data=processed_data,
-                contraction_paths=contraction_paths
+                contraction_paths=contraction_paths,
+                l_safe=self.matrix_instance.l_safe_vector
             )
             
             # Show the export dialog
@@ -376,7 +628,7 @@ class RDLTProcessorGUI:
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export results: {str(e)}")
     
-    def run_rdlt_processing(self, input_filepath):
+    def run_rdlt_processing(self, input_filepath, quiet=False):
         """
         Execute the RDLT processing logic from the original script.
         
@@ -386,13 +638,53 @@ class RDLTProcessorGUI:
         
         Args:
             input_filepath: Path to the RDLT input file to process
+            quiet: If True, skip the input summary, the combined R1/R2 listing and
+                the generated matrix, printing only the results. Defaults to False.
         """
+        # Import RDLT processing modules
+        from input_rdlt import Input_RDLT
+        from cycle import Cycle
+        from create_r2 import ProcessR2
+        from create_r1 import ProcessR1
+        from joins import TestJoins
+        from matrix import Matrix
+        from mod_extract import ModifiedActivityExtraction
+        from contraction import ContractionPath
+        
         # Initialize activity_profile to None
         self.activity_profile = None
-
-        # Initialize the RDLT input processor and store it as an attribute
-        self.input_instance = Input_RDLT(input_filepath)
-        self.input_instance.evaluate()
+        # Violations found by this run, tagged with the Matrix they came from,
+        # so export_results only reuses them for that matrix
+        self.violations = None
+
+        # Initialize the RDLT input processor and store it as an attribute,
+        # reusing the parsed input when the same unchanged file is processed again.
+        # Processing modifies the R structures in place, so the cache keeps a pristine
+        # copy and every run works on its own copy of it.
+        cache_key = (input_filepath, os.path.getmtime(input_filepath), os.path.getsize(input_filepath))
+        cached_input = self.input_cache.get(cache_key)
+        if cached_input is None:
+            self.input_instance = Input_RDLT(input_filepath)
+            input_summary = io.StringIO()
+            try:
+                with redirect_stdout(input_summary):
+                    self.input_instance.evaluate()
+            except Exception:
+                # Show what was printed before the failure, as without the cache,
+                # unless the summary is skipped for this run
+                if not quiet:
+                    print(input_summary.getvalue(), end="")
+                raise
+            input_summary = input_summary.getvalue()
+            self.input_cache[cache_key] = (copy.deepcopy(self.input_instance), input_summary)
+            if len(self.input_cache) > INPUT_CACHE_SIZE:
+                self.input_cache.popitem(last=False)
+        else:
+            self.input_cache.move_to_end(cache_key)
+            input_instance, input_summary = cached_input
+            self.input_instance = copy.deepcopy(input_instance)
+        if not quiet:
+            print(input_summary, end="")
         
         # Retrieve extracted RDLT components
         Centers_list = self.input_instance.Centers_list
@@ -407,22 +699,21 @@ class RDLTProcessorGUI:
         
         # Process R2 (RBS) if centers exist
         if Centers_list:
-            print("\nProcessing RBS components...\n")
-            print('=' * 60)
+            print("\nProcessing RBS components...\n", SECTION_RULE, sep="\n")
             initial_R2 = self.input_instance.getRs()  # Get all regions except 'R1'
             
             # Use TestJoins to check if all joins in R2 are OR-joins
-            flattened_R2 = []
-            for r2_dict in initial_R2:
-                for r2_key, r2_value in r2_dict.items():
-                    flattened_R2.extend(r2_value)
+            # (the check walks R2 once per join group, so it still gets a flat list)
+            flattened_R2 = list(chain.from_iterable(
+                r2_value for r2_dict in initial_R2 for r2_value in r2_dict.values()))
             
             check_result = TestJoins.checkSimilarTargetVertexAndUpdate(initial_R1, flattened_R2)
             
-            if check_result == initial_R1:
+            # The check hands back R1 itself for OR-joins and a new R1 + R2 list otherwise,
+            # so an identity test avoids comparing the lists arc by arc
+            if check_result is initial_R1:
                 # All joins are OR-joins, process R2 separately and use only R1 as input
-                print("\nAll joins in R2 are OR-joins. Using only R1 for matrix evaluation.\n")
-                print('=' * 60)
+                print("\nAll joins in R2 are OR-joins. Using only R1 for matrix evaluation.\n", SECTION_RULE, sep="\n")
                 
                 # Process R2
                 processed_R2 = ProcessR2(initial_R2)
@@ -437,33 +728,27 @@ class RDLTProcessorGUI:
                     processed_R2
                 )
 
-                cycle_R2 = Cycle(processed_R2)
-                C_R2 = cycle_R2.evaluate_cycle()
-                cycle_list_R2 = cycle_R2.get_cycle_list()
-                
-                # Cycle detection for processed R1
+                # Cycle detection for processed R1 (R2's cycles are not needed for the matrix)
                 cycle_R1 = Cycle(processed_R1)
-                C_R1 = cycle_R1.evaluate_cycle()
-                cycle_list_R1 = cycle_R1.get_cycle_list()
+                cycle_R1.evaluate_cycle()
                 
                 # Store cycles for later use
-                self.cycle_list = cycle_list_R1
+                self.cycle_list = cycle_R1.get_cycle_list()
                 self.current_R = processed_R1  # Store processed R1 for later use
                 
                 # Convert data from dict to matrix (R1 only)
                 self.matrix_instance = Matrix(processed_R1, self.cycle_list)
                 # Perform matrix evaluation to determine L-Safeness
                 l_safe, matrix = self.matrix_instance.evaluate()
-                print(f"\nMatrix Evaluation Result: {'RDLT is L-Safe.' if l_safe == True else 'RDLT is NOT L-Safe.'}\n")
-                print('=' * 60)
-                print("Generated Matrix:\n")
-                self.matrix_instance.print_matrix()
-                print('=' * 60)
+                print(f"\nMatrix Evaluation Result: {'RDLT is L-Safe.' if l_safe == True else 'RDLT is NOT L-Safe.'}\n", SECTION_RULE, sep="\n")
+                if not quiet:
+                    print("Generated Matrix:\n")
+                    self.matrix_instance.print_matrix()
+                    print(SECTION_RULE)
                 
             else:
                 # Not all joins are OR-joins, process both R1 and R2 together
-                print("\nR2 contains non-OR joins. Processing both R1 and R2 together.\n")
-                print('=' * 60)
+                print("\nR2 contains non-OR joins. Processing both R1 and R2 together.\n", SECTION_RULE, sep="\n")
                 
                 # Process R2 first
                 processed_R2 = ProcessR2(initial_R2)
@@ -483,7 +768,7 @@ class RDLTProcessorGUI:
 
                 # Create cycle instance and detect cycles
                 cycle_combined = Cycle(combined_R)
-                C_combined = cycle_combined.evaluate_cycle()
+                cycle_combined.evaluate_cycle()
 
                 # Update eRU values in combined_R based on cycle participation
                 combined_R = cycle_combined.update_eRU_values()
@@ -492,48 +777,54 @@ class RDLTProcessorGUI:
                 self.cycle_list = cycle_combined.get_cycle_list()
                 self.current_R = combined_R  # Store combined R for later use
 
-                def convert_arc_format(arc):
-                    return f"({arc.split(', ')[0]}, {arc.split(', ')[1]})"
-
-                def convert_arc_list_format(arc_list):
-                    return [convert_arc_format(arc) for arc in arc_list]
-
                 # Print the combined list for debugging
-                print("Processed R1 and R2:")
-                print('-' * 20)
-                arcs_list_combined = [r['arc'] for r in combined_R if isinstance(r, dict) and 'arc' in r]
-                vertices_list_combined = sorted(set([v for arc in arcs_list_combined for v in arc.split(', ')]))
-                c_attribute_list_combined = [r.get('c-attribute', '') for r in combined_R if isinstance(r, dict)]
-                l_attribute_list_combined = [r.get('l-attribute', '') for r in combined_R if isinstance(r, dict)]
-                eRU_list_combined = [str(r.get('eRU', '0')) for r in combined_R]
-
-                # Corrected print statements
-                print(f"Arcs List ({len(arcs_list_combined)}): {convert_arc_list_format(arcs_list_combined)}")
-                print(f"Vertices List ({len(vertices_list_combined)}): {vertices_list_combined}")
-                print(f"C-attribute List ({len(c_attribute_list_combined)}): {c_attribute_list_combined}")
-                print(f"L-attribute List ({len(l_attribute_list_combined)}): {l_attribute_list_combined}")
-                print(f"eRU List ({len(eRU_list_combined)}): {eRU_list_combined}")
-                print('=' * 60)
+                if not quiet:
+                    # Collect every list in one pass over combined_R, splitting each arc once
+                    arcs_list_combined, c_attribute_list_combined = [], []
+                    l_attribute_list_combined, eRU_list_combined = [], []
+                    vertex_set = set()
+                    for r in combined_R:
+                        if not isinstance(r, dict):
+                            continue
+                        if 'arc' in r:
+                            arc = r['arc']
+                            arcs_list_combined.append(arc)
+                            vertex_set.update(arc.split(', '))
+                        c_attribute_list_combined.append(r.get('c-attribute', ''))
+                        l_attribute_list_combined.append(r.get('l-attribute', ''))
+                        eRU_list_combined.append(str(r.get('eRU', '0')))
+                    vertices_list_combined = sorted(vertex_set)
+
+                    # Emit the whole debug block with a single print
+                    print("\n".join([
+                        "Processed R1 and R2:",
+                        SUBSECTION_RULE,
+                        f"Arcs List ({len(arcs_list_combined)}): [{', '.join(map(repr, map(format_arc, arcs_list_combined)))}]",
+                        f"Vertices List ({len(vertices_list_combined)}): {vertices_list_combined}",
+                        f"C-attribute List ({len(c_attribute_list_combined)}): {c_attribute_list_combined}",
+                        f"L-attribute List ({len(l_attribute_list_combined)}): {l_attribute_list_combined}",
+                        f"eRU List ({len(eRU_list_combined)}): {eRU_list_combined}",
+                        SECTION_RULE,
+                    ]))
                 
                 # Convert data from dict to matrix (combined processed R1 and R2)
                 self.matrix_instance = Matrix(combined_R, self.cycle_list, In_list, Out_list)
                 # Perform matrix evaluation to determine L-Safeness
                 l_safe, matrix = self.matrix_instance.evaluate()
-                print(f"\nMatrix Evaluation Result: {'RDLT is L-Safe.' if l_safe == True else 'RDLT is NOT L-Safe.'}\n")
-                print('=' * 60)
-                print("Generated Matrix:\n")
-                self.matrix_instance.print_matrix()
-                print('=' * 60)
+                print(f"\nMatrix Evaluation Result: {'RDLT is L-Safe.' if l_safe == True else 'RDLT is NOT L-Safe.'}\n", SECTION_RULE, sep="\n")
+                if not quiet:
+                    print("Generated Matrix:\n")
+                    self.matrix_instance.print_matrix()
+                    print(SECTION_RULE)
         else:
             # No centers found, process R1 directly
-            print("\nNo centers found. Processing R1 directly...\n")
-            print('=' * 60)
+            print("\nNo centers found. Processing R1 directly...\n", SECTION_RULE, sep="\n")
             
             R1 = initial_R1
             
             # Detect cycles in R1
             cycle_R1 = Cycle(R1)
-            C_R1 = cycle_R1.evaluate_cycle()
+            cycle_R1.evaluate_cycle()
             self.cycle_list = cycle_R1.get_cycle_list()
             self.current_R = R1  # Store R1 for later use
             
@@ -541,11 +832,11 @@ class RDLTProcessorGUI:
             self.matrix_instance = Matrix(R1, self.cycle_list)
             # Perform matrix evaluation to determine L-Safeness
             l_safe, matrix = self.matrix_instance.evaluate()
-            print(f"\nMatrix Evaluation Result: {'RDLT is L-Safe.' if l_safe == True else 'RDLT is NOT L-Safe.'}\n")
-            print('=' * 60)
-            print("Generated Matrix:\n")
-            self.matrix_instance.print_matrix()
-            print('=' * 60)
+            print(f"\nMatrix Evaluation Result: {'RDLT is L-Safe.' if l_safe == True else 'RDLT is NOT L-Safe.'}\n", SECTION_RULE, sep="\n")
+            if not quiet:
+                print("Generated Matrix:\n")
+                self.matrix_instance.print_matrix()
+                print(SECTION_RULE)
         
         # Print final verification result
         if l_safe == True:
@@ -553,7 +844,8 @@ class RDLTProcessorGUI:
             print("\n RDLT is L-safe and CLASSICAL SOUND.\n")
         else:
             violations = self.matrix_instance.get_violations()
-            print('=' * 60)
+            self.violations = (self.matrix_instance, violations)  # Store for export use
+            print(SECTION_RULE)
 
             # Initialize Contraction Path with current R (could be R1 or combined_R)
             contraction_path = ContractionPath(self.current_R, violations)
@@ -561,6 +853,9 @@ class RDLTProcessorGUI:
 
             # Call the contraction process and store the results
             path, failed = contraction_path.get_contraction_paths()
+            # Show the verdict and violations before the slower activity extraction;
+            # the worker's QueueWriter otherwise holds them until its next write
+            sys.stdout.flush()
 
             # Run Modified Activity Extraction with the stored cycle list
             modified_activity = ModifiedActivityExtraction(
@@ -26,6 +26,7 @@ Author: Andrei Luz B. Asoy
 Code Version 3.2 (as of 04-15-25)
 """
 
+import importlib.util
 import tkinter as tk
 from tkinter import ttk, messagebox
 
@@ -81,13 +82,11 @@ def check_dependencies():
         'input_rdlt', 'cycle', 'create_r2', 'create_r1', 
         'joins', 'matrix', 'mod_extract', 'contraction',
         'utils', 'rdlt_export', 'help_dialog', 'abstract',
-        'abstract',
     ]
     
+    # Only locate each module; it is executed when the GUI first needs it
     for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
+        if importlib.util.find_spec(module) is None:
             missing_modules.append(module)
     
     return missing_modules
@@ -103,10 +102,15 @@ def main():
     # Create splash screen
     splash_root = tk.Tk()
     splash = SplashScreen(splash_root)
-    splash_root.update()
     
-    # Check for dependencies
-    missing = check_dependencies()
+    # Check for dependencies (locating the modules) once the splash screen is drawn,
+    # then leave its event loop
+    missing = []
+    def load_modules():
+        missing.extend(check_dependencies())
+        splash_root.quit()
+    splash_root.after_idle(load_modules)
+    splash_root.mainloop()
     
     if missing:
         splash_root.destroy()
@@ -117,10 +121,6 @@ def main():
         root.destroy()
         return
     
-    # Simulate loading time (and actually import the modules)
-    import time
-    time.sleep(1.5)
-    
     # Destroy splash screen and launch main app
     splash_root.destroy()
     main_root = launch_main_app()
@@ -13,18 +13,78 @@ Key functionalities:
 - Arc and vertex extraction utilities
 """
 
-def find_all_paths(graph, start, end, path=None):
+import sys
+from collections import defaultdict
+from itertools import islice
+
+def iter_all_paths(graph, start, end, path=None, max_depth=None):
+    """
+    Yields the paths from the start vertex to the end vertex in an RDLT one at a time.
+
+    This generator explores all possible paths between the start and end vertices with an iterative depth-first
+    search, ensuring no cycles by checking if a vertex is revisited within the same path. The current path is
+    extended and shortened in place while backtracking, so only the paths handed out are copied, and a caller that
+    needs just the first few paths or a count can stop early without building the full list.
+
+    Parameters:
+        - graph (dict): A dictionary representing the graph where keys are vertices and values are lists of neighboring vertices.
+        - start (str): The starting vertex for the path search.
+        - end (str): The target vertex for the path search.
+        - path (list, optional): The vertices leading up to start, which the paths will not revisit. It is not modified. Defaults to None.
+        - max_depth (int, optional): The most vertices a path may have, counting those leading up to start. Longer paths
+          are not explored, which bounds the search on dense RDLTs. Defaults to None (no limit).
+
+    Yields:
+        list: A path from start to end, as a new list of vertices.
+    """
+    path = [start] if path is None else path + [start]
+    # Paths of up to max_depth vertices may be yielded, and only shorter ones extended
+    if max_depth is None:
+        max_depth = float('inf')
+    # If the start node is the same as the end node, we've found a path
+    if start == end:
+        if len(path) <= max_depth:
+            yield path
+        return
+    # If no paths are found, yield nothing
+    if start not in graph:
+        return
+    # Vertices on the current path and one iterator over the neighbors of each vertex explored
+    visited = set(path)
+    stack = [iter(graph[start])]
+    while stack:
+        neighbor = next(stack[-1], None)
+        if neighbor is None:
+            # All neighbors of the last vertex are explored, backtrack
+            stack.pop()
+            visited.discard(path.pop())
+            continue
+        # Ensure no cycles by checking if the neighbor is not already in the path
+        if neighbor in visited:
+            continue
+        if len(path) >= max_depth:
+            continue
+        if neighbor == end:
+            yield path + [end]
+        elif neighbor in graph and len(path) + 1 < max_depth:
+            path.append(neighbor)
+            visited.add(neighbor)
+            stack.append(iter(graph[neighbor]))
+
+def find_all_paths(graph, start, end, path=None, max_depth=None, max_paths=None):
     """
     Finds all paths from the start vertex to the end vertex in an RDLT.
 
-    This function recursively explores all possible paths between the start and end vertices, ensuring no cycles
-    by checking if a vertex is revisited within the same path.
+    The paths are collected from iter_all_paths, which explores them with an iterative depth-first search,
+    ensuring no cycles by checking if a vertex is revisited within the same path.
 
     Parameters:
         - graph (dict): A dictionary representing the graph where keys are vertices and values are lists of neighboring vertices.
         - start (str): The starting vertex for the path search.
         - end (str): The target vertex for the path search.
         - path (list, optional): A list that keeps track of the current path being explored. Defaults to None.
+        - max_depth (int, optional): The most vertices a path may have, as in iter_all_paths. Defaults to None (no limit).
+        - max_paths (int, optional): The most paths to return; the search stops once they are found. Defaults to None (no limit).
 
     Returns:
         list: A list of lists, where each inner list represents a path from start to end.
@@ -34,22 +94,10 @@ def find_all_paths(graph, start, end, path=None):
         path = []
     # Add the current node to the path
     path.append(start)
-    # If the start node is the same as the end node, we've found a path
+    # If the start node is the same as the end node, we've found a path, unless the bounds leave no room for it
     if start == end:
-        return [path]
-    # If no paths are found, return an empty list
-    if start not in graph:
-        return []
-    # List to store all paths
-    paths = []
-    # Recur for all the neighbors of the current node
-    for neighbor in graph[start]:
-        # Ensure no cycles by checking if the neighbor is not already in the path
-        if neighbor not in path:
-            # Find paths from the neighbor to the end
-            new_paths = find_all_paths(graph, neighbor, end, path.copy())  # use path.copy() to avoid modifying the same path
-            paths.extend(new_paths)  # Add all found paths to the paths list
-    return paths
+        return [path] if (max_depth is None or len(path) <= max_depth) and max_paths != 0 else []
+    return list(islice(iter_all_paths(graph, start, end, path[:-1], max_depth), max_paths))
 
 def format_path(path):
     """
@@ -63,15 +111,16 @@ def format_path(path):
     Returns:
         list: A list of formatted arcs as strings in the form "start, end".
     """
-    formatted_arcs = []
-    for i in range(len(path) - 1):
-        formatted_arcs.append(f"{path[i]}, {path[i + 1]}")
-    return formatted_arcs
+    # Pair each vertex with the one after it
+    return [f"{start}, {end}" for start, end in zip(path, islice(path, 1, None))]
 
 def list_to_graph(arc_list):
     """
     Converts a list of arcs into a graph represented as a dictionary of adjacency lists.
 
+    Vertex names are interned, so the keys and neighbor entries for a vertex are the same string object and the
+    lookups made while traversing the graph are resolved by identity.
+
     Parameters:
         - arc_list (list): A list of strings where each string represents an arc (e.g., "x, y").
 
@@ -80,7 +129,9 @@ def list_to_graph(arc_list):
     """
     graph = {}
     for arc in arc_list:
-        start, end = arc.split(', ')  # Split the arc into start and end vertices
+        start, _, end = arc.partition(', ')  # Split the arc into start and end vertices
+        start = sys.intern(start)
+        end = sys.intern(end)
         if start not in graph:
             graph[start] = []
         if end not in graph:
@@ -88,6 +139,23 @@ def list_to_graph(arc_list):
         graph[start].append(end)  # Add the directed edge to the graph
     return graph
 
+def parse_arcs(arc_list):
+    """
+    Converts a list of arcs into a graph and its sorted vertices, splitting each arc only once.
+
+    This gives the same results as calling list_to_graph and extract_vertices on the same list, since every
+    vertex of an arc is a key of the graph built by list_to_graph.
+
+    Parameters:
+        - arc_list (list): A list of strings where each string represents an arc (e.g., "x, y").
+
+    Returns:
+        tuple: A dictionary where keys are vertices and values are lists of neighboring vertices, and a sorted list
+               of the unique vertices.
+    """
+    graph = list_to_graph(arc_list)
+    return graph, sorted(graph)
+
 def extract_vertices(arc_list):
     """
     Extracts all unique vertices from a list of arcs.
@@ -101,8 +169,9 @@ def extract_vertices(arc_list):
     # Extract all unique 'x's from the list
     unique_xs = set()
     for arc in arc_list:
-        xs = arc.split(', ')
-        unique_xs.update(xs)
+        x, _, y = arc.partition(', ')
+        unique_xs.add(x)
+        unique_xs.add(y)
     unique_xs_list = sorted(unique_xs)
     return unique_xs_list
 
@@ -111,12 +180,13 @@ def dfs_with_cycle_detection(graph, start, visited=None, rec_stack=None):
     Performs Depth First Search (DFS) to detect cycles in a directed graph.
 
     The function tracks visited vertices and ensures that no cycles are encountered during the traversal.
+    It walks the graph with an explicit stack of neighbor iterators, so long chains do not hit the recursion limit.
 
     Parameters:
         - graph (dict): A dictionary representing the graph.
         - start (str): The starting vertex for the DFS.
         - visited (set, optional): A set of visited vertices. Defaults to None.
-        - rec_stack (set, optional): A set of vertices currently in the recursion stack. Defaults to None.
+        - rec_stack (set, optional): A set of vertices currently on the DFS path. Defaults to None.
 
     Returns:
         bool: True if a cycle is detected, False otherwise.
@@ -128,15 +198,22 @@ def dfs_with_cycle_detection(graph, start, visited=None, rec_stack=None):
 
     visited.add(start)
     rec_stack.add(start)
-
-    for neighbor in graph.get(start, []):
-        if neighbor not in visited:  # If the neighbor has not been visited
-            if dfs_with_cycle_detection(graph, neighbor, visited, rec_stack):
+    # One iterator over the neighbors of each vertex on the current DFS path
+    stack = [(start, iter(graph.get(start, [])))]
+
+    while stack:
+        vertex, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor not in visited:  # If the neighbor has not been visited, descend into it
+                visited.add(neighbor)
+                rec_stack.add(neighbor)
+                stack.append((neighbor, iter(graph.get(neighbor, []))))
+                break
+            elif neighbor in rec_stack:  # Cycle detected
                 return True
-        elif neighbor in rec_stack:  # Cycle detected
-            return True
-
-    rec_stack.remove(start)  # Remove the vertex from recursion stack
+        else:
+            stack.pop()
+            rec_stack.remove(vertex)  # Remove the vertex from the DFS path
     return False
 
 def find_paths(R, source, target, visited=None):
@@ -160,17 +237,32 @@ def find_paths(R, source, target, visited=None):
     if source == target:
         return [[source]]
     
-    paths = []
-    # Explore all arcs (outgoing edges)
+    # Split every arc once into an adjacency list of its outgoing edges, in the order of R
+    graph = defaultdict(list)
     for arc in R:
-        arc_source, arc_target = arc['arc'].split(', ')
-        if arc_source == source and arc_target not in visited:
-            # Recursively find paths from the arc target
-            for path in find_paths(R, arc_target, target, visited.copy()):
-                paths.append([source] + path)
+        arc_source, _, arc_target = arc['arc'].partition(', ')
+        graph[arc_source].append(arc_target)
+
+    paths = []
+    # Explore the arcs depth first, extending and shortening a single path while backtracking
+    path = [source]
+    visited = set(visited)
+    stack = [iter(graph[source])]
+    while stack:
+        arc_target = next(stack[-1], None)
+        if arc_target is None:
+            stack.pop()
+            visited.discard(path.pop())
+        elif arc_target not in visited:
+            if arc_target == target:
+                paths.append(path + [target])
+            else:
+                path.append(arc_target)
+                visited.add(arc_target)
+                stack.append(iter(graph[arc_target]))
     return paths
 
-def find_path_from_graph(graph, start, end, path=[]):
+def find_path_from_graph(graph, start, end, path=None):
     """
     Finds all paths from start to end in the given graph.
 
@@ -178,69 +270,99 @@ def find_path_from_graph(graph, start, end, path=[]):
         - graph (dict): A dictionary representing the graph, where keys are vertices and values are lists of adjacent vertices.
         - start (str): The starting vertex for the path search.
         - end (str): The target vertex for the path search.
-        - path (list, optional): The current path being explored. Defaults to [].
+        - path (list, optional): The vertices leading up to start, which the paths will not revisit. It is not modified. Defaults to None.
 
     Returns:
         list: A list of paths, each represented as a list of vertices from start to end.
     """
-    path = path + [start]
-    if start == end:
-        return [path]
-    if start not in graph:
-        return []
-    paths = []
-    for node in graph[start]:
-        if node not in path:
-            # Recursively call find_path_from_graph (not find_paths)
-            new_paths = find_path_from_graph(graph, node, end, path)
-            for new_path in new_paths:
-                paths.append(new_path)
-    return paths
+    # Same search as find_all_paths, but the caller's path list is never extended in place
+    return list(iter_all_paths(graph, start, end, path))
 
 def get_source_and_target_vertices(R):
     """
     Identifies the source and target vertices that result in the longest path or involve the most vertices.
 
+    When the RDLT has no cycles, the longest path from every vertex is computed in O(V + E) over a topological
+    order. Otherwise each source vertex is searched depth first. Both pick the same vertices: the first source
+    with the longest path, and the end of the first longest path found from it.
+
     Parameters:
         - R (list): List of dictionaries representing arcs in the RDLT.
 
     Returns:
         tuple: A tuple containing the source and target vertices of the longest path.
     """
-    from collections import defaultdict
-
-    # Build graph as adjacency list
+    # Build graph as adjacency list, collecting the arc sources and targets and counting
+    # the arcs entering each vertex from the same split
     graph = defaultdict(list)
+    all_x = set()
+    all_y = set()
+    in_degree = {}
     for r in R:
-        x, y = r['arc'].split(', ')
+        x, _, y = r['arc'].partition(', ')
         graph[x].append(y)
-
-    # Function to perform DFS and track longest path
-    def dfs(vertex, visited, path):
-        visited.add(vertex)
-        path.append(vertex)
-        longest_path = list(path)  # Copy current path as the longest
-        for neighbor in graph[vertex]:
-            if neighbor not in visited:
-                current_path = dfs(neighbor, visited, path)
-                if len(current_path) > len(longest_path):  # Compare path lengths
-                    longest_path = current_path
-        path.pop()  # Backtrack
-        visited.remove(vertex)
+        all_x.add(x)
+        all_y.add(y)
+        in_degree.setdefault(x, 0)
+        in_degree[y] = in_degree.get(y, 0) + 1
+
+    # Function to perform an iterative DFS and track the longest path, keeping the
+    # first one found when several have the same length
+    def dfs(vertex):
+        path = [vertex]
+        visited = {vertex}
+        longest_path = [vertex]
+        stack = [iter(graph[vertex])]
+        while stack:
+            neighbor = next(stack[-1], None)
+            if neighbor is None:
+                stack.pop()  # Backtrack
+                visited.remove(path.pop())
+            elif neighbor not in visited:
+                path.append(neighbor)
+                visited.add(neighbor)
+                if len(path) > len(longest_path):  # Compare path lengths
+                    longest_path = list(path)  # Copy current path as the longest
+                stack.append(iter(graph[neighbor]))
         return longest_path
 
     # Identify potential source and target vertices
-    all_x = {r['arc'].split(', ')[0] for r in R}
-    all_y = {r['arc'].split(', ')[1] for r in R}
     source_candidates = list(all_x - all_y)
     target_candidates = list(all_y - all_x)
 
+    # Order the vertices topologically with Kahn's algorithm; every vertex is ordered only if there are no cycles
+    topo_order = [v for v, degree in in_degree.items() if degree == 0]
+    for v in topo_order:
+        for neighbor in graph.get(v, ()):
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                topo_order.append(neighbor)
+
+    if len(topo_order) == len(in_degree):
+        # Number of vertices on the longest path starting at each vertex, filled from the sinks backwards
+        height = {}
+        for v in reversed(topo_order):
+            height[v] = 1 + max((height[neighbor] for neighbor in graph.get(v, ())), default=0)
+
+        source_vertex = None
+        for source in source_candidates:
+            if source_vertex is None or height[source] > height[source_vertex]:
+                source_vertex = source
+        if source_vertex is None:
+            return None, None
+
+        # Follow the first neighbor that continues a longest path, as the DFS below would find it first
+        target_vertex = source_vertex
+        while height[target_vertex] > 1:
+            target_vertex = next(neighbor for neighbor in graph[target_vertex]
+                                 if height[neighbor] == height[target_vertex] - 1)
+        return source_vertex, target_vertex
+
     # Evaluate longest path for each source vertex
     longest_path = []
     source_vertex = None
     for source in source_candidates:
-        visited = set()
-        path = dfs(source, visited, [])
+        path = dfs(source)
         if len(path) > len(longest_path):
             longest_path = path
             source_vertex = source
@@ -265,9 +387,9 @@ def get_r_id(arc, R):
         str or None: The r-id corresponding to the given arc, or None if not found.
     """
     # Search through R to find the r-id associated with the given arc
-    for arc in R:
-        if arc['arc'] == arc:
-            return arc['r-id']
+    for r in R:
+        if r['arc'] == arc:
+            return r['r-id']
     return None  # Return None if the arc is not found
 
 def get_arc_from_rid(rid, R1):
@@ -286,13 +408,36 @@ def get_arc_from_rid(rid, R1):
             return r['arc']
     return None
 
+def build_arc_indexes(R):
+    """
+    Indexes the arcs of an RDLT by arc and by r-id for repeated lookups.
+
+    Each key maps to the first entry of R that has it, the same entry a linear scan of R would find,
+    so a series of get_r_id / get_arc_from_rid calls over an unchanged R can be replaced with dict lookups.
+
+    Parameters:
+        - R (list): The list of arcs, where each arc is a dictionary containing 'arc' and 'r-id'.
+
+    Returns:
+        tuple: A dictionary mapping each arc (str) to its entry in R, and a dictionary mapping each r-id to its entry in R.
+    """
+    arc_index = {}
+    rid_index = {}
+    for r in R:
+        arc_index.setdefault(r['arc'], r)
+        rid_index.setdefault(r['r-id'], r)
+    return arc_index, rid_index
+
 def build_graph(R):
         """
         Builds a directed graph from the list of arcs.
+        Vertex names are interned, as in list_to_graph.
         """
         graph = {}
         for arc in R:
-            start, end = arc['arc'].split(', ')
+            start, _, end = arc['arc'].partition(', ')
+            start = sys.intern(start)
+            end = sys.intern(end)
             if start not in graph:
                 graph[start] = []
             graph[start].append(end)